@@ -0,0 +1,73 @@
+"""
+Benchmark: full DNS profile of a domain, one record type after another vs. dns_sweep.
+
+Runs against a stub DNS server on 127.0.0.1 that answers every query after a
+fixed delay, standing in for the round trip to a recursive resolver. Every
+iteration asks about a fresh name, so the answer cache never helps.
+
+    python benchmarks/bench_dns_sweep.py --delay-ms 40 --iterations 20
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import statistics
+import sys
+import time
+
+import dns.resolver
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from stub_dns import start_stub, stub_resolver  # noqa: E402
+from tools.DNSCache import DNSCache  # noqa: E402
+from tools.DNSLookUp import SWEEP_RECORD_TYPES, DNSLookUp  # noqa: E402
+
+
+def serial_profile(cache: DNSCache, domain: str) -> None:
+    for record_type in SWEEP_RECORD_TYPES:
+        try:
+            cache.resolve(domain, record_type)
+        except dns.resolver.NoAnswer:
+            pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--delay-ms", type=float, default=40.0, help="Stub server delay per query")
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args()
+
+    stub = start_stub(args.delay_ms / 1000)
+    cache = DNSCache(resolver=stub_resolver(stub.port))
+    tools = DNSLookUp(cache=cache)
+
+    timings = {"serial": [], "dns_sweep": []}
+    for i in range(args.iterations):
+        started = time.perf_counter()
+        serial_profile(cache, f"serial-{i}.example")
+        timings["serial"].append((time.perf_counter() - started) * 1000)
+
+        started = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = tools.dns_sweep(f"sweep-{i}.example")
+        timings["dns_sweep"].append((time.perf_counter() - started) * 1000)
+        failed = {t: r for t, r in result["records"].items() if r["status"] not in ("ok", "NoAnswer")}
+        if failed:
+            sys.exit(f"dns_sweep failed: {failed}")
+
+    print(f"{len(SWEEP_RECORD_TYPES)} record types, stub delay {args.delay_ms:.0f} ms, {args.iterations} iterations")
+    for name, values in timings.items():
+        print(f"  {name:<10} median {statistics.median(values):8.1f} ms   max {max(values):8.1f} ms")
+    print(f"  speedup    {statistics.median(timings['serial']) / statistics.median(timings['dns_sweep']):.1f}x")
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        sample = tools.dns_sweep("sample.example")
+    print("\nSample result:")
+    for record_type, record in sample["records"].items():
+        print(f"  {record_type:<6} {record}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Benchmark: typosquat permutations resolved per second.
+
+Resolves every permutation of a domain against a stub DNS server on 127.0.0.1
+that answers after a fixed delay and knows a handful of "registered" variants;
+everything else is NXDOMAIN. Each run uses a fresh cache. The first runs vary
+the concurrency with no QPS ceiling; the last checks that the ceiling holds.
+
+    python benchmarks/bench_typosquat.py --domain examplebank.com --delay-ms 20
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from stub_dns import start_stub, stub_resolver  # noqa: E402
+from tools.DNSCache import DNSCache  # noqa: E402
+from tools.Typosquat import ScanStats, TyposquatScanner, permutations  # noqa: E402
+
+
+async def scan(scanner: TyposquatScanner, domain: str, stats: ScanStats) -> tuple[list, float, float]:
+    """Registered variants found, seconds until the first one, total seconds."""
+    started = time.perf_counter()
+    first = None
+    found = []
+    async for result in scanner.stream(domain, stats=stats):
+        first = first or time.perf_counter() - started
+        found.append(result["domain"])
+    return found, first or 0.0, time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--domain", default="examplebank.com")
+    parser.add_argument("--delay-ms", type=float, default=20.0, help="Stub server delay per query")
+    parser.add_argument("--registered", type=int, default=25, help="Number of variants the stub knows")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 10, 50, 100, 200])
+    parser.add_argument("--qps", type=float, default=500.0, help="Ceiling for the rate-limited run")
+    args = parser.parse_args()
+
+    variants = list(permutations(args.domain))
+    registered = set(random.Random(0).sample(variants, min(args.registered, len(variants))))
+    stub = start_stub(args.delay_ms / 1000, registered)
+    print(f"{len(variants)} permutations of {args.domain}, {len(registered)} registered, "
+          f"stub delay {args.delay_ms:.0f} ms\n")
+    print(f"{'concurrency':>11} {'qps ceiling':>11} {'perm/sec':>9} {'queries/sec':>11} {'first hit':>10} {'total':>8}")
+
+    runs = [(c, 0.0) for c in args.concurrency] + [(max(args.concurrency), args.qps)]
+    for concurrency, qps in runs:
+        cache = DNSCache(resolver=stub_resolver(stub.port))
+        scanner = TyposquatScanner(cache=cache, qps=qps, concurrency=concurrency)
+        stats = ScanStats()
+        queries = stub.queries
+        found, first, total = asyncio.run(scan(scanner, args.domain, stats))
+        if set(found) != registered or stats.errors:
+            sys.exit(f"Expected {len(registered)} registered variants, found {len(found)} ({stats.errors} errors)")
+        print(f"{concurrency:>11} {qps or '-':>11} {stats.checked / total:>9.0f} "
+              f"{(stub.queries - queries) / total:>11.0f} {first * 1000:>8.0f}ms {total:>7.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Stub DNS server for the benchmarks: answers every query from 127.0.0.1 after a
+fixed delay, standing in for the round trip to a recursive resolver.
+"""
+
+import asyncio
+import threading
+
+import dns.flags
+import dns.message
+import dns.name
+import dns.rcode
+import dns.rdatatype
+import dns.resolver
+import dns.rrset
+
+ANSWERS = {
+    "A": "192.0.2.1",
+    "MX": "10 mail.example.",
+    "NS": "ns1.example.",
+    "TXT": '"v=spf1 -all"',
+    "SOA": "ns1.example. hostmaster.example. 1 7200 900 1209600 300",
+    "CAA": '0 issue "letsencrypt.org"',
+}
+
+
+class StubProtocol(asyncio.DatagramProtocol):
+    def __init__(self, delay: float, registered=None):
+        self.delay = delay
+        self.registered = registered
+        self.queries = 0
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def datagram_received(self, data, addr):
+        self.queries += 1
+        # Answer later without blocking the loop, so concurrent queries overlap like on a real resolver
+        asyncio.get_running_loop().call_later(self.delay, self.reply, data, addr)
+
+    def reply(self, data, addr):
+        query = dns.message.from_wire(data)
+        question = query.question[0]
+        response = dns.message.make_response(query)
+        response.flags |= dns.flags.RA
+        rdtype = dns.rdatatype.to_text(question.rdtype)
+        name = question.name.to_text(omit_final_dot=True).lower()
+        if self.registered is not None and name not in self.registered:
+            response.set_rcode(dns.rcode.NXDOMAIN)
+        elif rdtype in ANSWERS:
+            response.answer.append(dns.rrset.from_text(question.name, 300, "IN", rdtype, ANSWERS[rdtype]))
+        if not response.answer:
+            # NXDOMAIN or NoAnswer, with an SOA for the negative TTL
+            response.authority.append(dns.rrset.from_text("example.", 300, "IN", "SOA", ANSWERS["SOA"]))
+        self.transport.sendto(response.to_wire(), addr)
+
+
+def start_stub(delay: float, registered=None) -> StubProtocol:
+    """
+    Start the stub server in a daemon thread.
+
+    Args:
+        delay (float): Seconds before each answer.
+        registered (set[str]): Names that exist; every other name gets NXDOMAIN. All names exist if None.
+
+    Returns:
+        StubProtocol: The server; its UDP port is `stub.port`, its query count `stub.queries`.
+    """
+    ready = threading.Event()
+    protocol = StubProtocol(delay, registered)
+
+    def serve():
+        loop = asyncio.new_event_loop()
+        transport, _ = loop.run_until_complete(
+            loop.create_datagram_endpoint(lambda: protocol, local_addr=("127.0.0.1", 0))
+        )
+        protocol.port = transport.get_extra_info("sockname")[1]
+        ready.set()
+        loop.run_forever()
+
+    threading.Thread(target=serve, daemon=True).start()
+    ready.wait()
+    return protocol
+
+
+def stub_resolver(port: int) -> dns.resolver.Resolver:
+    resolver = dns.resolver.Resolver(configure=False)
+    resolver.nameservers = ["127.0.0.1"]
+    resolver.port = port
+    return resolver
@@ -1,26 +1,43 @@
-from dnstwist import dnstwist
+import argparse
+import asyncio
+import time
 
+from tools.Typosquat import ScanStats, TyposquatScanner
+from tools.DNSLookUp import run_sync
 
-def find_typosquatted_domains(domain: str):
+
+def find_typosquatted_domains(domain: str, qps: float = 200.0):
     """
-    Generate and check for typosquatted domains using dnstwist.
+    Generate typosquatting variants of a domain and check which are registered.
 
     Args:
         domain (str): The base domain to generate variants for.
+        qps (float): Ceiling on DNS queries per second.
 
     Returns:
         list: A list of detected domains that are registered.
     """
-    scanner = dnstwist.DNSTwist(domain)
-    results = scanner.run()
-    active_domains = []
-
-    for result in results:
-        if result.get("dns-a") or result.get("dns-ns"):
-            active_domains.append(result["domain"])
-
-    return active_domains
-
-
-# Example
-print(find_typosquatted_domains("google.com"))
+    found, _ = run_sync(TyposquatScanner(qps=qps).scan(domain))
+    return [result["domain"] for result in found]
+
+
+async def stream_typosquats(domain: str, qps: float, concurrency: int) -> None:
+    scanner = TyposquatScanner(qps=qps, concurrency=concurrency)
+    stats = ScanStats()
+    started = time.perf_counter()
+    found = 0
+    async for result in scanner.stream(domain, stats=stats):
+        found += 1
+        print(f"{result['fuzzer']:<14} {result['domain']:<40} {','.join(result['a']) or '-'}", flush=True)
+    elapsed = time.perf_counter() - started
+    print(f"{found} registered of {stats.checked} permutations in {elapsed:.1f}s "
+          f"({stats.checked / elapsed:.0f} permutations/sec, {stats.errors} errors)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Print registered typosquatting variants of a domain as they are found.")
+    parser.add_argument("domain")
+    parser.add_argument("--qps", type=float, default=200.0, help="Ceiling on DNS queries per second")
+    parser.add_argument("--concurrency", type=int, default=100)
+    args = parser.parse_args()
+    asyncio.run(stream_typosquats(args.domain, args.qps, args.concurrency))
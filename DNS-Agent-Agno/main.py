@@ -65,7 +65,7 @@ cyber_security_agent = Agent(
            - Detect potential typosquatting attempts
 
         2. DNS Security Analysis 🔍
-           - Perform comprehensive DNS lookup
+           - Perform comprehensive DNS lookup (dns_sweep fetches every record type with its TTL in one call)
            - Analyze DNS record types (A, AAAA, MX, TXT, CNAME, NS)
            - Check for DNS anomalies or suspicious configurations
            - Identify hosting infrastructure and geolocation
@@ -88,7 +88,7 @@ cyber_security_agent = Agent(
            - Check for certificate transparency logs
 
         5. Domain Similarity Analysis 🔗
-           - Identify similar domains (typosquatting)
+           - Identify similar domains (typosquatting) with find_typosquats
            - Check for homograph attacks
            - Analyze domain clustering patterns
            - Detect brand impersonation attempts
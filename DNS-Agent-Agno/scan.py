@@ -0,0 +1,412 @@
+"""
+Bulk domain scanner for CyberGuard.
+
+Reads domains (one per line) from a file or stdin and runs the deterministic
+collection stage on them: a DNS sweep, a batched Google Safe Browsing lookup and
+optionally WHOIS. Collection runs on a bounded asyncio pipeline, with a rate limit
+per DNS resolver and per external API. Every result is scored with simple risk
+heuristics and written as JSONL, or as Parquet when pyarrow is installed. Only
+domains scoring at or above --threshold go on to the LLM report stage.
+
+    python scan.py domains.txt -o results.jsonl --threshold 5 --report-dir reports
+    cat feed.txt | python scan.py - -o results.parquet --no-llm
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import sys
+import threading
+import time
+import zlib
+from collections import Counter
+from datetime import datetime, timezone
+
+import dns.resolver
+from dotenv import load_dotenv
+
+from tools.DNSCache import DNSCache
+from tools.DNSLookUp import DNSLookUp
+from tools.RateLimiter import RateLimiter
+from tools.Reputation import SAFE_BROWSING_BATCH, Reputation
+from tools.WhoisCache import WhoisCache
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None
+
+load_dotenv()
+
+DEFAULT_RECORD_TYPES = ("A", "AAAA", "CNAME", "MX", "NS", "TXT")
+# TLDs that show up far more often in abuse feeds than in legitimate traffic
+ABUSED_TLDS = {"zip", "mov", "xyz", "top", "tk", "ml", "ga", "cf", "gq", "icu", "cyou", "rest", "click", "country"}
+PARQUET_ROW_GROUP = 10000
+DONE = None
+
+
+class Resolver:
+    """One DNS resolver with its own cache and rate limit."""
+
+    def __init__(self, address: str | None, rate: float):
+        if address is None:
+            self.name = "system"
+            self.lookup = DNSLookUp()
+        else:
+            host, _, port = address.rpartition(":") if address.count(":") == 1 else (address, "", "")
+            resolver = dns.resolver.Resolver(configure=False)
+            resolver.nameservers = [host]
+            resolver.port = int(port or 53)
+            self.name = address
+            self.lookup = DNSLookUp(cache=DNSCache(resolver=resolver))
+        self.limiter = RateLimiter(rate)
+
+
+def normalize(line: str) -> str | None:
+    """The bare hostname of a feed line (URL, host:port or domain); None for blanks and comments."""
+    domain = line.strip().lower()
+    if not domain or domain.startswith("#"):
+        return None
+    domain = domain.split("://", 1)[-1].split("/", 1)[0].split("@")[-1].split(":", 1)[0].rstrip(".")
+    return domain if "." in domain else None
+
+
+def label_entropy(label: str) -> float:
+    counts = Counter(label)
+    return -sum(n / len(label) * math.log2(n / len(label)) for n in counts.values())
+
+
+def risk_score(result: dict) -> tuple[int, list[str]]:
+    """
+    Heuristic risk score (0-10) of a collected result, with the reasons behind it.
+
+    This only decides which domains are worth an LLM report; the report does the real assessment.
+    """
+    records = result["dns"]
+    if any(r["status"] == "NXDOMAIN" for r in records.values()):
+        return 0, ["domain does not resolve (NXDOMAIN)"]
+
+    score, reasons = 0, []
+    if result.get("safe_browsing"):
+        score += 7
+        reasons.append(f"listed by Google Safe Browsing: {', '.join(result['safe_browsing'])}")
+
+    a = records.get("A", {})
+    if a.get("status") == "ok":
+        if len(a["records"]) >= 3 and a["ttl"] < 300:
+            score += 2
+            reasons.append(f"fast-flux pattern: {len(a['records'])} A records with a {a['ttl']}s TTL")
+        elif a["ttl"] < 60:
+            score += 1
+            reasons.append(f"very short A record TTL ({a['ttl']}s)")
+
+    mx, txt = records.get("MX", {}), records.get("TXT", {})
+    if mx.get("status") == "ok" and not any("v=spf1" in r for r in txt.get("records", [])):
+        score += 1
+        reasons.append("receives mail but publishes no SPF record")
+
+    labels = result["domain"].split(".")
+    if labels[-1] in ABUSED_TLDS:
+        score += 1
+        reasons.append(f"frequently abused TLD .{labels[-1]}")
+    name = labels[-2] if len(labels) > 1 else labels[0]
+    if len(name) >= 12 and label_entropy(name) > 3.5:
+        score += 2
+        reasons.append(f"random-looking name (entropy {label_entropy(name):.1f})")
+    if name.count("-") >= 3 or sum(c.isdigit() for c in name) >= 4:
+        score += 1
+        reasons.append("many hyphens or digits in the name")
+
+    age = result.get("domain_age_days")
+    if age is not None and age < 30:
+        score += 3
+        reasons.append(f"registered {age} days ago")
+    elif age is not None and age < 180:
+        score += 1
+        reasons.append(f"registered {age} days ago")
+    return min(score, 10), reasons
+
+
+def domain_age_days(domain: str) -> int | None:
+    return WhoisCache.shared().lookup(domain).get("age_days")
+
+
+class ResultWriter:
+    """JSONL to a file or stdout, or Parquet (row groups of PARQUET_ROW_GROUP) for *.parquet paths."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.parquet = path.endswith(".parquet")
+        self._rows = []
+        self._writer = None
+        if self.parquet:
+            if pq is None:
+                raise RuntimeError("Parquet output needs pyarrow (pip install pyarrow)")
+            self._file = None
+        else:
+            self._file = sys.stdout if path == "-" else open(path, "w")
+
+    def write(self, result: dict) -> None:
+        if not self.parquet:
+            self._file.write(json.dumps(result, ensure_ascii=False) + "\n")
+            return
+        # Nested, per-domain varying structures are stored as JSON text
+        self._rows.append({**result, "dns": json.dumps(result["dns"])})
+        if len(self._rows) >= PARQUET_ROW_GROUP:
+            self._flush()
+
+    def _flush(self) -> None:
+        if not self._rows:
+            return
+        table = pa.Table.from_pylist(self._rows, schema=self._schema())
+        if self._writer is None:
+            self._writer = pq.ParquetWriter(self.path, table.schema)
+        self._writer.write_table(table)
+        self._rows = []
+
+    @staticmethod
+    def _schema():
+        return pa.schema([
+            ("domain", pa.string()),
+            ("scanned_at", pa.string()),
+            ("elapsed_ms", pa.float64()),
+            ("resolver", pa.string()),
+            ("dns", pa.string()),
+            ("safe_browsing", pa.list_(pa.string())),
+            ("domain_age_days", pa.int64()),
+            ("risk_score", pa.int64()),
+            ("risk_reasons", pa.list_(pa.string())),
+            ("errors", pa.list_(pa.string())),
+        ])
+
+    def close(self) -> None:
+        if self.parquet:
+            self._flush()
+            if self._writer is not None:
+                self._writer.close()
+        elif self._file is not sys.stdout:
+            self._file.close()
+        else:
+            self._file.flush()
+
+
+class BulkScanner:
+    """
+    Reader -> DNS/WHOIS workers -> Safe Browsing batcher -> writer, joined by bounded queues.
+
+    The queues keep memory flat however long the feed is: a slow stage makes the ones
+    before it wait instead of piling up results.
+    """
+
+    def __init__(self, args: argparse.Namespace):
+        self.args = args
+        self.resolvers = [Resolver(address, args.dns_rate) for address in args.resolver or [None]]
+        self.record_types = tuple(t.strip().upper() for t in args.record_types.split(",") if t.strip())
+        self.api_key = None if args.no_reputation else os.getenv("GOOGLE_API_KEY")
+        self.reputation = Reputation()
+        self.reputation_limiter = RateLimiter(args.reputation_rate)
+        self.whois_limiter = RateLimiter(args.whois_rate)
+        self.flagged = []
+        self.scanned = 0
+        self.duplicates = 0
+        self.started = 0.0
+
+    def read_domains(self, source, loop: asyncio.AbstractEventLoop, queue: asyncio.Queue) -> None:
+        """Runs in a thread, so a slow stdin never blocks the event loop."""
+        seen = set()
+        try:
+            for line in source:
+                domain = normalize(line)
+                if domain is None:
+                    continue
+                if domain in seen:
+                    self.duplicates += 1
+                    continue
+                seen.add(domain)
+                asyncio.run_coroutine_threadsafe(queue.put(domain), loop).result()
+        finally:
+            for _ in range(self.args.concurrency):
+                asyncio.run_coroutine_threadsafe(queue.put(DONE), loop).result()
+
+    async def collect(self, domain: str) -> dict:
+        # The same domain always goes to the same resolver, and so to the same cache
+        resolver = self.resolvers[zlib.crc32(domain.encode()) % len(self.resolvers)]
+        started = time.perf_counter()
+        result = {"domain": domain, "scanned_at": datetime.now(timezone.utc).isoformat(), "resolver": resolver.name}
+        errors = []
+        await resolver.limiter.acquire(len(self.record_types))
+        result["dns"] = await resolver.lookup.sweep(domain, self.record_types, self.args.timeout)
+        result["domain_age_days"] = None
+        resolves = not any(r["status"] == "NXDOMAIN" for r in result["dns"].values())
+        if self.args.whois and resolves:
+            await self.whois_limiter.acquire()
+            try:
+                result["domain_age_days"] = await asyncio.to_thread(domain_age_days, domain)
+            except Exception as e:
+                errors.append(f"whois: {e}")
+        result["errors"] = errors
+        result["elapsed_ms"] = round((time.perf_counter() - started) * 1000, 1)
+        return result
+
+    async def worker(self, domains: asyncio.Queue, collected: asyncio.Queue) -> None:
+        while (domain := await domains.get()) is not DONE:
+            try:
+                result = await self.collect(domain)
+            except Exception as e:
+                result = {"domain": domain, "dns": {}, "domain_age_days": None, "errors": [f"collect: {e}"]}
+            await collected.put(result)
+
+    async def batcher(self, collected: asyncio.Queue, scored: asyncio.Queue) -> None:
+        """Groups results for one Safe Browsing request per SAFE_BROWSING_BATCH domains."""
+        finished = False
+        while not finished:
+            batch = []
+            deadline = time.monotonic() + self.args.batch_wait
+            while len(batch) < SAFE_BROWSING_BATCH:
+                try:
+                    item = await asyncio.wait_for(collected.get(), max(deadline - time.monotonic(), 0.001))
+                except asyncio.TimeoutError:
+                    break
+                if item is DONE:
+                    finished = True
+                    break
+                batch.append(item)
+            if not batch:
+                continue
+            await self.check_reputation(batch)
+            for result in batch:
+                result["risk_score"], result["risk_reasons"] = risk_score(result)
+                await scored.put(result)
+        await scored.put(DONE)
+
+    async def check_reputation(self, batch: list) -> None:
+        for result in batch:
+            result["safe_browsing"] = None
+        if not self.api_key:
+            return
+        await self.reputation_limiter.acquire()
+        domains = [result["domain"] for result in batch]
+        try:
+            matches = await asyncio.to_thread(self.reputation.safe_browsing_matches, domains, self.api_key)
+        except Exception as e:
+            for result in batch:
+                result["errors"].append(f"safe_browsing: {e}")
+            return
+        for result in batch:
+            result["safe_browsing"] = matches.get(result["domain"], [])
+
+    async def write(self, scored: asyncio.Queue, writer: ResultWriter) -> None:
+        while (result := await scored.get()) is not DONE:
+            writer.write(result)
+            self.scanned += 1
+            if result["risk_score"] >= self.args.threshold:
+                self.flagged.append(result)
+            if self.args.progress_every and self.scanned % self.args.progress_every == 0:
+                self.report_progress()
+
+    def report_progress(self) -> None:
+        elapsed = time.perf_counter() - self.started
+        print(
+            f"[scan] {self.scanned} domains in {elapsed:.1f}s ({self.scanned / elapsed:.1f} domains/sec), "
+            f"{len(self.flagged)} at or above risk {self.args.threshold}",
+            file=sys.stderr,
+        )
+
+    async def run(self, source, writer: ResultWriter) -> float:
+        """Collects every domain from `source`; returns the elapsed seconds."""
+        size = self.args.concurrency * 2
+        domains, collected, scored = asyncio.Queue(size), asyncio.Queue(size), asyncio.Queue(size)
+        self.started = time.perf_counter()
+        loop = asyncio.get_running_loop()
+        reader = threading.Thread(target=self.read_domains, args=(source, loop, domains), daemon=True)
+        reader.start()
+        batcher = asyncio.create_task(self.batcher(collected, scored))
+        writer_task = asyncio.create_task(self.write(scored, writer))
+        await asyncio.gather(*(self.worker(domains, collected) for _ in range(self.args.concurrency)))
+        await collected.put(DONE)
+        await asyncio.gather(batcher, writer_task)
+        return time.perf_counter() - self.started
+
+
+def write_reports(flagged: list, report_dir: str, max_reports: int) -> None:
+    """Sends the highest scoring domains to the CyberGuard agent, one report each."""
+    # Imported here so collection-only runs need no model credentials
+    from main import cyber_security_agent
+
+    os.makedirs(report_dir, exist_ok=True)
+    flagged = sorted(flagged, key=lambda r: r["risk_score"], reverse=True)[:max_reports]
+    for result in flagged:
+        print(f"[report] {result['domain']} (risk {result['risk_score']})", file=sys.stderr)
+        prompt = (
+            f"Perform a comprehensive security analysis of {result['domain']}. The bulk scanner flagged it with "
+            f"a heuristic risk score of {result['risk_score']}/10 and already collected the evidence below; "
+            f"use it instead of fetching it again.\n\n```json\n{json.dumps(result, indent=2)}\n```"
+        )
+        try:
+            response = cyber_security_agent.run(prompt)
+        except Exception as e:
+            print(f"[report] {result['domain']} failed: {e}", file=sys.stderr)
+            continue
+        with open(os.path.join(report_dir, f"{result['domain']}.md"), "w") as f:
+            f.write(str(response.content))
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("input", help="File with one domain or URL per line, or - for stdin")
+    parser.add_argument("-o", "--output", default="-", help="JSONL file, *.parquet (needs pyarrow), or - for stdout")
+    parser.add_argument("--concurrency", type=int, default=100, help="Domains collected at the same time")
+    parser.add_argument("--resolver", action="append", metavar="IP[:PORT]",
+                        help="DNS resolver to use; repeat to spread domains over several (default: system resolver)")
+    parser.add_argument("--dns-rate", type=float, default=500.0, help="DNS queries per second, per resolver")
+    parser.add_argument("--record-types", default=",".join(DEFAULT_RECORD_TYPES))
+    parser.add_argument("--timeout", type=float, default=3.0, help="Seconds to wait for each DNS query")
+    parser.add_argument("--no-reputation", action="store_true", help="Skip Google Safe Browsing (GOOGLE_API_KEY)")
+    parser.add_argument("--reputation-rate", type=float, default=5.0, help="Safe Browsing requests per second")
+    parser.add_argument("--batch-wait", type=float, default=1.0,
+                        help="Seconds to wait for a full Safe Browsing batch before sending a partial one")
+    parser.add_argument("--whois", action="store_true", help="Look up domain age with WHOIS (slow)")
+    parser.add_argument("--whois-rate", type=float, default=2.0, help="WHOIS lookups per second")
+    parser.add_argument("--threshold", type=int, default=5, help="Risk score (0-10) at which a domain gets an LLM report")
+    parser.add_argument("--no-llm", action="store_true", help="Only collect and score, write no reports")
+    parser.add_argument("--report-dir", default="reports")
+    parser.add_argument("--max-reports", type=int, default=20, help="Reports for at most this many top-scoring domains")
+    parser.add_argument("--progress-every", type=int, default=1000, help="Log throughput every N domains (0 to disable)")
+    args = parser.parse_args(argv)
+    if args.output.endswith(".parquet") and pq is None:
+        parser.error("Parquet output needs pyarrow (pip install pyarrow)")
+    return args
+
+
+def main(argv=None) -> None:
+    args = parse_args(argv)
+    scanner = BulkScanner(args)
+    if scanner.api_key is None and not args.no_reputation:
+        print("[scan] GOOGLE_API_KEY is not set, skipping Google Safe Browsing", file=sys.stderr)
+    writer = ResultWriter(args.output)
+    source = sys.stdin if args.input == "-" else open(args.input)
+    try:
+        elapsed = asyncio.run(scanner.run(source, writer))
+    finally:
+        writer.close()
+        if source is not sys.stdin:
+            source.close()
+
+    rate = scanner.scanned / elapsed if elapsed else 0.0
+    print(
+        f"[scan] Done: {scanner.scanned} domains in {elapsed:.1f}s ({rate:.1f} domains/sec), "
+        f"{scanner.duplicates} duplicates skipped, {len(scanner.flagged)} at or above risk {args.threshold}",
+        file=sys.stderr,
+    )
+    for resolver in scanner.resolvers:
+        print(f"[scan] DNS cache ({resolver.name}): {resolver.lookup.cache.stats()}", file=sys.stderr)
+
+    if scanner.flagged and not args.no_llm:
+        write_reports(scanner.flagged, args.report_dir, args.max_reports)
+
+
+if __name__ == "__main__":
+    main()
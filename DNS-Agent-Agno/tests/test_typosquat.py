@@ -0,0 +1,91 @@
+import asyncio
+
+import pytest
+
+from stub_dns import start_stub, stub_resolver
+from tools.DNSCache import DNSCache
+from tools.DNSLookUp import DNSLookUp
+from tools.Typosquat import ScanStats, TyposquatScanner, permutations
+
+
+def test_permutations_keep_a_multi_label_suffix():
+    variants = permutations("www.example.co.uk")
+    assert "www.exmaple.co.uk" in variants
+    assert "www.example.com" in variants
+    for variant, fuzzer in variants.items():
+        assert variant.startswith("www.")
+        if fuzzer != "tld-swap":
+            assert variant.endswith(".co.uk")
+    # The "co" of the suffix is never permuted as if it were the name
+    assert "www.example.c0.uk" not in variants
+    assert "www.example.uk" not in variants
+
+
+def test_permutations_of_a_plain_domain():
+    variants = permutations("example.com", ["omission", "tld-swap"])
+    assert variants["exmple.com"] == "omission"
+    assert variants["example.net"] == "tld-swap"
+    assert "example.com" not in variants
+    # A suffix the Public Suffix List does not know still uses its last label as the TLD
+    assert "exmple.internal" in permutations("example.internal", ["omission"])
+
+
+def test_permutations_reject_bad_input():
+    with pytest.raises(ValueError):
+        permutations("localhost")
+    with pytest.raises(ValueError):
+        permutations("example.com", ["no-such-fuzzer"])
+
+
+@pytest.fixture(scope="module")
+def stub():
+    registered = {"exmple.com", "examp1e.com", "example.net", "bnak.org"}
+    return start_stub(0.002, registered)
+
+
+def _scanner(stub, **kwargs):
+    return TyposquatScanner(cache=DNSCache(resolver=stub_resolver(stub.port)), qps=0, concurrency=20, **kwargs)
+
+
+def test_scan_finds_registered_variants(stub):
+    found, stats = asyncio.run(_scanner(stub).scan("example.com"))
+    assert {result["domain"] for result in found} == {"exmple.com", "examp1e.com", "example.net"}
+    assert all(result["a"] == ["192.0.2.1"] and result["mx"] == ["10 mail.example."] for result in found)
+    assert stats.permutations == stats.checked == len(permutations("example.com"))
+    assert stats.errors == 0
+
+
+def test_concurrent_scans_on_one_scanner_keep_their_own_counts(stub):
+    scanner = _scanner(stub, check_mx=False)
+
+    async def both():
+        return await asyncio.gather(scanner.scan("example.com"), scanner.scan("bank.org"))
+
+    (found_a, stats_a), (found_b, stats_b) = asyncio.run(both())
+    assert stats_a.checked == len(permutations("example.com"))
+    assert stats_b.checked == len(permutations("bank.org"))
+    assert [result["domain"] for result in found_b] == ["bnak.org"]
+    assert len(found_a) == 3
+
+
+def test_stream_fills_the_stats_it_is_given(stub):
+    scanner = _scanner(stub)
+    stats = ScanStats()
+
+    async def first_hit():
+        async for result in scanner.stream("example.com", ["omission"], stats=stats):
+            return result
+
+    assert asyncio.run(first_hit())["domain"] == "exmple.com"
+    assert stats.permutations == len(permutations("example.com", ["omission"]))
+
+
+def test_find_typosquats_reports_counts_without_printing_each_variant(stub, capsys):
+    tools = DNSLookUp(cache=DNSCache(resolver=stub_resolver(stub.port)), typosquat_qps=0)
+    result = tools.find_typosquats("example.com", max_results=2)
+    assert result["registered_total"] == 3
+    assert len(result["registered"]) == 2
+    assert result["permutations_checked"] == len(permutations("example.com"))
+    assert result["errors"] == 0
+    assert len(capsys.readouterr().out.splitlines()) == 1
+    assert tools.find_typosquats("localhost") == {"error": "Not a domain name: 'localhost'"}
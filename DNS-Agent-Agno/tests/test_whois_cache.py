@@ -0,0 +1,33 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import whois
+
+from tools.WhoisCache import WhoisCache
+
+
+def test_concurrent_lookups_of_one_domain_query_whois_once(monkeypatch):
+    calls = []
+
+    def slow_whois(domain, quiet=False, timeout=None):
+        calls.append(domain)
+        time.sleep(0.2)
+        return {"domain_name": domain, "creation_date": "2001-02-03", "registrar": "Example Registrar"}
+
+    monkeypatch.setattr(whois, "whois", slow_whois)
+    cache = WhoisCache()
+    domains = ["example.com", "www.example.com", "mail.example.com", "EXAMPLE.com."] * 4
+    start = threading.Barrier(len(domains))
+
+    def lookup(domain):
+        start.wait()
+        return cache.lookup(domain)
+
+    with ThreadPoolExecutor(max_workers=len(domains)) as pool:
+        records = list(pool.map(lookup, domains))
+
+    assert calls == ["example.com"]
+    assert all(record == records[0] for record in records)
+    assert records[0]["registrar"] == "Example Registrar"
+    assert cache._inflight == {}
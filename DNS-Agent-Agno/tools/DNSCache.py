@@ -0,0 +1,272 @@
+import atexit
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+
+import dns.asyncresolver
+import dns.name
+import dns.rdata
+import dns.rdataclass
+import dns.rdatatype
+import dns.resolver
+
+
+@dataclass
+class CacheEntry:
+    expires: float  # wall-clock time, so entries survive a restart
+    records: tuple  # rdata objects; empty for negative entries
+    error: Optional[str] = None  # "NXDOMAIN" or "NoAnswer" for negative entries
+
+
+class DNSCache:
+    """
+    In-process cache of DNS answers, keyed on (name, record type).
+
+    Answers are kept for their TTL. NXDOMAIN and NoAnswer are cached too, for the
+    negative TTL from the zone's SOA record (RFC 2308), and are raised again on a
+    hit, so callers handle cached and live answers the same way. Timeouts and
+    server failures are never cached.
+
+    The cache is bounded (least recently used entries go first) and can be saved
+    to a JSON file and loaded again on the next start.
+    """
+
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    def __init__(
+        self,
+        max_entries: int = 10000,
+        path: Optional[str] = None,
+        negative_ttl: int = 300,
+        max_ttl: int = 86400,
+        resolver: Optional[dns.resolver.Resolver] = None,
+        async_resolver: Optional[dns.asyncresolver.Resolver] = None,
+    ):
+        """
+        Args:
+            max_entries (int): Maximum number of cached answers.
+            path (str): Optional JSON file to load the cache from and save it to at exit.
+            negative_ttl (int): Seconds to cache a negative answer that carries no SOA record.
+            max_ttl (int): Upper bound on how long any answer is kept, in seconds.
+            resolver (dns.resolver.Resolver): Resolver to query; the system default if not given.
+            async_resolver (dns.asyncresolver.Resolver): Resolver for aresolve(); by default one
+                using the same servers as `resolver`.
+        """
+        self.max_entries = max_entries
+        self.path = path
+        self.negative_ttl = negative_ttl
+        self.max_ttl = max_ttl
+        self.resolver = resolver
+        self.async_resolver = async_resolver
+        self.hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        if path:
+            self.load(path)
+            atexit.register(self.save)
+
+    @classmethod
+    def shared(cls) -> "DNSCache":
+        """
+        The process-wide cache used by every DNSLookUp toolkit.
+
+        Set DNS_CACHE_FILE to persist it between runs.
+        """
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls(path=os.getenv("DNS_CACHE_FILE") or None)
+            return cls._shared
+
+    @staticmethod
+    def _key(name: str, rdtype: str) -> tuple:
+        return name.lower().rstrip("."), rdtype.upper()
+
+    def resolve(self, name: str, rdtype: str = "A") -> tuple:
+        """
+        Resolve `name`, serving the answer from the cache while its TTL lasts.
+
+        Returns:
+            tuple: The answer's rdata objects.
+
+        Raises:
+            dns.resolver.NXDOMAIN, dns.resolver.NoAnswer: Live or cached negative answers.
+            Any other dns.exception.DNSException from the live query.
+        """
+        key = self._key(name, rdtype)
+        entry = self._cached(key)
+        if entry is None:
+            resolve = self.resolver.resolve if self.resolver is not None else dns.resolver.resolve
+            try:
+                entry = self._store_answer(key, resolve(name, rdtype))
+            except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer) as e:
+                self._store_error(key, e)
+                raise
+        return entry.records
+
+    async def aresolve(self, name: str, rdtype: str = "A", lifetime: Optional[float] = None) -> CacheEntry:
+        """
+        Like resolve(), on dns.asyncresolver, and returning the cache entry so callers can read its TTL.
+
+        Args:
+            lifetime (float): Seconds before the query gives up with dns.resolver.LifetimeTimeout.
+        """
+        key = self._key(name, rdtype)
+        entry = self._cached(key)
+        if entry is None:
+            try:
+                entry = self._store_answer(key, await self._async_resolver().resolve(name, rdtype, lifetime=lifetime))
+            except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer) as e:
+                self._store_error(key, e)
+                raise
+        return entry
+
+    def _async_resolver(self) -> dns.asyncresolver.Resolver:
+        if self.async_resolver is None:
+            if self.resolver is None:
+                self.async_resolver = dns.asyncresolver.get_default_resolver()
+            else:
+                # Same servers as the synchronous resolver
+                self.async_resolver = dns.asyncresolver.Resolver(configure=False)
+                self.async_resolver.nameservers = self.resolver.nameservers
+                self.async_resolver.port = self.resolver.port
+                self.async_resolver.timeout = self.resolver.timeout
+                self.async_resolver.lifetime = self.resolver.lifetime
+        return self.async_resolver
+
+    def _cached(self, key: tuple) -> Optional[CacheEntry]:
+        """The live entry for `key`, or None on a miss; raises for a cached negative answer."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires > time.time():
+                self._entries.move_to_end(key)
+                if entry.error is None:
+                    self.hits += 1
+                    return entry
+                self.negative_hits += 1
+                raise self._negative_error(entry.error, key[0])
+            self.misses += 1
+            return None
+
+    def _store_answer(self, key: tuple, answer: dns.resolver.Answer) -> CacheEntry:
+        ttl = min(max(answer.expiration - time.time(), 0), self.max_ttl)
+        entry = CacheEntry(time.time() + ttl, tuple(answer))
+        self._put(key, entry)
+        return entry
+
+    def _store_error(self, key: tuple, error: Exception) -> None:
+        kind = "NXDOMAIN" if isinstance(error, dns.resolver.NXDOMAIN) else "NoAnswer"
+        self._put(key, CacheEntry(time.time() + self._soa_ttl(error), (), kind))
+
+    def _soa_ttl(self, error: Exception) -> float:
+        """Negative-caching TTL: the smaller of the SOA record's TTL and its MINIMUM field."""
+        try:
+            if isinstance(error, dns.resolver.NXDOMAIN):
+                responses = list(error.responses().values())
+            else:
+                responses = [error.response()]
+        except Exception:
+            responses = []
+        for response in responses:
+            for rrset in getattr(response, "authority", None) or []:
+                if rrset.rdtype == dns.rdatatype.SOA:
+                    return min(rrset.ttl, rrset[0].minimum, self.max_ttl)
+        return self.negative_ttl
+
+    @staticmethod
+    def _negative_error(error: str, name: str) -> Exception:
+        if error == "NXDOMAIN":
+            return dns.resolver.NXDOMAIN(qnames=[dns.name.from_text(name)])
+        return dns.resolver.NoAnswer()
+
+    def _put(self, key: tuple, entry: CacheEntry) -> None:
+        if entry.expires <= time.time():
+            return
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def stats(self) -> dict:
+        """Hit and miss counters; negative hits count as hits in the hit rate."""
+        with self._lock:
+            lookups = self.hits + self.negative_hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "negative_hits": self.negative_hits,
+                "misses": self.misses,
+                "hit_rate": round((self.hits + self.negative_hits) / lookups, 3) if lookups else 0.0,
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def save(self, path: Optional[str] = None) -> int:
+        """
+        Write the unexpired entries to a JSON file, atomically.
+
+        Returns:
+            int: Number of entries written.
+        """
+        path = path or self.path
+        if not path:
+            return 0
+        now = time.time()
+        with self._lock:
+            rows = [
+                {
+                    "name": name,
+                    "rdtype": rdtype,
+                    "expires": entry.expires,
+                    "records": [rdata.to_text() for rdata in entry.records],
+                    "error": entry.error,
+                }
+                for (name, rdtype), entry in self._entries.items()
+                if entry.expires > now
+            ]
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"version": 1, "entries": rows}, f)
+        os.replace(tmp_path, path)
+        return len(rows)
+
+    def load(self, path: Optional[str] = None) -> int:
+        """
+        Load unexpired entries from a file written by save(). A missing or unreadable file is ignored.
+
+        Returns:
+            int: Number of entries loaded.
+        """
+        path = path or self.path
+        try:
+            with open(path) as f:
+                rows = json.load(f).get("entries", [])
+        except (OSError, ValueError, AttributeError):
+            return 0
+        now = time.time()
+        loaded = 0
+        for row in rows:
+            try:
+                if row["expires"] <= now:
+                    continue
+                rdtype = dns.rdatatype.from_text(row["rdtype"])
+                records = tuple(
+                    dns.rdata.from_text(dns.rdataclass.IN, rdtype, text, origin=dns.name.root, relativize=False)
+                    for text in row["records"]
+                )
+            except Exception:
+                continue
+            self._put(self._key(row["name"], row["rdtype"]), CacheEntry(row["expires"], records, row.get("error")))
+            loaded += 1
+        return loaded
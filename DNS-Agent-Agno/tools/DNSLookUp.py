@@ -1,16 +1,44 @@
 from agno.tools import Toolkit
-import whois
 import dns.resolver
+import asyncio
 import socket
+import time
+from concurrent.futures import ThreadPoolExecutor
 import requests
 from datetime import datetime, timedelta
 import os
 from dotenv import load_dotenv
+from tools.DNSCache import DNSCache
+from tools.Typosquat import TyposquatScanner
+from tools.WhoisCache import WhoisCache
 load_dotenv()
 
+SWEEP_RECORD_TYPES = ("A", "AAAA", "CNAME", "MX", "NS", "TXT", "SOA", "CAA")
+
+
+def run_sync(coro):
+    """Run a coroutine to completion, also from code already inside an event loop."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(asyncio.run, coro).result()
+
+
 class DNSLookUp(Toolkit):
 
-    def __init__(self, **kwargs):
+    def __init__(
+        self,
+        cache: DNSCache | None = None,
+        typosquat_qps: float = 200.0,
+        whois_cache: WhoisCache | None = None,
+        **kwargs,
+    ):
+        # One scan asks about the same names from several tools; they all share one TTL-aware cache
+        self.cache = cache or DNSCache.shared()
+        self.whois_cache = whois_cache or WhoisCache.shared()
+        self.typosquats = TyposquatScanner(cache=self.cache, qps=typosquat_qps)
         super().__init__(
             name="custom_tools",
             tools=[
@@ -19,21 +47,33 @@ class DNSLookUp(Toolkit):
                 self.get_all_domain_ips,
                 self.get_domain_geolocation,
                 self.get_dns_records,
+                self.dns_sweep,
                 self.detect_cdn_by_cname,
                 self.reverse_dns_lookup,
+                self.find_typosquats,
                 # self.check_brand_alert,
             ],
             **kwargs,
         )
 
-    def whois(self, domain: str) -> str:
+    def whois(self, domain: str) -> dict | str:
         """
         Perform a WHOIS lookup on the given domain.
+
+        Subdomains are looked up as their registrable domain ("mail.example.co.uk" as "example.co.uk").
+
+        Args:
+            domain (str): The domain name to query.
+
+        Returns:
+            dict: 'domain', 'registered' and, for registered domains, 'registrar', 'created', 'updated',
+                  'expires', 'age_days', 'expires_in_days', 'name_servers', 'status', 'dnssec',
+                  'registrant_org' and 'registrant_country' where the registry provides them.
+            str: An error message if the lookup fails.
         """
         print("Performing WHOIS lookup...")
         try:
-            domain_info = whois.whois(domain)
-            return str(domain_info)
+            return self.whois_cache.lookup(domain)
         except Exception as e:
             return f"Error: {str(e)}"
 
@@ -50,7 +90,7 @@ class DNSLookUp(Toolkit):
             str: An error message if something goes wrong.
         """
         try:
-            answers = dns.resolver.resolve(domain, record_type)
+            answers = self.cache.resolve(domain, record_type)
             return [rdata.to_text() for rdata in answers]
         except dns.resolver.NoAnswer:
             return f"No {record_type} records found for {domain}."
@@ -86,7 +126,7 @@ class DNSLookUp(Toolkit):
         """
         try:
             # Query MX records using dnspython
-            answers = dns.resolver.resolve(domain, 'MX')
+            answers = self.cache.resolve(domain, 'MX')
             mx_records = []
 
             for rdata in answers:
@@ -116,26 +156,104 @@ class DNSLookUp(Toolkit):
         Returns:
             dict: A dictionary with keys 'A' and 'AAAA' and their respective IP lists.
         """
-        ip_info = {'A': [], 'AAAA': []}
+        ip_info = {}
+        sweep = run_sync(self.sweep(domain, ('A', 'AAAA'), timeout=5.0))
+        for record_type, result in sweep.items():
+            if 'records' in result:
+                ip_info[record_type] = result['records']
+            elif result['status'] == 'NoAnswer':
+                ip_info[record_type] = [f"No {record_type} record found."]
+            else:
+                ip_info[record_type] = [f"Error: {result['error']}"]
+        return ip_info
 
-        try:
-            a_records = dns.resolver.resolve(domain, 'A')
-            ip_info['A'] = [rdata.to_text() for rdata in a_records]
-        except dns.resolver.NoAnswer:
-            ip_info['A'] = ["No A record found."]
-        except Exception as e:
-            ip_info['A'] = [f"Error: {e}"]
+    def dns_sweep(self, domain: str, record_types: list[str] | None = None, timeout: float = 3.0) -> dict:
+        """
+        Query all the common DNS record types of a domain at once, in parallel.
+
+        Use this instead of calling get_dns_records once per record type. Each record
+        type gets its own timeout, so one slow type does not hold up the others.
+
+        Args:
+            domain (str): The domain name to query.
+            record_types (list[str]): Record types to query; defaults to A, AAAA, CNAME, MX, NS, TXT, SOA and CAA.
+            timeout (float): Seconds to wait for each record type.
 
+        Returns:
+            dict: 'domain', 'elapsed_ms' and 'records', which maps each record type to either
+                  {'status': 'ok', 'ttl': <seconds>, 'records': [...]} or
+                  {'status': 'NXDOMAIN' | 'NoAnswer' | 'timeout' | 'error', 'error': <message>}.
+        """
+        print("Performing DNS sweep...", domain)
+        started = time.perf_counter()
+        types = [t.upper() for t in record_types] if record_types else list(SWEEP_RECORD_TYPES)
+        records = run_sync(self.sweep(domain, types, timeout))
+        return {
+            'domain': domain,
+            'elapsed_ms': round((time.perf_counter() - started) * 1000, 1),
+            'records': records,
+        }
+
+    async def sweep(self, domain: str, record_types=SWEEP_RECORD_TYPES, timeout: float = 3.0) -> dict:
+        """
+        The coroutine behind dns_sweep, for callers already running an event loop.
+
+        Returns:
+            dict: The 'records' part of the dns_sweep result.
+        """
+        results = await asyncio.gather(*(self._sweep_one(domain, t, timeout) for t in record_types))
+        return dict(zip(record_types, results))
+
+    async def _sweep_one(self, domain: str, record_type: str, timeout: float) -> dict:
         try:
-            aaaa_records = dns.resolver.resolve(domain, 'AAAA')
-            ip_info['AAAA'] = [rdata.to_text() for rdata in aaaa_records]
+            # dnspython's lifetime covers retries; wait_for is the backstop for a stuck socket
+            entry = await asyncio.wait_for(
+                self.cache.aresolve(domain, record_type, lifetime=timeout), timeout + 0.5
+            )
+        except dns.resolver.NXDOMAIN:
+            return {'status': 'NXDOMAIN', 'error': f"Domain {domain} does not exist."}
         except dns.resolver.NoAnswer:
-            ip_info['AAAA'] = ["No AAAA record found."]
+            return {'status': 'NoAnswer', 'error': f"No {record_type} records found for {domain}."}
+        except (dns.resolver.LifetimeTimeout, asyncio.TimeoutError):
+            return {'status': 'timeout', 'error': f"No answer within {timeout}s."}
         except Exception as e:
-            ip_info['AAAA'] = [f"Error: {e}"]
+            return {'status': 'error', 'error': str(e) or type(e).__name__}
+        return {
+            'status': 'ok',
+            'ttl': max(int(entry.expires - time.time()), 0),
+            'records': [rdata.to_text() for rdata in entry.records],
+        }
 
-        return ip_info
+    def find_typosquats(self, domain: str, max_results: int = 50) -> dict:
+        """
+        Find registered typo and look-alike variants of a domain (typosquatting).
+
+        Generates variants of the domain (omitted, swapped, repeated or mistyped letters,
+        homoglyphs, bit flips, hyphens, other TLDs, ...) and resolves them all
+        concurrently. A variant is registered when its name exists in DNS.
+
+        Args:
+            domain (str): The domain to protect (e.g., "example.com").
+            max_results (int): Maximum number of registered variants to return.
 
+        Returns:
+            dict: 'permutations_checked', 'registered_total', 'errors', 'elapsed_ms' and
+                  'registered', a list of {'domain', 'fuzzer', 'a', 'mx'} for each registered variant.
+        """
+        print("Searching for typosquatted domains...", domain)
+        started = time.perf_counter()
+        try:
+            registered, stats = run_sync(self.typosquats.scan(domain))
+        except ValueError as e:
+            return {'error': str(e)}
+        return {
+            'domain': domain,
+            'permutations_checked': stats.checked,
+            'registered_total': len(registered),
+            'errors': stats.errors,
+            'elapsed_ms': round((time.perf_counter() - started) * 1000, 1),
+            'registered': registered[:max_results],
+        }
 
     def reverse_dns_lookup(ip: str) -> str:
         """
@@ -216,7 +334,7 @@ class DNSLookUp(Toolkit):
         }
 
         try:
-            answers = dns.resolver.resolve(domain, 'CNAME')
+            answers = self.cache.resolve(domain, 'CNAME')
             for rdata in answers:
                 target = rdata.target.to_text().lower()
                 for cdn, signature in cdn_signatures.items():
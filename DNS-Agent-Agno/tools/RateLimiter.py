@@ -0,0 +1,32 @@
+import asyncio
+import time
+
+
+class RateLimiter:
+    """
+    Token bucket for asyncio code: `rate` tokens per second, bursts of up to `burst` tokens.
+
+    A rate of 0 or less disables the limit. The limiter belongs to the event loop it
+    is first used on, so make a new one for every asyncio.run().
+    """
+
+    def __init__(self, rate: float, burst: float | None = None):
+        self.rate = rate
+        self.capacity = burst or max(rate, 1.0)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, tokens: float = 1.0) -> None:
+        if self.rate <= 0:
+            return
+        tokens = min(tokens, self.capacity)
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return
+                await asyncio.sleep((tokens - self.tokens) / self.rate)
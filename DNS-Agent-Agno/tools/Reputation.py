@@ -2,6 +2,15 @@ from agno.tools import Toolkit
 import requests
 import os
 
+# threatMatches:find accepts at most 500 threat entries per request
+SAFE_BROWSING_BATCH = 500
+SAFE_BROWSING_THREATS = [
+    "MALWARE",
+    "SOCIAL_ENGINEERING",
+    "UNWANTED_SOFTWARE",
+    "POTENTIALLY_HARMFUL_APPLICATION",
+]
+
 class Reputation(Toolkit):
     """
     A class to perform various reputation checks on a given domain.
@@ -31,12 +40,7 @@ class Reputation(Toolkit):
         payload = {
             "client": {"clientId": "yourcompanyname", "clientVersion": "1.0"},
             "threatInfo": {
-                "threatTypes": [
-                    "MALWARE",
-                    "SOCIAL_ENGINEERING",
-                    "UNWANTED_SOFTWARE",
-                    "POTENTIALLY_HARMFUL_APPLICATION",
-                ],
+                "threatTypes": SAFE_BROWSING_THREATS,
                 "platformTypes": ["ANY_PLATFORM"],
                 "threatEntryTypes": ["URL"],
                 "threatEntries": [{"url": f"http://{domain}/"}],
@@ -50,6 +54,44 @@ class Reputation(Toolkit):
             return f"⚠️ Threat detected: {data['matches']}"
         return "✅ Domain is clean according to Google Safe Browsing."
 
+    def safe_browsing_matches(self, domains: list[str], api_key: str, timeout: float = 10.0) -> dict[str, list[str]]:
+        """
+        Look up many domains in Google Safe Browsing, SAFE_BROWSING_BATCH per request.
+
+        Not exposed to the agent; used by the bulk scanner.
+
+        Args:
+            domains (list[str]): Domains to check.
+            api_key (str): Your Google Safe Browsing API key.
+            timeout (float): Seconds to wait for each request.
+
+        Returns:
+            dict[str, list[str]]: The threat types found for each domain; clean domains map to [].
+
+        Raises:
+            requests.RequestException: If a request fails.
+        """
+        url = "https://safebrowsing.googleapis.com/v4/threatMatches:find?key=" + api_key
+        matches = {domain: [] for domain in domains}
+        for start in range(0, len(domains), SAFE_BROWSING_BATCH):
+            batch = domains[start:start + SAFE_BROWSING_BATCH]
+            payload = {
+                "client": {"clientId": "yourcompanyname", "clientVersion": "1.0"},
+                "threatInfo": {
+                    "threatTypes": SAFE_BROWSING_THREATS,
+                    "platformTypes": ["ANY_PLATFORM"],
+                    "threatEntryTypes": ["URL"],
+                    "threatEntries": [{"url": f"http://{domain}/"} for domain in batch],
+                },
+            }
+            response = requests.post(url, json=payload, timeout=timeout)
+            response.raise_for_status()
+            for match in response.json().get("matches", []):
+                domain = match["threat"]["url"].removeprefix("http://").rstrip("/")
+                if domain in matches and match["threatType"] not in matches[domain]:
+                    matches[domain].append(match["threatType"])
+        return matches
+
 
 # Example
 # api_key = "YOUR_API_KEY"
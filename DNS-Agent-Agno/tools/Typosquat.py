@@ -0,0 +1,283 @@
+import asyncio
+import re
+from dataclasses import dataclass
+from typing import AsyncIterator
+
+import dns.exception
+import dns.resolver
+
+from tools.DNSCache import DNSCache
+from tools.RateLimiter import RateLimiter
+from tools.WhoisCache import WhoisCache
+
+QWERTY_ROWS = ("1234567890-", "qwertyuiop", "asdfghjkl", "zxcvbnm")
+# ASCII look-alikes, one substitution at a time
+HOMOGLYPHS = {
+    "a": ["4"], "b": ["d", "lb"], "d": ["b", "cl"], "e": ["3"], "g": ["q", "9"], "i": ["1", "l"],
+    "l": ["1", "i"], "m": ["rn", "nn"], "n": ["m", "r"], "o": ["0"], "q": ["g"], "s": ["5"],
+    "u": ["v"], "v": ["u"], "w": ["vv"], "z": ["2"], "rn": ["m"], "vv": ["w"], "cl": ["d"],
+}
+VOWELS = "aeiou"
+TLDS = ("com", "net", "org", "info", "biz", "co", "io", "app", "online", "site", "xyz", "top", "shop", "live")
+LABEL = re.compile(r"^[a-z0-9](?:[a-z0-9-]{0,61}[a-z0-9])?$")
+
+
+def _keyboard():
+    neighbours = {}
+    for r, row in enumerate(QWERTY_ROWS):
+        for c, key in enumerate(row):
+            near = set()
+            for other in QWERTY_ROWS[max(r - 1, 0):r + 2]:
+                near.update(other[max(c - 1, 0):c + 2])
+            near.discard(key)
+            neighbours[key] = "".join(sorted(near))
+    return neighbours
+
+
+KEYBOARD = _keyboard()
+
+
+def _addition(name):
+    for c in "abcdefghijklmnopqrstuvwxyz0123456789":
+        yield name + c
+
+
+def _bitsquatting(name):
+    for i, c in enumerate(name):
+        for bit in range(8):
+            flipped = chr(ord(c) ^ (1 << bit))
+            if flipped.isascii() and (flipped.isalnum() or flipped == "-"):
+                yield name[:i] + flipped.lower() + name[i + 1:]
+
+
+def _homoglyph(name):
+    for glyph, lookalikes in HOMOGLYPHS.items():
+        start = name.find(glyph)
+        while start != -1:
+            for lookalike in lookalikes:
+                yield name[:start] + lookalike + name[start + len(glyph):]
+            start = name.find(glyph, start + 1)
+
+
+def _hyphenation(name):
+    for i in range(1, len(name)):
+        yield name[:i] + "-" + name[i:]
+
+
+def _insertion(name):
+    for i, c in enumerate(name):
+        for near in KEYBOARD.get(c, ""):
+            yield name[:i] + near + name[i:]
+            yield name[:i + 1] + near + name[i + 1:]
+
+
+def _omission(name):
+    for i in range(len(name)):
+        yield name[:i] + name[i + 1:]
+
+
+def _repetition(name):
+    for i, c in enumerate(name):
+        yield name[:i] + c + name[i:]
+
+
+def _replacement(name):
+    for i, c in enumerate(name):
+        for near in KEYBOARD.get(c, ""):
+            yield name[:i] + near + name[i + 1:]
+
+
+def _subdomain(name):
+    for i in range(1, len(name)):
+        yield name[:i] + "." + name[i:]
+
+
+def _transposition(name):
+    for i in range(len(name) - 1):
+        yield name[:i] + name[i + 1] + name[i] + name[i + 2:]
+
+
+def _vowel_swap(name):
+    for i, c in enumerate(name):
+        if c in VOWELS:
+            for vowel in VOWELS:
+                yield name[:i] + vowel + name[i + 1:]
+
+
+# Applied to the label left of the public suffix; "tld-swap" is handled separately
+FUZZERS = {
+    "addition": _addition,
+    "bitsquatting": _bitsquatting,
+    "homoglyph": _homoglyph,
+    "hyphenation": _hyphenation,
+    "insertion": _insertion,
+    "omission": _omission,
+    "repetition": _repetition,
+    "replacement": _replacement,
+    "subdomain": _subdomain,
+    "transposition": _transposition,
+    "vowel-swap": _vowel_swap,
+}
+
+
+def permutations(domain: str, fuzzers: list[str] | None = None) -> dict[str, str]:
+    """
+    Typo and look-alike variants of a domain, like dnstwist's fuzzers.
+
+    Only the label left of the public suffix is changed, so "mail.example.com"
+    and "www.example.co.uk" both give variants of "example". Variants that are
+    not valid host names are dropped.
+
+    Args:
+        domain (str): The domain to permute, e.g. "example.com".
+        fuzzers (list[str]): Names from FUZZERS, or "tld-swap"; all of them by default.
+
+    Returns:
+        dict[str, str]: Each variant and the fuzzer that produced it first.
+    """
+    domain = domain.lower().strip().rstrip(".")
+    registrable = WhoisCache.registrable_domain(domain)
+    if "." not in registrable or not (domain == registrable or domain.endswith(f".{registrable}")):
+        # A suffix missing from the Public Suffix List: take the last label as the TLD
+        registrable = ".".join(domain.split(".")[-2:])
+    name, _, tld = registrable.partition(".")
+    if not name or not tld:
+        raise ValueError(f"Not a domain name: {domain!r}")
+    head = domain[:-len(registrable)]
+
+    variants = {}
+    selected = fuzzers or [*FUZZERS, "tld-swap"]
+    for fuzzer in selected:
+        if fuzzer == "tld-swap":
+            candidates = (f"{head}{name}.{other}" for other in TLDS if other != tld)
+        elif fuzzer in FUZZERS:
+            candidates = (f"{head}{variant}.{tld}" for variant in FUZZERS[fuzzer](name))
+        else:
+            raise ValueError(f"Unknown fuzzer {fuzzer!r}; choose from {', '.join([*FUZZERS, 'tld-swap'])}")
+        for candidate in candidates:
+            if candidate != domain and candidate not in variants and all(
+                LABEL.match(label) for label in candidate.split(".")
+            ):
+                variants[candidate] = fuzzer
+    return variants
+
+
+@dataclass
+class ScanStats:
+    """Counters of one scan; each call to TyposquatScanner.stream or scan fills its own."""
+
+    permutations: int = 0
+    checked: int = 0
+    errors: int = 0
+
+
+class TyposquatScanner:
+    """
+    Resolves the permutations of a domain concurrently and streams out the registered ones.
+
+    A variant counts as registered when its name exists: it has A records, or
+    the lookup ends in NoAnswer rather than NXDOMAIN. Every DNS query draws on a
+    token bucket of `qps` queries per second, so a scan never floods the resolver,
+    and goes through the shared DNSCache, so NXDOMAIN answers are reused.
+    """
+
+    def __init__(
+        self,
+        cache: DNSCache | None = None,
+        qps: float = 200.0,
+        concurrency: int = 100,
+        timeout: float = 2.0,
+        check_mx: bool = True,
+    ):
+        """
+        Args:
+            cache (DNSCache): Cache (and resolver) to query through; the shared one by default.
+            qps (float): Ceiling on DNS queries per second; 0 for no limit.
+            concurrency (int): Queries in flight at once.
+            timeout (float): Seconds to wait for each query.
+            check_mx (bool): Also look up MX records of registered variants, a sign they can receive phishing mail.
+        """
+        self.cache = cache or DNSCache.shared()
+        self.qps = qps
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.check_mx = check_mx
+
+    async def _query(self, limiter: RateLimiter, name: str, rdtype: str):
+        await limiter.acquire()
+        # dnspython's lifetime covers retries; wait_for is the backstop for a stuck socket
+        entry = await asyncio.wait_for(self.cache.aresolve(name, rdtype, lifetime=self.timeout), self.timeout + 0.5)
+        return [rdata.to_text() for rdata in entry.records]
+
+    async def _check(self, limiter: RateLimiter, stats: ScanStats, variant: str, fuzzer: str) -> dict | None:
+        try:
+            addresses = await self._query(limiter, variant, "A")
+        except dns.resolver.NXDOMAIN:
+            return None
+        except dns.resolver.NoAnswer:
+            addresses = []
+        except (dns.exception.DNSException, asyncio.TimeoutError):
+            stats.errors += 1
+            return None
+        result = {"domain": variant, "fuzzer": fuzzer, "a": addresses}
+        if self.check_mx:
+            try:
+                result["mx"] = await self._query(limiter, variant, "MX")
+            except (dns.exception.DNSException, asyncio.TimeoutError):
+                result["mx"] = []
+        return result
+
+    async def stream(
+        self, domain: str, fuzzers: list[str] | None = None, stats: ScanStats | None = None
+    ) -> AsyncIterator[dict]:
+        """
+        Yield each registered variant of `domain` as soon as it is found.
+
+        Args:
+            domain (str): The domain to permute.
+            fuzzers (list[str]): Fuzzers to use; all of them by default.
+            stats (ScanStats): Filled with this scan's counters as it runs. Scans running
+                               at the same time on one scanner each need their own.
+
+        Yields:
+            dict: 'domain', 'fuzzer', 'a' (addresses) and, with check_mx, 'mx'.
+        """
+        variants = permutations(domain, fuzzers)
+        stats = stats if stats is not None else ScanStats()
+        stats.permutations = len(variants)
+        # One limiter per scan: it is bound to the event loop running this scan. A scan lasts
+        # seconds, so the burst is kept to 100 ms worth of queries for the ceiling to hold.
+        limiter = RateLimiter(self.qps, burst=max(self.qps / 10, 1.0))
+        pending = iter(variants.items())
+        found = asyncio.Queue()
+
+        async def worker():
+            # Workers share one iterator; pulling from it never yields to the loop
+            for variant, fuzzer in pending:
+                result = await self._check(limiter, stats, variant, fuzzer)
+                stats.checked += 1
+                if result is not None:
+                    await found.put(result)
+
+        workers = [asyncio.create_task(worker()) for _ in range(max(min(self.concurrency, len(variants)), 1))]
+        done = asyncio.gather(*workers)
+        done.add_done_callback(lambda _: found.put_nowait(None))
+        try:
+            while (result := await found.get()) is not None:
+                yield result
+            await done
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+    async def scan(self, domain: str, fuzzers: list[str] | None = None) -> tuple[list[dict], ScanStats]:
+        """
+        Every registered variant of `domain`, once the scan is complete.
+
+        Returns:
+            tuple[list[dict], ScanStats]: The variants stream() yields, in the order found, and the scan's counters.
+        """
+        stats = ScanStats()
+        found = [result async for result in self.stream(domain, fuzzers, stats)]
+        return found, stats
@@ -0,0 +1,278 @@
+import atexit
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
+from typing import Optional
+
+import whois
+from whois.exceptions import WhoisDomainNotFoundError
+
+
+@dataclass
+class CachedWhois:
+    expires: float  # wall-clock time, so entries survive a restart
+    record: dict  # compact record without the computed age fields
+
+
+def _values(value) -> list:
+    if value is None:
+        return []
+    return [v for v in (value if isinstance(value, (list, tuple, set)) else [value]) if v not in (None, "")]
+
+
+def _date(value, pick=min) -> Optional[str]:
+    """ISO date of a WHOIS date field; registries often repeat dates, or list several."""
+    dates = [v.date() if isinstance(v, datetime) else v for v in _values(value)]
+    parsed = [d for d in dates if isinstance(d, date)]
+    if parsed:
+        return pick(parsed).isoformat()
+    return str(dates[0]) if dates else None
+
+
+def _first(value) -> Optional[str]:
+    values = _values(value)
+    return str(values[0]) if values else None
+
+
+def compact_record(domain: str, entry: dict) -> dict:
+    """
+    The fields of a python-whois result that matter for a risk assessment, normalized.
+
+    Status codes lose their ICANN explanation URLs; name servers are lower-cased and
+    de-duplicated. Fields the registry did not return are left out.
+    """
+    record = {
+        "domain": domain,
+        "registered": True,
+        "registrar": _first(entry.get("registrar")),
+        "created": _date(entry.get("creation_date"), min),
+        "updated": _date(entry.get("updated_date"), max),
+        "expires": _date(entry.get("expiration_date"), min),
+        "name_servers": sorted({str(ns).lower().rstrip(".") for ns in _values(entry.get("name_servers"))}),
+        "status": sorted({str(status).split()[0] for status in _values(entry.get("status"))}),
+        "dnssec": _first(entry.get("dnssec")),
+        "registrant_org": _first(entry.get("org")),
+        "registrant_country": _first(entry.get("country")),
+    }
+    return {key: value for key, value in record.items() if value not in (None, [])}
+
+
+def _days_since(iso_date: Optional[str]) -> Optional[int]:
+    try:
+        return (datetime.now(timezone.utc).date() - date.fromisoformat(iso_date)).days
+    except (TypeError, ValueError):
+        return None
+
+
+class WhoisCache:
+    """
+    Cache of compact WHOIS records, keyed on the registrable domain.
+
+    WHOIS is a slow port-43 round trip and rarely changes within hours, and every
+    subdomain of a site has the same record, so "mail.example.co.uk" and
+    "www.example.co.uk" share one lookup of "example.co.uk". Unregistered domains
+    are cached for `negative_ttl` only, as typosquats get registered. Lookup errors
+    are never cached.
+
+    The cache is bounded (least recently used entries go first) and can be saved
+    to a JSON file and loaded again on the next start.
+    """
+
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    def __init__(
+        self,
+        ttl: float = 12 * 3600,
+        negative_ttl: float = 3600,
+        max_entries: int = 5000,
+        path: Optional[str] = None,
+        timeout: int = 10,
+    ):
+        """
+        Args:
+            ttl (float): Seconds to keep the record of a registered domain.
+            negative_ttl (float): Seconds to remember that a domain is not registered.
+            max_entries (int): Maximum number of cached records.
+            path (str): Optional JSON file to load the cache from and save it to at exit.
+            timeout (int): Seconds to wait for the WHOIS server.
+        """
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.max_entries = max_entries
+        self.path = path
+        self.timeout = timeout
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        # One lookup per domain at a time; concurrent callers wait for its result
+        self._inflight = {}
+        if path:
+            self.load(path)
+            atexit.register(self.save)
+
+    @classmethod
+    def shared(cls) -> "WhoisCache":
+        """
+        The process-wide cache used by every DNSLookUp toolkit.
+
+        Set WHOIS_CACHE_FILE to persist it between runs and WHOIS_CACHE_TTL (seconds) to change the TTL.
+        """
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls(
+                    ttl=float(os.getenv("WHOIS_CACHE_TTL") or 12 * 3600),
+                    path=os.getenv("WHOIS_CACHE_FILE") or None,
+                )
+            return cls._shared
+
+    @staticmethod
+    def registrable_domain(domain: str) -> str:
+        """The domain a registrar sells, per the Public Suffix List shipped with python-whois."""
+        host = domain.strip().lower().split("://", 1)[-1].split("/", 1)[0].rstrip(".")
+        if not host or host.replace(".", "").isdigit() or ":" in host:
+            # IP addresses are looked up as they are
+            return host
+        return whois.extract_domain(host) or host
+
+    def lookup(self, domain: str) -> dict:
+        """
+        The compact WHOIS record of `domain`'s registrable domain, from the cache while it is fresh.
+
+        Returns:
+            dict: compact_record() fields plus 'age_days' and 'expires_in_days', or
+                  {'domain': ..., 'registered': False} for an unregistered domain.
+
+        Raises:
+            Exception: Whatever python-whois raises when the lookup fails.
+        """
+        key = self.registrable_domain(domain)
+        record = self._cached(key)
+        if record is None:
+            with self._lock:
+                lock = self._inflight.setdefault(key, threading.Lock())
+            try:
+                with lock:
+                    record = self._cached(key, count=False)
+                    if record is None:
+                        record = self._fetch(key)
+            finally:
+                with self._lock:
+                    # A later caller may already have put its own lock in; leave that one alone
+                    if self._inflight.get(key) is lock:
+                        del self._inflight[key]
+        return self._with_age(record)
+
+    def _cached(self, key: str, count: bool = True) -> Optional[dict]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires > time.time():
+                self._entries.move_to_end(key)
+                self.hits += count
+                return entry.record
+            self.misses += count
+            return None
+
+    def _fetch(self, key: str) -> dict:
+        try:
+            entry = whois.whois(key, quiet=True, timeout=self.timeout)
+        except WhoisDomainNotFoundError:
+            record, ttl = {"domain": key, "registered": False}, self.negative_ttl
+        else:
+            if not entry.get("domain_name") and not entry.get("creation_date"):
+                # Some registries answer "not found" without the text python-whois looks for
+                record, ttl = {"domain": key, "registered": False}, self.negative_ttl
+            else:
+                record, ttl = compact_record(key, entry), self.ttl
+        self._put(key, CachedWhois(time.time() + ttl, record))
+        return record
+
+    @staticmethod
+    def _with_age(record: dict) -> dict:
+        # Ages are computed on every read, so a record loaded from disk stays correct
+        record = dict(record)
+        age = _days_since(record.get("created"))
+        if age is not None:
+            record["age_days"] = age
+        left = _days_since(record.get("expires"))
+        if left is not None:
+            record["expires_in_days"] = -left
+        return record
+
+    def _put(self, key: str, entry: CachedWhois) -> None:
+        if entry.expires <= time.time():
+            return
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def save(self, path: Optional[str] = None) -> int:
+        """
+        Write the unexpired entries to a JSON file, atomically.
+
+        Returns:
+            int: Number of entries written.
+        """
+        path = path or self.path
+        if not path:
+            return 0
+        now = time.time()
+        with self._lock:
+            rows = [
+                {"domain": key, "expires": entry.expires, "record": entry.record}
+                for key, entry in self._entries.items()
+                if entry.expires > now
+            ]
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"version": 1, "entries": rows}, f)
+        os.replace(tmp_path, path)
+        return len(rows)
+
+    def load(self, path: Optional[str] = None) -> int:
+        """
+        Load unexpired entries from a file written by save(). A missing or unreadable file is ignored.
+
+        Returns:
+            int: Number of entries loaded.
+        """
+        path = path or self.path
+        try:
+            with open(path) as f:
+                rows = json.load(f).get("entries", [])
+        except (OSError, ValueError, AttributeError):
+            return 0
+        now = time.time()
+        loaded = 0
+        for row in rows:
+            try:
+                if row["expires"] <= now or not isinstance(row["record"], dict):
+                    continue
+                self._put(row["domain"], CachedWhois(row["expires"], row["record"]))
+            except (KeyError, TypeError):
+                continue
+            loaded += 1
+        return loaded
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+N single save_file calls vs. one batch_file_operations call.
+
+Only measures tool execution; in a real session every single call also costs an
+LLM round trip, which the batch saves N - 1 times.
+
+    uv run python benchmarks/bench_batch.py --files 1000
+"""
+
+import argparse
+import logging
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from agno.utils.log import logger  # noqa: E402
+
+from tools.file import FileTools  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--files", type=int, default=1000)
+    parser.add_argument("--workers", type=int, default=8)
+    args = parser.parse_args()
+    logger.setLevel(logging.WARNING)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tools = FileTools(base_dir=Path(tmp))
+
+        started = time.perf_counter()
+        for i in range(args.files):
+            tools.save_file(f"id: {i}\n", f"single/config_{i}.yaml")
+        single = time.perf_counter() - started
+
+        operations = [
+            {"op": "save_file", "args": {"file_name": f"batch/config_{i}.yaml", "contents": f"id: {i}\n"}}
+            for i in range(args.files)
+        ]
+        started = time.perf_counter()
+        tools.batch_file_operations(operations, max_workers=args.workers)
+        batch = time.perf_counter() - started
+
+    print(f"{'mode':<22}{'tool calls':>12}{'time':>12}")
+    print(f"{'single save_file':<22}{args.files:>12}{single * 1000:>10.1f}ms")
+    print(f"{'batch_file_operations':<22}{1:>12}{batch * 1000:>10.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
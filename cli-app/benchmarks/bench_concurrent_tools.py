@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Wall time of one model turn that asks for several tool calls, serial vs. concurrent.
+
+The calls go through the model's run_function_calls, exactly as in an agent
+run. "local" uses real ShellTools and FileTools reads (disk usage, process list,
+log searches); they are CPU bound once the page cache is warm, so their speedup
+is capped by the core count. "docker" stands in for Docker API calls, which
+mostly wait on the daemon: each call sleeps --latency ms. The "+ write" turns
+put a file write in the middle, which the concurrent mode treats as a barrier.
+
+    uv run python benchmarks/bench_concurrent_tools.py --dir /usr --latency 150
+"""
+
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+APP_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(APP_DIR / "src"))
+sys.path.insert(0, str(APP_DIR))
+
+from agno.models.openai import OpenAIChat  # noqa: E402
+from agno.tools.function import FunctionCall  # noqa: E402
+from agno.tools.shell import ShellTools  # noqa: E402
+from agno.utils.log import logger  # noqa: E402
+
+from agno.tools import Toolkit  # noqa: E402
+
+from tools.file import FileTools  # noqa: E402
+from tools.parallel import with_concurrent_tool_calls  # noqa: E402
+
+
+class DaemonTools(Toolkit):
+    """Read-only Docker tool names whose calls take `latency` seconds, like a round trip to the daemon."""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        super().__init__(name="docker_tools", tools=[self.list_containers, self.inspect_container, self.get_container_logs])
+
+    def list_containers(self) -> str:
+        time.sleep(self.latency)
+        return "[]"
+
+    def inspect_container(self, container_id: str) -> str:
+        time.sleep(self.latency)
+        return "{}"
+
+    def get_container_logs(self, container_id: str, tail: int = 100) -> str:
+        time.sleep(self.latency)
+        return ""
+
+
+def docker_turn(docker: DaemonTools, files: FileTools, log_file: str, with_write: bool):
+    calls = [
+        (docker, "list_containers", {}),
+        (docker, "inspect_container", {"container_id": "web"}),
+        (docker, "get_container_logs", {"container_id": "web"}),
+        (docker, "inspect_container", {"container_id": "db"}),
+        (docker, "get_container_logs", {"container_id": "db"}),
+        (files, "read_file", {"file_name": log_file}),
+    ]
+    if with_write:
+        calls.insert(3, (files, "save_file", {"contents": "checked\n", "file_name": log_file + ".note", "overwrite": True}))
+    return function_calls(calls)
+
+
+def function_calls(calls):
+    return [FunctionCall(function=toolkit.functions[name], arguments=args, call_id=f"call-{i}")
+            for i, (toolkit, name, args) in enumerate(calls)]
+
+
+def local_turn(shell: ShellTools, files: FileTools, scan_dir: str, log_file: str, with_write: bool):
+    calls = [
+        (shell, "run_shell_command", {"args": ["du", "-s", os.path.join(scan_dir, "lib")]}),
+        (shell, "run_shell_command", {"args": ["du", "-s", os.path.join(scan_dir, "share")]}),
+        (shell, "run_shell_command", {"args": ["ps", "aux"]}),
+        (shell, "run_shell_command", {"args": ["df", "-h"]}),
+        (shell, "run_shell_command", {"args": ["grep", "-c", "request 1", log_file]}),
+        (files, "read_file", {"file_name": log_file}),
+        (files, "get_file_info", {"file_name": log_file}),
+    ]
+    if with_write:
+        calls.insert(4, (files, "save_file", {"contents": "checked\n", "file_name": log_file + ".note", "overwrite": True}))
+    return function_calls(calls)
+
+
+def run_turn(model, function_calls) -> float:
+    results = []
+    started = time.perf_counter()
+    for _ in model.run_function_calls(function_calls, results):
+        pass
+    elapsed = time.perf_counter() - started
+    assert [r.tool_call_id for r in results] == [fc.call_id for fc in function_calls]
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--dir", default="/usr", help="directory to scan")
+    parser.add_argument("--latency", type=float, default=150, help="ms per simulated Docker call")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--workers", type=int, default=8)
+    args = parser.parse_args()
+    logger.setLevel(logging.WARNING)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        log_file = os.path.join(tmp, "app.log")
+        with open(log_file, "w") as f:
+            f.writelines(f"2024-01-01 12:00:{i % 60:02d} INFO request {i} served\n" for i in range(200_000))
+        shell = ShellTools(base_dir=Path(tmp))
+        files = FileTools(base_dir=Path("/"))
+        docker = DaemonTools(args.latency / 1000)
+        turns = {
+            "local": lambda: local_turn(shell, files, args.dir, log_file, False),
+            "local + write": lambda: local_turn(shell, files, args.dir, log_file, True),
+            "docker": lambda: docker_turn(docker, files, log_file, False),
+            "docker + write": lambda: docker_turn(docker, files, log_file, True),
+        }
+
+        serial = OpenAIChat(id="bench", api_key="unused")
+        concurrent = with_concurrent_tool_calls(OpenAIChat(id="bench", api_key="unused"), max_workers=args.workers)
+        print(f"{os.cpu_count()} CPUs, {args.workers} workers")
+        print(f"{'turn':<16}{'calls':>6}{'serial':>12}{'concurrent':>12}{'speedup':>9}")
+        for label, make_turn in turns.items():
+            timings = {"serial": [], "concurrent": []}
+            for _ in range(args.repeat):
+                for name, model in (("serial", serial), ("concurrent", concurrent)):
+                    timings[name].append(run_turn(model, make_turn()))
+            best = {name: min(values) for name, values in timings.items()}
+            print(f"{label:<16}{len(make_turn()):>6}{best['serial'] * 1000:>10.0f}ms{best['concurrent'] * 1000:>10.0f}ms"
+                  f"{best['serial'] / best['concurrent']:>8.1f}x")
+
+if __name__ == "__main__":
+    main()
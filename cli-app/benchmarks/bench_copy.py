@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Copy throughput: shutil (what copy_file used before) vs. the tools.fastcopy engine.
+
+Measures one large file and a tree of many small files, plus re-copying the tree
+onto an up-to-date target, where content dedup skips every file:
+
+    uv run python benchmarks/bench_copy.py --large-mb 1024 --small-files 20000
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from tools.fastcopy import fast_copy_file, fast_copy_tree  # noqa: E402
+
+
+def build_small_tree(root: Path, files: int, size: int) -> None:
+    payload = os.urandom(size)
+    for i in range(files):
+        d = root / f"dir_{i // 500:03d}"
+        d.mkdir(parents=True, exist_ok=True)
+        (d / f"file_{i:06d}.dat").write_bytes(payload)
+
+
+def timed(label: str, nbytes: int, func) -> None:
+    started = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - started
+    extra = f"  {result}" if isinstance(result, str) else ""
+    print(f"{label:<34}{elapsed * 1000:>10.1f}ms{nbytes / elapsed / 1e6:>12.1f}MB/s{extra}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--large-mb", type=int, default=512)
+    parser.add_argument("--small-files", type=int, default=5000)
+    parser.add_argument("--small-size", type=int, default=4096)
+    parser.add_argument("--dir", type=Path, help="scratch directory, e.g. on the filesystem under test")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(dir=args.dir) as tmp:
+        tmp = Path(tmp)
+        large = tmp / "large.bin"
+        with open(large, "wb") as f:
+            block = os.urandom(1024 * 1024)
+            for _ in range(args.large_mb):
+                f.write(block)
+        large_bytes = large.stat().st_size
+
+        print(f"{'case':<34}{'time':>12}{'throughput':>16}")
+        timed("large file: shutil.copy2", large_bytes, lambda: shutil.copy2(large, tmp / "large.copy2"))
+        timed("large file: fast_copy_file", large_bytes, lambda: fast_copy_file(str(large), str(tmp / "large.fast")))
+
+        src = tmp / "small"
+        build_small_tree(src, args.small_files, args.small_size)
+        tree_bytes = args.small_files * args.small_size
+        timed("small tree: shutil.copytree", tree_bytes, lambda: shutil.copytree(src, tmp / "small.shutil"))
+        timed("small tree: fast_copy_tree", tree_bytes, lambda: fast_copy_tree(str(src), str(tmp / "small.fast")))
+        timed("small tree: re-copy (hash dedup)", tree_bytes, lambda: fast_copy_tree(str(src), str(tmp / "small.fast")))
+        timed(
+            "small tree: re-copy (quick check)",
+            tree_bytes,
+            lambda: fast_copy_tree(str(src), str(tmp / "small.fast"), quick_check=True),
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Cold Path.glob vs. FileIndex lookups on a synthetic tree.
+
+    uv run python benchmarks/bench_file_index.py --files 500000
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from tools.index import FileIndex  # noqa: E402
+
+EXTENSIONS = [".py", ".txt", ".log", ".json", ".md"]
+PATTERNS = ["**/*.py", "**/file_42*", "**/README.md"]
+
+
+def build_tree(root: Path, files: int, per_dir: int) -> None:
+    for i in range(files):
+        d = root / f"d{i // (per_dir * 50):03d}" / f"s{(i // per_dir) % 50:02d}"
+        if i % per_dir == 0:
+            d.mkdir(parents=True, exist_ok=True)
+            (d / "README.md").touch()
+        (d / f"file_{i}{EXTENSIONS[i % len(EXTENSIONS)]}").touch()
+
+
+def timed(fn):
+    started = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - started, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--files", type=int, default=500_000)
+    parser.add_argument("--per-dir", type=int, default=100)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp) / "tree"
+        elapsed, _ = timed(lambda: build_tree(root, args.files, args.per_dir))
+        print(f"Built {args.files} files in {elapsed:.1f}s")
+
+        index = FileIndex(root, Path(tmp) / "index", refresh_interval=0)
+        elapsed, _ = timed(lambda: index.refresh(force=True))
+        print(f"Initial index build: {elapsed:.2f}s")
+        elapsed, _ = timed(lambda: index.refresh(force=True))
+        print(f"Incremental refresh (no changes): {elapsed:.3f}s")
+
+        index.refresh_interval = 60
+        print(f"\n{'pattern':<16}{'matches':>10}{'Path.glob':>14}{'index':>14}{'speedup':>10}")
+        for pattern in PATTERNS:
+            glob_time, globbed = timed(lambda: list(root.glob(pattern)))
+            index_time, indexed = timed(lambda: index.glob(pattern))
+            assert len(globbed) == len(indexed), pattern
+            print(
+                f"{pattern:<16}{len(indexed):>10}{glob_time * 1000:>12.1f}ms"
+                f"{index_time * 1000:>12.1f}ms{glob_time / index_time:>9.0f}x"
+            )
+        index.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+grep_tree (mmap + process pool) vs. `grep -rnI` on a source tree.
+
+Uses a synthetic tree unless --path points at a real checkout:
+
+    uv run python benchmarks/bench_grep.py --path ~/src/linux --pattern "TODO|FIXME"
+"""
+
+import argparse
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from tools.grep import grep_tree  # noqa: E402
+
+WORDS = ["def", "return", "self", "value", "config", "import", "class", "yield", "TODO", "async"]
+
+
+def build_tree(root: Path, files: int, lines: int) -> None:
+    rng = random.Random(0)
+    for i in range(files):
+        d = root / f"pkg{i // 200}"
+        d.mkdir(parents=True, exist_ok=True)
+        body = "\n".join(" ".join(rng.choices(WORDS, k=8)) for _ in range(lines))
+        (d / f"module_{i}.py").write_text(body + "\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--path", type=Path)
+    parser.add_argument("--pattern", default=r"TODO\s+async")
+    parser.add_argument("--files", type=int, default=5000)
+    parser.add_argument("--lines", type=int, default=400)
+    parser.add_argument("--max-results", type=int, default=10_000_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = args.path
+        if root is None:
+            root = Path(tmp)
+            build_tree(root, args.files, args.lines)
+
+        started = time.perf_counter()
+        proc = subprocess.run(
+            ["grep", "-rnIE", "--exclude-dir=.git", args.pattern, str(root)],
+            capture_output=True,
+            text=True,
+        )
+        grep_time = time.perf_counter() - started
+        grep_matches = len(proc.stdout.splitlines())
+
+        started = time.perf_counter()
+        result = grep_tree(str(root), args.pattern, max_results=args.max_results, respect_gitignore=False)
+        tree_time = time.perf_counter() - started
+
+        started = time.perf_counter()
+        capped = grep_tree(str(root), args.pattern, max_results=200, respect_gitignore=False)
+        capped_time = time.perf_counter() - started
+
+    print(f"{'engine':<28}{'matches':>10}{'time':>12}")
+    print(f"{'grep -rnI':<28}{grep_matches:>10}{grep_time * 1000:>10.1f}ms")
+    print(f"{'grep_tree (all matches)':<28}{result['matches_found']:>10}{tree_time * 1000:>10.1f}ms")
+    print(f"{'grep_tree (max_results=200)':<28}{capped['matches_found']:>10}{capped_time * 1000:>10.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Size, token count and serialization time of a large directory listing.
+
+"indent=2" is the previous json.dumps(result, indent=2); the others go through
+tools.shaping. Tokens are counted with tiktoken (cl100k_base) when it is
+installed, otherwise estimated at 4 bytes per token.
+
+    uv run python benchmarks/bench_response_shaping.py --files 20000
+"""
+
+import argparse
+import json
+import logging
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from agno.utils.log import logger  # noqa: E402
+
+from tools.file import FileTools  # noqa: E402
+from tools.shaping import estimate_tokens, shape  # noqa: E402
+
+try:
+    import tiktoken
+
+    _encoding = tiktoken.get_encoding("cl100k_base")
+
+    def count_tokens(text: str) -> int:
+        return len(_encoding.encode(text))
+
+    TOKENIZER = "tiktoken cl100k_base"
+except ImportError:
+    count_tokens = estimate_tokens
+    TOKENIZER = "estimate, 4 bytes/token"
+
+
+def timed(serialize, repeat: int):
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        text = serialize()
+        best = min(best, time.perf_counter() - started)
+    return text, best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--files", type=int, default=20000)
+    parser.add_argument("--max-bytes", type=int, default=64 * 1024)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    logger.setLevel(logging.WARNING)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        for i in range(args.files):
+            (root / f"service_{i:06d}.log").write_text("x" * (i % 100))
+        # The listing as list_directory builds it, before serialization
+        listing = json.loads(FileTools(base_dir=root, max_response_bytes=None).list_directory())
+
+    variants = {
+        "indent=2": lambda: json.dumps(listing, indent=2),
+        "compact": lambda: shape(listing, max_bytes=None),
+        "compact, table": lambda: shape(listing, max_bytes=None, table=True),
+        f"budget {args.max_bytes // 1024} KB": lambda: shape(listing, max_bytes=args.max_bytes),
+        f"budget {args.max_bytes // 1024} KB, table": lambda: shape(listing, max_bytes=args.max_bytes, table=True),
+    }
+    print(f"{args.files} entries, tokens: {TOKENIZER}")
+    print(f"{'encoding':<24}{'bytes':>12}{'tokens':>10}{'time':>10}{'entries shown':>15}")
+    for label, serialize in variants.items():
+        text, elapsed = timed(serialize, args.repeat)
+        shown = args.files - sum(json.loads(text).get("omitted_items", {}).values())
+        print(f"{label:<24}{len(text.encode()):>12,}{count_tokens(text):>10,}{elapsed * 1000:>8.1f}ms{shown:>15,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Repeated read-only FileTools calls with and without the result cache.
+
+Simulates a session that asks for the same listings, tree, file info and file
+contents every turn, with a save every --write-every turns that invalidates
+the results it affects.
+
+    uv run python benchmarks/bench_result_cache.py --files 5000 --turns 20
+"""
+
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from agno.utils.log import logger  # noqa: E402
+
+from tools.file import FileTools  # noqa: E402
+
+
+def populate(root: Path, files: int) -> None:
+    for i in range(files):
+        directory = root / f"pkg{i % 20}" / f"mod{i % 7}"
+        directory.mkdir(parents=True, exist_ok=True)
+        (directory / f"file{i}.py").write_text(f"# module {i}\n" + "x = 1\n" * 200)
+
+
+def session(tools: FileTools, root: Path, turns: int, write_every: int) -> float:
+    started = time.perf_counter()
+    for turn in range(turns):
+        tools.list_directory(str(root))
+        tools.list_directory_tree(str(root), max_depth=3, output_format="text")
+        tools.get_file_info("pkg0/mod0/file0.py")
+        tools.read_file("pkg1/mod1/file1.py")
+        if write_every and turn % write_every == write_every - 1:
+            tools.save_file(f"turn {turn}\n", "notes/progress.txt")
+    return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--files", type=int, default=5000)
+    parser.add_argument("--turns", type=int, default=20)
+    parser.add_argument("--write-every", type=int, default=5, help="turns between saves, 0 for none")
+    args = parser.parse_args()
+    logger.setLevel(logging.WARNING)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        populate(root, args.files)
+        uncached = session(FileTools(base_dir=root, result_cache_size=0), root, args.turns, args.write_every)
+        tools = FileTools(base_dir=root)
+        cached = session(tools, root, args.turns, args.write_every)
+        print(f"{args.turns} turns over {args.files} files, a save every {args.write_every} turns")
+        print(f"{'uncached':<10}{uncached * 1000:>10.0f}ms")
+        print(f"{'cached':<10}{cached * 1000:>10.0f}ms   {tools._results.stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Session save/load latency as a session grows to 1,000 runs.
+
+Each step loads the session, appends one run and saves it again, like one CLI
+turn. SqliteStorage keeps every run in the session row; CompactingSqliteStorage
+keeps the last --keep-runs and archives the rest.
+
+    uv run python benchmarks/bench_session_compaction.py --runs 1000
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from agno.storage.session.agent import AgentSession  # noqa: E402
+from agno.storage.sqlite import SqliteStorage  # noqa: E402
+
+from storage import CompactingSqliteStorage  # noqa: E402
+
+
+def make_run(i: int) -> dict:
+    return {
+        "run_id": f"run-{i}",
+        "session_id": "bench",
+        "content": f"Response {i}: " + "lorem ipsum dolor sit amet " * 40,
+        "messages": [
+            {"role": "user", "content": f"Question {i}: " + "please check the deployment " * 5},
+            {"role": "assistant", "content": "lorem ipsum dolor sit amet " * 40},
+        ],
+    }
+
+
+def turn(storage, i: int):
+    started = time.perf_counter()
+    session = storage.read("bench")
+    loaded = time.perf_counter()
+    runs = (session.memory or {}).get("runs", []) if session else []
+    storage.upsert(
+        AgentSession(
+            session_id="bench",
+            user_id="user",
+            agent_id="agent",
+            memory={"runs": runs + [make_run(i)]},
+            session_data={},
+            extra_data={},
+            agent_data={},
+        )
+    )
+    return loaded - started, time.perf_counter() - loaded
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=1000)
+    parser.add_argument("--keep-runs", type=int, default=20)
+    args = parser.parse_args()
+    checkpoints = {n for n in (10, 50, 100, 250, 500, 1000, args.runs) if n <= args.runs}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        storages = {
+            "SqliteStorage": SqliteStorage(table_name="plain", db_file=os.path.join(tmp, "plain.db")),
+            "Compacting": CompactingSqliteStorage(
+                table_name="compacting", db_file=os.path.join(tmp, "compacting.db"), keep_runs=args.keep_runs
+            ),
+        }
+        for storage in storages.values():
+            storage.create()
+
+        print(f"{'runs':>6}" + "".join(f"{name + ' load':>22}{name + ' save':>22}" for name in storages))
+        for i in range(1, args.runs + 1):
+            timings = [turn(storage, i) for storage in storages.values()]
+            if i in checkpoints:
+                print(f"{i:>6}" + "".join(f"{load * 1000:>20.2f}ms{save * 1000:>20.2f}ms" for load, save in timings))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Peak memory and time to export every stored session.
+
+"fetchall" is the previous select(table) + fetchall(); the other rows stream
+through iter_sessions, with all columns and with only the catalog columns.
+
+    uv run python benchmarks/bench_session_export.py --sessions 20000
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+APP_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(APP_DIR / "src"))
+sys.path.insert(0, str(APP_DIR))
+
+from sqlalchemy import select  # noqa: E402
+
+from dbtest import get_engine, iter_sessions, reflect_table  # noqa: E402
+
+
+def populate(db_file: str, sessions: int, runs: int) -> None:
+    from agno.storage.session.agent import AgentSession
+    from agno.storage.sqlite import SqliteStorage
+
+    storage = SqliteStorage(table_name="agent_sessions", db_file=db_file)
+    storage.create()
+    history = [{"content": "x" * 1000, "messages": []} for _ in range(runs)]
+    for i in range(sessions):
+        storage.upsert(
+            AgentSession(
+                session_id=f"session-{i:06d}",
+                user_id=f"user-{i % 50}",
+                agent_id="agent",
+                memory={"runs": history},
+                session_data={},
+                extra_data={},
+                agent_data={},
+            )
+        )
+
+
+def fetchall_export(db_file: str) -> int:
+    engine = get_engine(db_file)
+    table = reflect_table(engine, "agent_sessions")
+    with engine.connect() as conn:
+        rows = [dict(row._mapping) for row in conn.execute(select(table)).fetchall()]
+    return len(rows)
+
+
+def measure(label: str, export) -> None:
+    tracemalloc.start()
+    started = time.perf_counter()
+    count = export()
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<28}{count:>10}{elapsed * 1000:>10.0f}ms{peak / 1e6:>12.1f}MB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sessions", type=int, default=10_000)
+    parser.add_argument("--runs", type=int, default=10, help="runs of history per session")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_file = os.path.join(tmp, "data.db")
+        populate(db_file, args.sessions, args.runs)
+
+        print(f"{'reader':<28}{'rows':>10}{'time':>12}{'peak memory':>12}")
+        measure("fetchall", lambda: fetchall_export(db_file))
+        measure("iter_sessions", lambda: sum(1 for _ in iter_sessions(db_file=db_file)))
+        columns = ["session_id", "user_id", "created_at", "updated_at"]
+        measure("iter_sessions (projected)", lambda: sum(1 for _ in iter_sessions(columns=columns, db_file=db_file)))
+
+
+if __name__ == "__main__":
+    main()
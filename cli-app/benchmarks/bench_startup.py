@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+CLI startup: time until the first prompt, and the session lookup it waits on.
+
+"first prompt" runs a fresh interpreter that imports the CLI and performs the
+last-session lookup that precedes the session prompt. The lookup rows compare
+the previous per-call engine + full-schema reflection with the cached engine
+registry, against a database of --sessions stored sessions.
+
+    uv run python benchmarks/bench_startup.py --sessions 5000
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+APP_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(APP_DIR / "src"))
+sys.path.insert(0, str(APP_DIR))
+
+from sqlalchemy import MetaData, create_engine, desc, select  # noqa: E402
+
+from dbtest import get_last_session_id_by_user  # noqa: E402
+
+
+def populate(db_file: str, sessions: int) -> None:
+    from agno.storage.session.agent import AgentSession
+    from agno.storage.sqlite import SqliteStorage
+
+    storage = SqliteStorage(table_name="agent_sessions", db_file=db_file)
+    storage.create()
+    runs = [{"content": "x" * 500, "messages": []} for _ in range(10)]
+    for i in range(sessions):
+        storage.upsert(
+            AgentSession(
+                session_id=f"session-{i}",
+                user_id=f"user-{i % 50}",
+                agent_id="agent",
+                memory={"runs": runs},
+                session_data={"session_name": f"Session {i}"},
+                extra_data={},
+                agent_data={},
+            )
+        )
+
+
+def legacy_lookup(user_id: str, db_file: str):
+    engine = create_engine(f"sqlite:///{db_file}")
+    metadata = MetaData()
+    metadata.reflect(bind=engine)
+    table = metadata.tables["agent_sessions"]
+    with engine.connect() as conn:
+        stmt = select(table.c.session_id).where(table.c.user_id == user_id).order_by(desc(table.c.updated_at)).limit(1)
+        row = conn.execute(stmt).fetchone()
+    engine.dispose()
+    return row[0] if row else None
+
+
+def timed_ms(func, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sessions", type=int, default=2000)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_file = os.path.join(tmp, "data.db")
+        populate(db_file, args.sessions)
+
+        script = (
+            "import time, cli\n"
+            "from dbtest import get_last_session_id_by_user\n"
+            f"get_last_session_id_by_user('user-1', db_file={db_file!r})\n"
+            "print(time.perf_counter())\n"
+        )
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join([str(APP_DIR / "src"), str(APP_DIR)]))
+        samples = []
+        for _ in range(args.runs):
+            started = time.perf_counter()
+            subprocess.run([sys.executable, "-c", script], cwd=APP_DIR, env=env, check=True, capture_output=True)
+            samples.append((time.perf_counter() - started) * 1000)
+
+        print(f"{args.sessions} stored sessions")
+        print(f"{'step':<36}{'median':>10}")
+        print(f"{'first prompt (fresh interpreter)':<36}{statistics.median(samples):>8.1f}ms")
+        print(f"{'lookup: new engine + full reflect':<36}{timed_ms(lambda: legacy_lookup('user-1', db_file), args.runs):>8.1f}ms")
+        first = timed_ms(lambda: get_last_session_id_by_user("user-1", db_file=db_file), 1)
+        print(f"{'lookup: registry, first call':<36}{first:>8.1f}ms")
+        cached = timed_ms(lambda: get_last_session_id_by_user("user-1", db_file=db_file), args.runs)
+        print(f"{'lookup: registry, cached':<36}{cached:>8.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
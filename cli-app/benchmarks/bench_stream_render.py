@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Render cost of a streamed reply, chunk by chunk.
+
+"full" re-parses and re-renders the whole reply on every chunk, which is what
+redrawing a single Markdown renderable in place costs; "incremental" is
+StreamingMarkdown, which prints finished blocks once and only redraws the tail.
+
+    uv run python benchmarks/bench_stream_render.py --paragraphs 60
+"""
+
+import argparse
+import io
+import sys
+import time
+from pathlib import Path
+
+APP_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(APP_DIR / "src"))
+sys.path.insert(0, str(APP_DIR))
+
+from rich.console import Console  # noqa: E402
+from rich.markdown import Markdown  # noqa: E402
+
+from ui import StreamingMarkdown  # noqa: E402
+
+
+def make_reply(paragraphs: int) -> str:
+    blocks = []
+    for i in range(paragraphs):
+        blocks.append(f"Paragraph {i}: " + "the quick brown fox jumps over the lazy dog " * 6)
+        if i % 10 == 0:
+            blocks.append("```python\n" + "print('hello')\n" * 15 + "```")
+        if i % 10 == 5:
+            blocks.append("\n".join(f"- item {j}" for j in range(5)))
+    return "\n\n".join(blocks)
+
+
+def chunks(text: str, size: int):
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+
+def full(text: str, size: int, console: Console) -> None:
+    reply = ""
+    for chunk in chunks(text, size):
+        reply += chunk
+        console.render_lines(Markdown(reply), console.options)
+
+
+def incremental(text: str, size: int, console: Console) -> None:
+    with StreamingMarkdown(console, refresh_per_second=1000) as stream:
+        for chunk in chunks(text, size):
+            stream.feed(chunk)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--paragraphs", type=int, default=40)
+    parser.add_argument("--chunk-size", type=int, default=16, help="characters per streamed chunk")
+    args = parser.parse_args()
+
+    text = make_reply(args.paragraphs)
+    print(f"reply: {len(text)} chars in {len(chunks(text, args.chunk_size))} chunks")
+    for label, render in (("full", full), ("incremental", incremental)):
+        console = Console(file=io.StringIO(), force_terminal=True, width=100, height=40)
+        started = time.perf_counter()
+        render(text, args.chunk_size, console)
+        print(f"{label:<12}{(time.perf_counter() - started) * 1000:>10.0f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Memory, time and output size of list_directory_tree formats on 10k and 100k node trees.
+
+"legacy json" is the original recursive-dict implementation; the other rows render
+from the FlatTree array representation.
+
+    uv run python benchmarks/bench_tree_output.py
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from tools.tree import render_tree  # noqa: E402
+
+
+def legacy_tree(root: Path, max_depth: int) -> str:
+    def build_tree(current_path: Path, current_depth: int) -> dict:
+        if current_depth > max_depth:
+            return {"name": current_path.name, "type": "directory", "truncated": True}
+        item_info = {
+            "name": current_path.name,
+            "path": str(current_path),
+            "type": "directory" if current_path.is_dir() else "file",
+        }
+        if current_path.is_dir():
+            item_info["children"] = [
+                build_tree(child, current_depth + 1)
+                for child in sorted(current_path.iterdir())
+                if not child.name.startswith(".")
+            ]
+        else:
+            item_info["size"] = current_path.stat().st_size
+        return item_info
+
+    return json.dumps(build_tree(root, 0), indent=2)
+
+
+def build_tree(root: Path, nodes: int) -> None:
+    # Three directory levels with 25 entries per leaf directory
+    count = 0
+    a = 0
+    while count < nodes:
+        for b in range(10):
+            leaf = root / f"service_{a:03d}" / f"module_{b:02d}"
+            leaf.mkdir(parents=True, exist_ok=True)
+            count += 1
+            for c in range(25):
+                (leaf / f"source_file_{c:02d}.py").write_bytes(b"x" * (c * 40))
+                count += 1
+        a += 1
+
+
+def measure(render):
+    tracemalloc.start()
+    started = time.perf_counter()
+    output = render()
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak, len(output.encode("utf-8"))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    args = parser.parse_args()
+
+    for nodes in args.sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp) / "tree"
+            build_tree(root, nodes)
+            print(f"\n~{nodes} nodes")
+            print(f"{'format':<14}{'time':>10}{'peak memory':>14}{'output':>12}")
+            renders = {
+                "legacy json": lambda: legacy_tree(root, 3),
+                "json": lambda: json.dumps(render_tree(str(root), 3, "json"), indent=2),
+                "text": lambda: render_tree(str(root), 3, "text"),
+                "paths": lambda: render_tree(str(root), 3, "paths"),
+            }
+            for name, render in renders.items():
+                elapsed, peak, size = measure(render)
+                print(f"{name:<14}{elapsed * 1000:>8.0f}ms{peak / 1e6:>12.1f}MB{size / 1e6:>10.2f}MB")
+
+
+if __name__ == "__main__":
+    main()
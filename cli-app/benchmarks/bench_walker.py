@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Syscall counts and timings for the FileTools directory operations: the previous
+iterdir()/rglob()/os.walk() + stat() implementations vs. the shared scan_tree walker.
+
+Syscall counts are collected with `strace -c -f` when strace is installed; timings
+are always reported.
+
+    uv run python benchmarks/bench_walker.py --files 20000
+"""
+
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parent.parent / "src"
+sys.path.insert(0, str(SRC))
+
+from tools.walk import scan_tree  # noqa: E402
+
+STAT_SYSCALLS = ("stat", "lstat", "fstat", "newfstatat", "statx")
+OPERATIONS = ("list_directory", "list_directory_tree", "get_directory_size", "walk_directory")
+
+
+def legacy(op: str, root: Path) -> int:
+    """The per-entry logic FileTools used before the scandir walker."""
+    count = 0
+    if op == "list_directory":
+        for item in root.iterdir():
+            item.stat()
+            item.is_dir()
+            item.is_file()
+            count += 1
+    elif op == "list_directory_tree":
+        def build(path: Path, depth: int) -> int:
+            if depth > 3:
+                return 1
+            n = 1
+            if path.is_dir():
+                for child in sorted(path.iterdir()):
+                    if not child.name.startswith("."):
+                        n += build(child, depth + 1)
+            else:
+                path.stat()
+            return n
+        count = build(root, 0)
+    elif op == "get_directory_size":
+        for item in root.rglob("*"):
+            if item.is_file():
+                item.stat()
+            elif item.is_dir():
+                pass
+            count += 1
+    elif op == "walk_directory":
+        for dirpath, dirs, files in os.walk(root):
+            for name in files:
+                (Path(dirpath) / name).stat()
+            count += len(dirs) + len(files)
+    return count
+
+
+def walker(op: str, root: Path) -> int:
+    count = 0
+    if op == "list_directory":
+        for entry, _ in scan_tree(root, max_depth=1):
+            entry.stat()
+            entry.is_dir()
+            entry.is_file()
+            count += 1
+    elif op == "list_directory_tree":
+        for entry, depth in scan_tree(root, max_depth=4, show_hidden=False, sort=True):
+            if depth <= 3 and not entry.is_dir():
+                entry.stat()
+            count += 1
+    else:
+        for entry, _ in scan_tree(root):
+            if entry.is_file():
+                entry.stat()
+            count += 1
+    return count
+
+
+def build_tree(root: Path, files: int) -> None:
+    for i in range(files):
+        d = root / f"d{i // 2000:02d}" / f"s{(i // 100) % 20:02d}"
+        if i % 100 == 0:
+            d.mkdir(parents=True, exist_ok=True)
+        (d / f"f{i}.txt").write_bytes(b"x" * (i % 512))
+
+
+def count_syscalls(impl: str, op: str, root: Path) -> dict:
+    with tempfile.NamedTemporaryFile(suffix=".strace") as out:
+        subprocess.run(
+            ["strace", "-f", "-c", "-o", out.name, sys.executable, __file__, "--run", impl, op, str(root)],
+            check=True,
+            stdout=subprocess.DEVNULL,
+        )
+        counts = {}
+        for line in Path(out.name).read_text().splitlines():
+            fields = line.split()
+            if len(fields) >= 5 and fields[3].isdigit():
+                counts[fields[-1]] = int(fields[3])
+        return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--files", type=int, default=20_000)
+    parser.add_argument("--run", nargs=3, metavar=("IMPL", "OP", "ROOT"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run:
+        impl, op, root = args.run
+        (legacy if impl == "legacy" else walker)(op, Path(root))
+        return
+
+    has_strace = shutil.which("strace") is not None
+    if not has_strace:
+        print("strace not found: reporting timings only\n")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        build_tree(root, args.files)
+
+        header = f"{'operation':<22}{'impl':<8}{'time':>10}"
+        if has_strace:
+            header += f"{'stat calls':>12}{'getdents':>10}"
+        print(header)
+        for op in OPERATIONS:
+            for name, impl in (("legacy", legacy), ("walker", walker)):
+                started = time.perf_counter()
+                impl(op, root)
+                line = f"{op:<22}{name:<8}{(time.perf_counter() - started) * 1000:>8.1f}ms"
+                if has_strace:
+                    counts = count_syscalls(name, op, root)
+                    stats = sum(counts.get(call, 0) for call in STAT_SYSCALLS)
+                    line += f"{stats:>12}{counts.get('getdents64', 0):>10}"
+                print(line)
+
+
+if __name__ == "__main__":
+    main()
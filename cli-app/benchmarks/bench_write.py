@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+save_file write paths: the old Path.write_text vs. the atomic WriteEngine.
+
+Small files: 1k saves with write_text (no durability), atomic + fsync per file,
+and group commit (one flush at the end). Large file: a single write_text of the
+whole string vs. streaming it through write_chunk.
+
+    uv run python benchmarks/bench_write.py --files 1000 --large-mb 1024
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from tools.write import WriteEngine  # noqa: E402
+
+CHUNK = 8 * 1024 * 1024
+
+
+def timed(label: str, func) -> None:
+    started = time.perf_counter()
+    func()
+    print(f"{label:<36}{(time.perf_counter() - started) * 1000:>10.1f}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--files", type=int, default=1000)
+    parser.add_argument("--large-mb", type=int, default=1024)
+    parser.add_argument("--dir", type=Path, help="scratch directory on the filesystem under test")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(dir=args.dir) as tmp:
+        tmp = Path(tmp)
+        contents = "key: value\n" * 20
+        for name in ("plain", "atomic", "group"):
+            (tmp / name).mkdir()
+
+        def plain():
+            for i in range(args.files):
+                (tmp / "plain" / f"{i}.yaml").write_text(contents)
+
+        def atomic():
+            engine = WriteEngine()
+            for i in range(args.files):
+                engine.write(str(tmp / "atomic" / f"{i}.yaml"), contents)
+
+        def group():
+            engine = WriteEngine(group_commit=True, max_pending=args.files)
+            for i in range(args.files):
+                engine.write(str(tmp / "group" / f"{i}.yaml"), contents)
+            engine.flush()
+
+        print(f"{args.files} small files")
+        timed("write_text (no fsync)", plain)
+        timed("atomic, fsync per file", atomic)
+        timed("atomic, group commit", group)
+
+        large = "x" * (args.large_mb * 1024 * 1024)
+        print(f"\none {args.large_mb} MB file")
+        timed("write_text (no fsync)", lambda: (tmp / "large.plain").write_text(large))
+
+        def streamed():
+            engine = WriteEngine()
+            target = str(tmp / "large.stream")
+            for offset in range(0, len(large), CHUNK):
+                engine.write_chunk(target, large[offset:offset + CHUNK], final=offset + CHUNK >= len(large))
+
+        timed("write_chunk stream + fsync", streamed)
+
+
+if __name__ == "__main__":
+    main()
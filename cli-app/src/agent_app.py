@@ -3,22 +3,50 @@ from agno.agent import Agent
 from agno.tools.shell import ShellTools
 from agno.tools.docker import DockerTools
 from agno.tools.python import PythonTools
-from agno.storage.sqlite import SqliteStorage
 from pathlib import Path
 from tools.file import FileTools
+from tools.history import SessionHistoryTools
+from tools.lazy import LazyToolkit
+from tools.parallel import with_concurrent_tool_calls
+from storage import CompactingSqliteStorage
 
-from constant import DB_FILE, TABLE_NAME
+from constant import DB_FILE, TABLE_NAME, FILE_INDEX_DIR
 
-def create_agent(model, base_dir="/", user_id=None, session_id=None,):
+# DockerTools connects to the daemon in its constructor, so it is only built when first called
+DOCKER_TOOL_NAMES = [
+    "list_containers", "start_container", "stop_container", "remove_container", "get_container_logs",
+    "inspect_container", "run_container", "exec_in_container",
+    "list_images", "pull_image", "remove_image", "build_image", "tag_image", "inspect_image",
+    "list_volumes", "create_volume", "remove_volume", "inspect_volume",
+    "list_networks", "create_network", "remove_network", "inspect_network",
+    "connect_container_to_network", "disconnect_container_from_network",
+]
+
+def create_agent(model, base_dir="/", user_id=None, session_id=None, concurrent_tools=False, tool_workers=8):
     print("Creating agent...")
+    if concurrent_tools:
+        # Independent tool calls of one model turn run together; writes stay in order
+        model = with_concurrent_tool_calls(model, max_workers=tool_workers)
     print(f"""userid: {user_id}, sessionid: {session_id}""")
+    # Old runs are archived out of the session row; the agent sees a digest of them instead
+    storage = CompactingSqliteStorage(table_name=TABLE_NAME, db_file=DB_FILE, keep_runs=20)
+    history_summary = storage.get_history_summary(session_id) if session_id else None
+    if history_summary:
+        history_summary += "\nUse read_archived_runs or search_archived_runs for the full text of these runs."
     return Agent(
         name="DevOps Automation Specialist",
         model=model,
         tools=[
             ShellTools(base_dir=Path(base_dir) if base_dir else None),
-            FileTools(base_dir=Path(base_dir) if base_dir else None),
-            DockerTools(
+            FileTools(
+                base_dir=Path(base_dir) if base_dir else None,
+                index_dir=Path(FILE_INDEX_DIR),
+                table_output=True,
+            ),
+            LazyToolkit(
+                DockerTools,
+                DOCKER_TOOL_NAMES,
+                name="docker_tools",
                 enable_image_management=True,
                 enable_container_management=True,
                 enable_network_management=True,
@@ -32,6 +60,7 @@ def create_agent(model, base_dir="/", user_id=None, session_id=None,):
                 run_code=True,
                 run_files=True,
             ),
+            SessionHistoryTools(storage),
         ],
         instructions=dedent("""\
         You are an Autonomous DevOps Specialist with deep expertise in system administration, development, and infrastructure automation.
@@ -81,10 +110,8 @@ def create_agent(model, base_dir="/", user_id=None, session_id=None,):
         stream=True,
         user_id=user_id,
         session_id=session_id,
-        storage=SqliteStorage(
-        table_name=TABLE_NAME, db_file=DB_FILE
-        
-    ),
+        storage=storage,
+        additional_context=history_summary,
         add_history_to_messages=True,
         num_history_responses=2,
         num_history_runs=2
@@ -1,9 +1,12 @@
 import os
 from rich.prompt import Prompt
-from ui import console, show_message, show_response
+from ui import console, show_message, show_run_metrics, show_stats, StreamingMarkdown
+from telemetry import MetricsStore, RunTelemetry, toolkit_names
 
 def chat_loop(agent, current_dir):
     """Main chat loop"""
+    metrics_store = MetricsStore()
+    toolkits = toolkit_names(agent)
     while True:
         try:
             user_message = Prompt.ask("[bold cyan]You[/bold cyan]", console=console)
@@ -14,37 +17,37 @@ def chat_loop(agent, current_dir):
             if user_message.lower() in ["exit", "quit", "bye"]:
                 console.print("👋 Goodbye!", style="cyan bold")
                 break
+
+            if user_message.strip().lower() in ["/stats", "/stats all"]:
+                try:
+                    session_id = None if user_message.strip().lower() == "/stats all" else agent.session_id
+                    show_stats(metrics_store.session_stats(session_id))
+                except Exception as stats_error:
+                    console.print(f"❌ Could not read stats: {stats_error}", style="red")
+                continue
             
             context_message = f"Current working directory: {current_dir}\n\nUser message: {user_message}"
             
             show_message(user_message)
             console.print("🤔 Agent thinking...", style="yellow")
             
+            telemetry = RunTelemetry(agent, toolkits)
             try:
-                response_content = ""
-                run_metrics=""
-                stream_lines = 0
-                
-                for res in agent.run(user_message, stream=True):
-                    if hasattr(res, 'content') and res.content:
-                        response_content += res.content
-                        print(res.content, end="", flush=True)
-                        stream_lines += res.content.count('\n')
-                        
-                        if hasattr(res, 'event') and res.event == "RunCompleted":
-                            # RunCompleted events may contain final metrics
-                            if hasattr(res, 'metrics'):
-                                run_metrics = res.metrics
-                    
-                # Clear streaming output
-                print(f"\033[{stream_lines + 1}A\033[J", end="")
+                console.rule("🤖 Agent Response", style="blue")
+                with StreamingMarkdown(console) as stream:
+                    for res in agent.run(user_message, stream=True, stream_intermediate_steps=True):
+                        telemetry.observe(res)
+                        # Tool events carry content too (the tool result); only the reply is shown
+                        if getattr(res, 'event', None) == "RunResponseContent" and res.content:
+                            stream.feed(str(res.content))
                 
-                # Show formatted response
                 # console.print(f"""userid {agent.user_id}.. session: {agent.session_id}""", style="red")
-                show_response(response_content, run_metrics)
+                show_run_metrics(telemetry.finish(), telemetry.tools)
                 
             except Exception as agent_error:
+                telemetry.finish(error=True)
                 console.print(f"❌ Agent error: {agent_error}", style="red")
+            metrics_store.try_save(telemetry)
             
             console.print()
             console.print("[dim]Ready for next message...[/dim]")
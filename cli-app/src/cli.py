@@ -7,20 +7,26 @@ import os
 import sys
 import signal
 from dotenv import load_dotenv
-from agent_app import create_agent
 from src.ui import console, select_model, show_welcome, get_or_create_user, select_session_mode
-from chat import chat_loop
 # from session import get_storage
-from dbtest import get_last_session_id_by_user
 from session import create_session_id
 
 load_dotenv(".env")
 
+STARTUP_PROBE_ENV = "CLI_STARTUP_PROBE"
+
 def signal_handler(sig, frame):
     console.print("\n👋 Goodbye!", style="cyan bold")
     sys.exit(0)
 
 def main():
+    if "--profile-startup" in sys.argv[1:]:
+        from profiling import profile_startup
+        sys.exit(profile_startup(__file__))
+    if os.environ.get(STARTUP_PROBE_ENV):
+        # Child process of --profile-startup: stop where the first prompt would appear
+        return
+
     signal.signal(signal.SIGINT, signal_handler)
     
     current_dir = os.environ.get('ORIGINAL_PWD', os.getcwd())
@@ -34,6 +40,8 @@ def main():
         
         # Session setup
         try:
+            from dbtest import get_last_session_id_by_user
+
             last_session = get_last_session_id_by_user(user_id)
             if last_session:
                 console.print(f"Last session ID: {last_session}", style="yellow")
@@ -46,12 +54,15 @@ def main():
         
         # storage = get_storage()
         
-        # Create agent
+        # Create agent (agno and the toolkits are imported only now, after the prompts)
+        from agent_app import create_agent
+
         agent = create_agent(
             model=model, 
             base_dir=current_dir,
             user_id=user_id,
             session_id=session_id,
+            concurrent_tools="--concurrent-tools" in sys.argv[1:],
         )
         console.print("✅ Agent initialized successfully", style="green")
         
@@ -59,6 +70,8 @@ def main():
         console.print(f"❌ Failed to initialize agent: {e}", style="red")
         sys.exit(1)
     
+    from chat import chat_loop
+
     show_welcome(current_dir, model_name)
     chat_loop(agent, current_dir)
 
@@ -1,3 +1,4 @@
 DB_FILE="tmp/cli-agent/data.db"
 TABLE_NAME="agent_sessions"
 USER_FILE="/tmp/cli-agent/user.json"
+FILE_INDEX_DIR="/tmp/cli-agent/file-index"
@@ -1,62 +1,189 @@
-from sqlalchemy import create_engine, MetaData, Table, select, desc, and_
+import threading
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Sequence, Tuple
+
+from sqlalchemy import create_engine, event, MetaData, Table, select, desc, and_
 from sqlalchemy.engine import Engine
+from sqlalchemy.exc import NoSuchTableError
 from src.constant import DB_FILE, TABLE_NAME
 from agno.storage.sqlite import SqliteStorage
 
+# One engine (and its connection pool) per database file, shared by the whole process
+_engines: Dict[str, Engine] = {}
+# Reflected tables keyed by (database file, table name)
+_tables: Dict[Tuple[str, str], Table] = {}
+_registry_lock = threading.Lock()
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    # WAL lets the CLI read sessions while the agent's storage is writing them
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA busy_timeout=5000")
+    cursor.close()
+
 def get_engine(db_file: str = DB_FILE) -> Engine:
-    return create_engine(f"sqlite:///{db_file}")
+    db_path = str(Path(db_file).resolve())
+    with _registry_lock:
+        engine = _engines.get(db_path)
+        if engine is None:
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+            engine = create_engine(f"sqlite:///{db_path}", pool_size=5, max_overflow=5)
+            event.listen(engine, "connect", _set_sqlite_pragmas)
+            _engines[db_path] = engine
+    return engine
 
 def reflect_table(engine: Engine, table_name: str) -> Table:
-    metadata = MetaData()
-    metadata.reflect(bind=engine)
-    if table_name not in metadata.tables:
-        SqliteStorage(
-        table_name=TABLE_NAME, db_file=DB_FILE
-        
-    ),
-        # raise ValueError(f"Table '{table_name}' not found in the database.")
-    return metadata.tables[table_name]
-
-def read_all_sessions(db_file: str = DB_FILE, table_name: str = TABLE_NAME):
-    """Read all records from the session table."""
+    key = (str(engine.url), table_name)
+    table = _tables.get(key)
+    if table is not None:
+        return table
+    try:
+        # Reflect only the table we need, not the whole schema
+        table = Table(table_name, MetaData(), autoload_with=engine)
+    except NoSuchTableError:
+        SqliteStorage(table_name=table_name, db_file=engine.url.database).create()
+        table = Table(table_name, MetaData(), autoload_with=engine)
+    with _registry_lock:
+        return _tables.setdefault(key, table)
+
+def catalog_table_name(table_name: str) -> str:
+    return f"{table_name}_catalog"
+
+def ensure_session_catalog(engine: Engine, table_name: str = TABLE_NAME) -> Table:
+    """Creates the session catalog for `table_name` and returns it.
+
+    The catalog holds one small row per session (ids, title and timestamps) and is
+    kept in sync by triggers, so listing or resuming sessions never reads the
+    memory/runs JSON. Both tables get a (user_id, updated_at DESC) index.
+    """
+    catalog = catalog_table_name(table_name)
+    key = (str(engine.url), catalog)
+    if key in _tables:
+        return _tables[key]
+
+    reflect_table(engine, table_name)
+    row = """NEW.session_id, NEW.user_id,
+            CASE WHEN json_valid(NEW.session_data) THEN json_extract(NEW.session_data, '$.session_name') END,
+            NEW.created_at, COALESCE(NEW.updated_at, NEW.created_at)"""
+    with engine.begin() as conn:
+        exists = conn.exec_driver_sql(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (catalog,)
+        ).first()
+        conn.exec_driver_sql(
+            f'CREATE INDEX IF NOT EXISTS "idx_{table_name}_user_updated" '
+            f'ON "{table_name}" (user_id, updated_at DESC)'
+        )
+        conn.exec_driver_sql(
+            f'CREATE TABLE IF NOT EXISTS "{catalog}" ('
+            "session_id TEXT PRIMARY KEY, user_id TEXT, title TEXT, created_at INTEGER, updated_at INTEGER)"
+        )
+        conn.exec_driver_sql(
+            f'CREATE INDEX IF NOT EXISTS "idx_{catalog}_user_updated" ON "{catalog}" (user_id, updated_at DESC)'
+        )
+        for event_name in ("INSERT", "UPDATE"):
+            conn.exec_driver_sql(
+                f'CREATE TRIGGER IF NOT EXISTS "trg_{catalog}_{event_name.lower()}" '
+                f'AFTER {event_name} ON "{table_name}" BEGIN '
+                # An upsert, since OR REPLACE in a trigger yields to the outer statement's conflict policy
+                f'INSERT INTO "{catalog}" VALUES ({row}) ON CONFLICT (session_id) DO UPDATE SET '
+                "user_id = excluded.user_id, title = excluded.title, "
+                "created_at = excluded.created_at, updated_at = excluded.updated_at; END"
+            )
+        conn.exec_driver_sql(
+            f'CREATE TRIGGER IF NOT EXISTS "trg_{catalog}_delete" AFTER DELETE ON "{table_name}" BEGIN '
+            f'DELETE FROM "{catalog}" WHERE session_id = OLD.session_id; END'
+        )
+        if not exists:
+            # Backfill sessions stored before the catalog existed
+            conn.exec_driver_sql(
+                f'INSERT OR REPLACE INTO "{catalog}" SELECT {row.replace("NEW.", "")} FROM "{table_name}"'
+            )
+    table = Table(catalog, MetaData(), autoload_with=engine)
+    with _registry_lock:
+        return _tables.setdefault(key, table)
+
+def iter_sessions(
+    session_id: str = None,
+    user_id: str = None,
+    columns: Optional[Sequence[str]] = None,
+    page_size: int = 500,
+    db_file: str = DB_FILE,
+    table_name: str = TABLE_NAME,
+) -> Iterator[dict]:
+    """Yield session rows one at a time, optionally only the given columns.
+
+    Rows are read in session_id order, one page per short-lived query (keyset
+    pagination), and streamed from the cursor, so memory use stays flat however
+    many sessions there are and writers are never blocked for the whole export.
+    """
     engine = get_engine(db_file)
     table = reflect_table(engine, table_name)
 
-    with engine.connect() as conn:
-        stmt = select(table)
-        results = conn.execute(stmt).fetchall()
-        return [dict(row._mapping) for row in results]
+    selected = [table.c[name] for name in columns] if columns else list(table.c)
+    # The keyset needs session_id even when the caller did not ask for it
+    drop_key = all(col.name != "session_id" for col in selected)
+    if drop_key:
+        selected.append(table.c.session_id)
+
+    filters = []
+    if session_id:
+        filters.append(table.c.session_id == session_id)
+    if user_id:
+        filters.append(table.c.user_id == user_id)
+
+    last_key = None
+    while True:
+        stmt = select(*selected).order_by(table.c.session_id).limit(page_size)
+        page_filters = filters + ([table.c.session_id > last_key] if last_key is not None else [])
+        if page_filters:
+            stmt = stmt.where(and_(*page_filters))
+
+        count = 0
+        with engine.connect() as conn:
+            for row in conn.execution_options(yield_per=min(page_size, 100)).execute(stmt):
+                record = dict(row._mapping)
+                last_key = record.pop("session_id") if drop_key else record["session_id"]
+                count += 1
+                yield record
+        if count < page_size:
+            return
+
+def read_all_sessions(db_file: str = DB_FILE, table_name: str = TABLE_NAME, columns: Optional[Sequence[str]] = None):
+    """Read all records from the session table."""
+    return list(iter_sessions(columns=columns, db_file=db_file, table_name=table_name))
 
-def read_sessions(session_id: str = None, user_id: str = None, db_file: str = DB_FILE, table_name: str = TABLE_NAME):
+def read_sessions(
+    session_id: str = None,
+    user_id: str = None,
+    db_file: str = DB_FILE,
+    table_name: str = TABLE_NAME,
+    columns: Optional[Sequence[str]] = None,
+):
     """Read session(s) by session_id or user_id (or both)."""
+    return list(iter_sessions(session_id, user_id, columns=columns, db_file=db_file, table_name=table_name))
+
+def list_sessions(user_id: str = None, limit: int = 50, db_file: str = DB_FILE, table_name: str = TABLE_NAME):
+    """List sessions (id, title, timestamps) from the catalog, most recently updated first."""
     engine = get_engine(db_file)
-    table = reflect_table(engine, table_name)
+    catalog = ensure_session_catalog(engine, table_name)
 
     with engine.connect() as conn:
-        stmt = select(table)
-
-        filters = []
-        if session_id:
-            filters.append(table.c.session_id == session_id)
+        stmt = select(catalog).order_by(desc(catalog.c.updated_at)).limit(limit)
         if user_id:
-            filters.append(table.c.user_id == user_id)
-
-        if filters:
-            stmt = stmt.where(and_(*filters))
-
-        results = conn.execute(stmt).fetchall()
-        return [dict(row._mapping) for row in results]
+            stmt = stmt.where(catalog.c.user_id == user_id)
+        return [dict(row._mapping) for row in conn.execute(stmt)]
 
 def get_last_session_id_by_user(user_id: str, db_file: str = DB_FILE, table_name: str = TABLE_NAME):
     """Get the latest session_id for a given user_id based on updated_at timestamp."""
     engine = get_engine(db_file)
-    table = reflect_table(engine, table_name)
+    catalog = ensure_session_catalog(engine, table_name)
 
     with engine.connect() as conn:
         stmt = (
-            select(table.c.session_id)
-            .where(table.c.user_id == user_id)
-            .order_by(desc(table.c.updated_at))  # Or desc(table.c.created_at)
+            select(catalog.c.session_id)
+            .where(catalog.c.user_id == user_id)
+            .order_by(desc(catalog.c.updated_at))
             .limit(1)
         )
         result = conn.execute(stmt).fetchone()
@@ -1,19 +1,20 @@
-from agno.models.ollama import Ollama
-from agno.models.aws import Claude, AwsBedrock
-from agno.models.groq import Groq
-from agno.models.openrouter import OpenRouter
-
+from importlib import import_module
 
+# Provider classes are named as (module, class) and only imported once a model is chosen;
+# importing every provider SDK up front dominated CLI startup time.
 def get_available_models():
     return {
-        "1": {"class": Ollama, "id": "hf.co/hrsvrn/linux-command-generator-llama3.2-1b:Q4_K_M", "name": "Qwen3 (Ollama)"},
-        "2": {"class": Claude, "id": "apac.anthropic.claude-sonnet-4-20250514-v1:0", "name": "Claude Sonnet 4"},
-        "3": {"class": AwsBedrock, "id": "apac.amazon.nova-pro-v1:0", "name": "Nova Pro"},
-        "4": {"class": Groq, "id": "qwen/qwen3-32b", "name": "Groq"},
-        "5": {"class": OpenRouter, "id": "openai/gpt-4.1", "name": "GPT"} 
+        "1": {"module": "agno.models.ollama", "class": "Ollama", "id": "hf.co/hrsvrn/linux-command-generator-llama3.2-1b:Q4_K_M", "name": "Qwen3 (Ollama)"},
+        "2": {"module": "agno.models.aws", "class": "Claude", "id": "apac.anthropic.claude-sonnet-4-20250514-v1:0", "name": "Claude Sonnet 4"},
+        "3": {"module": "agno.models.aws", "class": "AwsBedrock", "id": "apac.amazon.nova-pro-v1:0", "name": "Nova Pro"},
+        "4": {"module": "agno.models.groq", "class": "Groq", "id": "qwen/qwen3-32b", "name": "Groq"},
+        "5": {"module": "agno.models.openrouter", "class": "OpenRouter", "id": "openai/gpt-4.1", "name": "GPT"} 
     }
 
+def load_model_class(model_config):
+    return getattr(import_module(model_config["module"]), model_config["class"])
+
 def create_model(choice):
     models = get_available_models()
     model_config = models[choice]
-    return model_config["class"](id=model_config["id"]), model_config["name"]
\ No newline at end of file
+    return load_model_class(model_config)(id=model_config["id"]), model_config["name"]
\ No newline at end of file
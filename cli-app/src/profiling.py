@@ -0,0 +1,74 @@
+"""
+Startup profiling for the CLI (`my-cli --profile-startup`).
+
+Re-runs the CLI under `python -X importtime` in probe mode, where it exits right
+before the first prompt, and reports the time to that point plus the modules
+that cost the most to import.
+"""
+
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import List, Tuple
+
+TARGET_MS = 300
+TOP_MODULES = 15
+
+ImportRecord = Tuple[str, int, int, int]  # (module, depth, self us, cumulative us)
+
+
+def parse_importtime(stderr: str) -> List[ImportRecord]:
+    records: List[ImportRecord] = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        try:
+            self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+            depth = (len(name) - len(name.lstrip())) // 2
+            records.append((name.strip(), depth, int(self_us), int(cumulative_us)))
+        except ValueError:
+            continue
+    return records
+
+
+def profile_startup(cli_path: str, runs: int = 3) -> int:
+    """Prints the startup report and returns the exit code for the CLI."""
+    from src.ui import console
+
+    src_dir = Path(cli_path).resolve().parent
+    env = dict(os.environ, CLI_STARTUP_PROBE="1")
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(src_dir), str(src_dir.parent), env.get("PYTHONPATH")]))
+
+    wall_ms = []
+    stderr = ""
+    for run in range(runs):
+        args = [sys.executable] + (["-X", "importtime"] if run == 0 else []) + [str(src_dir / "cli.py")]
+        started = time.perf_counter()
+        proc = subprocess.run(args, env=env, capture_output=True, text=True)
+        elapsed = (time.perf_counter() - started) * 1000
+        if proc.returncode != 0:
+            console.print(proc.stderr, style="red")
+            return proc.returncode
+        if run == 0:
+            stderr = proc.stderr
+        else:
+            # The -X importtime run pays for its own bookkeeping, so only later runs are timed
+            wall_ms.append(elapsed)
+
+    records = parse_importtime(stderr)
+    first_prompt = min(wall_ms) if wall_ms else 0.0
+    top_level = sorted((r for r in records if r[1] == 0), key=lambda r: r[3], reverse=True)
+    by_self = sorted(records, key=lambda r: r[2], reverse=True)
+
+    status = "✅" if first_prompt <= TARGET_MS else "⚠️"
+    console.print(f"{status} [bold]Time to first prompt:[/bold] {first_prompt:.0f} ms (target {TARGET_MS} ms)")
+    console.print(f"Modules imported: {len(records)}, total import time {sum(r[2] for r in records) / 1000:.0f} ms\n")
+    console.print("[bold]Top-level imports by cumulative time[/bold]")
+    for name, _, _, cumulative in top_level[:TOP_MODULES]:
+        console.print(f"  {cumulative / 1000:>8.1f} ms  {name}")
+    console.print("\n[bold]Modules by own import time[/bold]")
+    for name, _, own, _ in by_self[:TOP_MODULES]:
+        console.print(f"  {own / 1000:>8.1f} ms  {name}")
+    return 0
@@ -2,7 +2,6 @@ import os
 import json
 import uuid
 from pathlib import Path
-from agno.storage.sqlite import SqliteStorage
 from src.constant import DB_FILE, TABLE_NAME, USER_FILE
 
 def ensure_tmp_dir():
@@ -32,8 +31,10 @@ def create_session_id():
 
 def get_storage():
     """Get SQLite storage instance"""
+    from src.storage import CompactingSqliteStorage
+
     ensure_tmp_dir()
-    return SqliteStorage(table_name="agent_sessions", db_file=DB_FILE)
+    return CompactingSqliteStorage(table_name=TABLE_NAME, db_file=DB_FILE)
 
 # def get_user_sessions(user_id):
 #     """Get all sessions for a user"""
@@ -0,0 +1,204 @@
+import hashlib
+import json
+import time
+from typing import Any, Dict, Iterator, List, Optional, Set
+
+from agno.storage.session import Session
+from agno.storage.sqlite import SqliteStorage
+from agno.utils.log import log_debug, log_warning
+from sqlalchemy import Column, Index, Integer, String, Table, Text, UniqueConstraint, delete, select
+from sqlalchemy.dialects import sqlite
+
+DIGEST_CHARS = 160
+
+
+def _run_id(run: Dict[str, Any]) -> str:
+    # Memory v2 stores RunResponse dicts, AgentMemory v1 nests the response
+    run_id = run.get("run_id") or (run.get("response") or {}).get("run_id")
+    if run_id:
+        return str(run_id)
+    return hashlib.sha1(json.dumps(run, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def _text(value: Any) -> str:
+    if isinstance(value, list):
+        value = " ".join(part.get("text", "") if isinstance(part, dict) else str(part) for part in value)
+    text = " ".join(str(value or "").split())
+    return text if len(text) <= DIGEST_CHARS else text[: DIGEST_CHARS - 1] + "…"
+
+
+def _user_message(run: Dict[str, Any]) -> Any:
+    user_message = (run.get("message") or {}).get("content")
+    if user_message is None:
+        for message in run.get("messages") or []:
+            if message.get("role") == "user":
+                user_message = message.get("content")
+    return user_message
+
+
+def run_digest(run: Dict[str, Any]) -> str:
+    """One line per archived run: what was asked and how it was answered."""
+    response = run.get("response") or run
+    return f"- user: {_text(_user_message(run))} | assistant: {_text(response.get('content'))}"
+
+
+def run_exchange(run: Dict[str, Any]) -> Dict[str, Any]:
+    """The full question and answer of an archived run, without its tool calls and metrics."""
+    response = run.get("response") or run
+    return {
+        "run_id": _run_id(run),
+        "created_at": response.get("created_at"),
+        "user": _user_message(run),
+        "assistant": response.get("content"),
+    }
+
+
+class CompactingSqliteStorage(SqliteStorage):
+    """SqliteStorage that keeps session rows small as sessions grow.
+
+    On every save, all but the last `keep_runs` runs move from the session's
+    memory into an append-only archive table, and a rolling digest of the
+    archived runs is kept in a summary table. Loading a session therefore only
+    reads the recent runs; archived runs are read on demand.
+    """
+
+    def __init__(self, *args, keep_runs: int = 20, summary_runs: int = 50, **kwargs):
+        self.keep_runs = keep_runs
+        self.summary_runs = summary_runs
+        super().__init__(*args, **kwargs)
+        self.archive_table = Table(
+            f"{self.table_name}_run_archive",
+            self.metadata,
+            Column("id", Integer, primary_key=True, autoincrement=True),
+            Column("session_id", String, nullable=False),
+            Column("run_id", String, nullable=False),
+            Column("archived_at", Integer, nullable=False),
+            Column("run", sqlite.JSON),
+            UniqueConstraint("session_id", "run_id"),
+            Index(f"idx_{self.table_name}_run_archive_session", "session_id", "id"),
+            extend_existing=True,
+        )
+        self.summary_table = Table(
+            f"{self.table_name}_run_summary",
+            self.metadata,
+            Column("session_id", String, primary_key=True),
+            Column("archived_runs", Integer, nullable=False),
+            Column("summary", Text),
+            Column("updated_at", Integer),
+            extend_existing=True,
+        )
+        self._archive_ready = False
+        # run ids already archived, per session, loaded the first time a session compacts
+        self._archived_ids: Dict[str, Set[str]] = {}
+
+    def create(self) -> None:
+        super().create()
+        self._create_archive()
+
+    def _create_archive(self) -> None:
+        if not self._archive_ready:
+            self.archive_table.create(self.db_engine, checkfirst=True)
+            self.summary_table.create(self.db_engine, checkfirst=True)
+            self._archive_ready = True
+
+    def _compact(self, session: Session) -> None:
+        memory = session.memory or {}
+        runs = memory.get("runs")
+        if not runs or len(runs) <= self.keep_runs:
+            return
+
+        split = len(runs) - self.keep_runs
+        recent = runs[split:]
+        self._create_archive()
+        archived_ids = self._archived_run_ids(session.session_id)
+        # Runs from earlier in this process may have been archived by a previous save already
+        candidates = ((_run_id(run), run) for run in runs[:split])
+        archived = [(run_id, run) for run_id, run in candidates if run_id not in archived_ids]
+        if archived:
+            now = int(time.time())
+            with self.db_engine.begin() as conn:
+                rows = [
+                    {"session_id": session.session_id, "run_id": run_id, "archived_at": now, "run": run}
+                    for run_id, run in archived
+                ]
+                conn.execute(sqlite.insert(self.archive_table).on_conflict_do_nothing(), rows)
+                row = conn.execute(
+                    select(self.summary_table).where(self.summary_table.c.session_id == session.session_id)
+                ).first()
+                lines = (row.summary.splitlines() if row and row.summary else []) + [run_digest(r) for _, r in archived]
+                values = {
+                    "archived_runs": (row.archived_runs if row else 0) + len(archived),
+                    "summary": "\n".join(lines[-self.summary_runs:]),
+                    "updated_at": now,
+                }
+                conn.execute(
+                    sqlite.insert(self.summary_table)
+                    .values(session_id=session.session_id, **values)
+                    .on_conflict_do_update(index_elements=["session_id"], set_=values)
+                )
+            archived_ids.update(run_id for run_id, _ in archived)
+            log_debug(f"Archived {len(archived)} runs of session {session.session_id}")
+        # A new dict, so the agent's own memory object is left untouched
+        session.memory = {**memory, "runs": recent}
+
+    def _archived_run_ids(self, session_id: str) -> Set[str]:
+        if session_id not in self._archived_ids:
+            stmt = select(self.archive_table.c.run_id).where(self.archive_table.c.session_id == session_id)
+            with self.db_engine.connect() as conn:
+                self._archived_ids[session_id] = set(conn.execute(stmt).scalars())
+        return self._archived_ids[session_id]
+
+    def upsert(self, session: Session, create_and_retry: bool = True) -> Optional[Session]:
+        try:
+            self._compact(session)
+        except Exception as e:
+            # Never lose a save over compaction; the row just stays large until the next one
+            log_warning(f"Session compaction failed: {e}")
+        return super().upsert(session, create_and_retry=create_and_retry)
+
+    def iter_archived_runs(self, session_id: str, newest_first: bool = False) -> Iterator[Dict[str, Any]]:
+        """Yields the archived runs of a session in the order they were archived."""
+        self._create_archive()
+        order = self.archive_table.c.id.desc() if newest_first else self.archive_table.c.id
+        stmt = select(self.archive_table.c.run).where(self.archive_table.c.session_id == session_id).order_by(order)
+        with self.db_engine.connect() as conn:
+            for row in conn.execution_options(yield_per=50).execute(stmt):
+                yield row.run
+
+    def read_archived_runs(self, session_id: str, offset: int = 0, limit: int = 50) -> List[Dict[str, Any]]:
+        """A page of archived runs, oldest first."""
+        self._create_archive()
+        stmt = (
+            select(self.archive_table.c.run)
+            .where(self.archive_table.c.session_id == session_id)
+            .order_by(self.archive_table.c.id)
+            .offset(offset)
+            .limit(limit)
+        )
+        with self.db_engine.connect() as conn:
+            return [row.run for row in conn.execute(stmt)]
+
+    def get_history_summary(self, session_id: str) -> Optional[str]:
+        """The rolling digest of a session's archived runs, or None if nothing was archived."""
+        self._create_archive()
+        with self.db_engine.connect() as conn:
+            row = conn.execute(
+                select(self.summary_table).where(self.summary_table.c.session_id == session_id)
+            ).first()
+        if row is None:
+            return None
+        shown = len(row.summary.splitlines()) if row.summary else 0
+        header = f"{row.archived_runs} earlier runs of this session are archived"
+        if shown < row.archived_runs:
+            header += f"; the latest {shown} are summarized"
+        return f"{header}:\n{row.summary}"
+
+    def delete_session(self, session_id: Optional[str] = None):
+        super().delete_session(session_id)
+        if session_id is None:
+            return
+        self._create_archive()
+        with self.db_engine.begin() as conn:
+            conn.execute(delete(self.archive_table).where(self.archive_table.c.session_id == session_id))
+            conn.execute(delete(self.summary_table).where(self.summary_table.c.session_id == session_id))
+        self._archived_ids.pop(session_id, None)
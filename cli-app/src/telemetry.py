@@ -0,0 +1,214 @@
+"""
+Per-run latency and token telemetry for the chat loop.
+
+A RunTelemetry watches the event stream of one `agent.run(...,
+stream_intermediate_steps=True)` and records time to first token, total
+latency, output tokens per second and the duration of every tool call. Finished
+runs go to two tables in the CLI's SQLite database, and `session_stats`
+summarises them as percentiles for the `/stats` command.
+"""
+
+import time
+import uuid
+from typing import Any, Dict, List, Optional, Sequence
+
+from agno.utils.log import log_debug, log_warning
+from sqlalchemy import Boolean, Column, Float, Index, Integer, MetaData, String, Table, select
+from sqlalchemy.dialects import sqlite
+
+from constant import DB_FILE
+from dbtest import get_engine
+
+PERCENTILES = (50, 90, 99)
+
+_metadata = MetaData()
+run_metrics_table = Table(
+    "run_metrics",
+    _metadata,
+    Column("run_id", String, primary_key=True),
+    Column("session_id", String),
+    Column("user_id", String),
+    Column("model", String),
+    Column("started_at", Float, nullable=False),
+    Column("ttft_ms", Float),
+    Column("total_ms", Float, nullable=False),
+    Column("input_tokens", Integer),
+    Column("output_tokens", Integer),
+    Column("tokens_per_sec", Float),
+    Column("tool_calls", Integer, nullable=False),
+    Column("error", Boolean, nullable=False, default=False),
+    Index("idx_run_metrics_session", "session_id", "started_at"),
+)
+tool_metrics_table = Table(
+    "tool_metrics",
+    _metadata,
+    Column("id", Integer, primary_key=True, autoincrement=True),
+    Column("run_id", String, nullable=False),
+    Column("session_id", String),
+    Column("toolkit", String),
+    Column("tool_name", String, nullable=False),
+    Column("duration_ms", Float, nullable=False),
+    Column("error", Boolean, nullable=False, default=False),
+    Index("idx_tool_metrics_session", "session_id", "toolkit"),
+)
+
+
+def percentile(values: Sequence[float], q: float) -> Optional[float]:
+    """Linearly interpolated percentile, `q` in 0-100; None for no values."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * q / 100
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def toolkit_names(agent) -> Dict[str, str]:
+    """Maps each tool function name to the name of the toolkit it belongs to."""
+    names: Dict[str, str] = {}
+    for tool in agent.tools or []:
+        for function_name in getattr(tool, "functions", {}):
+            names[function_name] = tool.name
+    return names
+
+
+def _total(metrics: Dict[str, Any], key: str) -> Optional[int]:
+    values = metrics.get(key) or []
+    return sum(values) if values else None
+
+
+class RunTelemetry:
+    """Timings for one streamed agent run; feed it every event, then call finish()."""
+
+    def __init__(self, agent, toolkits: Optional[Dict[str, str]] = None):
+        self.agent = agent
+        self.toolkits = toolkit_names(agent) if toolkits is None else toolkits
+        self.run_id: Optional[str] = None
+        self.started = time.perf_counter()
+        self.started_at = time.time()
+        self.first_token: Optional[float] = None
+        self.error = False
+        self.tools: List[Dict[str, Any]] = []
+        self._open_tools: Dict[str, float] = {}
+        self.record: Optional[Dict[str, Any]] = None
+
+    def observe(self, event) -> None:
+        now = time.perf_counter()
+        self.run_id = self.run_id or getattr(event, "run_id", None)
+        kind = getattr(event, "event", None)
+        if kind == "RunResponseContent":
+            if self.first_token is None and getattr(event, "content", None):
+                self.first_token = now
+        elif kind == "ToolCallStarted" and event.tool is not None:
+            self._open_tools[event.tool.tool_call_id or event.tool.tool_name] = now
+        elif kind == "ToolCallCompleted" and event.tool is not None:
+            tool = event.tool
+            started = self._open_tools.pop(tool.tool_call_id or tool.tool_name, None)
+            if started is None:
+                return
+            # agno times the call itself; completed events of concurrent calls arrive in call order, not when done
+            elapsed = tool.metrics.time if tool.metrics is not None and tool.metrics.time else now - started
+            self.tools.append(
+                {
+                    "toolkit": self.toolkits.get(tool.tool_name),
+                    "tool_name": tool.tool_name,
+                    "duration_ms": elapsed * 1000,
+                    "error": bool(tool.tool_call_error),
+                }
+            )
+        elif kind == "RunError":
+            self.error = True
+
+    def finish(self, error: bool = False) -> Dict[str, Any]:
+        """Closes the run and returns its record (also kept on `self.record`)."""
+        ended = time.perf_counter()
+        self.error = self.error or error
+        response = getattr(self.agent, "run_response", None)
+        metrics = (getattr(response, "metrics", None) or {}) if response is not None else {}
+        output_tokens = _total(metrics, "output_tokens")
+        # Model time only, so tool execution does not drag the rate down
+        generation_time = sum(metrics.get("time") or []) or (ended - self.first_token if self.first_token else 0)
+        model = getattr(self.agent, "model", None)
+        self.record = {
+            "run_id": self.run_id or getattr(response, "run_id", None) or str(uuid.uuid4()),
+            "session_id": getattr(self.agent, "session_id", None),
+            "user_id": getattr(self.agent, "user_id", None),
+            "model": getattr(model, "id", None),
+            "started_at": self.started_at,
+            "ttft_ms": (self.first_token - self.started) * 1000 if self.first_token else None,
+            "total_ms": (ended - self.started) * 1000,
+            "input_tokens": _total(metrics, "input_tokens"),
+            "output_tokens": output_tokens,
+            "tokens_per_sec": output_tokens / generation_time if output_tokens and generation_time else None,
+            "tool_calls": len(self.tools),
+            "error": self.error,
+        }
+        return self.record
+
+
+class MetricsStore:
+    """The run_metrics and tool_metrics tables in the CLI's SQLite database."""
+
+    def __init__(self, db_file: str = DB_FILE):
+        self.engine = get_engine(db_file)
+        self._ready = False
+
+    def create(self) -> None:
+        if not self._ready:
+            _metadata.create_all(self.engine, checkfirst=True)
+            self._ready = True
+
+    def save(self, telemetry: RunTelemetry) -> None:
+        record = telemetry.record or telemetry.finish()
+        self.create()
+        with self.engine.begin() as conn:
+            conn.execute(sqlite.insert(run_metrics_table).on_conflict_do_nothing(), [record])
+            if telemetry.tools:
+                rows = [
+                    {"run_id": record["run_id"], "session_id": record["session_id"], **tool}
+                    for tool in telemetry.tools
+                ]
+                conn.execute(tool_metrics_table.insert(), rows)
+        log_debug(f"Saved telemetry for run {record['run_id']}")
+
+    def try_save(self, telemetry: RunTelemetry) -> None:
+        # Telemetry must never get in the way of a chat turn
+        try:
+            self.save(telemetry)
+        except Exception as e:
+            log_warning(f"Could not save run telemetry: {e}")
+
+    def session_stats(self, session_id: Optional[str] = None) -> Dict[str, Any]:
+        """Percentiles over the runs of a session, or over every run when session_id is None."""
+        self.create()
+        runs_stmt = select(
+            run_metrics_table.c.ttft_ms,
+            run_metrics_table.c.total_ms,
+            run_metrics_table.c.tokens_per_sec,
+            run_metrics_table.c.output_tokens,
+        )
+        tools_stmt = select(
+            tool_metrics_table.c.toolkit, tool_metrics_table.c.tool_name, tool_metrics_table.c.duration_ms
+        )
+        if session_id is not None:
+            runs_stmt = runs_stmt.where(run_metrics_table.c.session_id == session_id)
+            tools_stmt = tools_stmt.where(tool_metrics_table.c.session_id == session_id)
+        with self.engine.connect() as conn:
+            runs = conn.execute(runs_stmt).all()
+            tools = conn.execute(tools_stmt).all()
+
+        columns = {"Time to first token (ms)": 0, "Total latency (ms)": 1, "Tokens/sec": 2, "Output tokens": 3}
+        run_stats = {}
+        for label, index in columns.items():
+            values = [row[index] for row in runs if row[index] is not None]
+            run_stats[label] = {"count": len(values), **{p: percentile(values, p) for p in PERCENTILES}}
+
+        durations: Dict[str, List[float]] = {}
+        for toolkit, tool_name, duration_ms in tools:
+            durations.setdefault(toolkit or tool_name, []).append(duration_ms)
+        tool_stats = {
+            toolkit: {"count": len(values), **{p: percentile(values, p) for p in PERCENTILES}}
+            for toolkit, values in sorted(durations.items())
+        }
+        return {"session_id": session_id, "runs": len(runs), "run_stats": run_stats, "tool_stats": tool_stats}
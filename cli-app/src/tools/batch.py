@@ -0,0 +1,80 @@
+import os
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Sequence, Set
+
+
+def _ancestors(path: str):
+    parent = os.path.dirname(path)
+    while parent != path:
+        yield parent
+        path, parent = parent, os.path.dirname(parent)
+
+
+def dependencies(paths: Sequence[Sequence[str]]) -> List[Set[int]]:
+    """For each operation, the earlier operations it has to wait for.
+
+    `paths[i]` lists the absolute paths operation i touches. Two operations
+    conflict when they share a path or one path lies inside the other; the later
+    one then depends on the earlier. Only the most recent conflicting operations
+    are recorded, since they already wait for everything before them.
+    """
+    last: Dict[str, int] = {}  # path -> last operation touching exactly that path
+    below: Dict[str, List[int]] = {}  # directory -> operations under it since it was last touched
+    deps: List[Set[int]] = []
+    for i, op_paths in enumerate(paths):
+        waits: Set[int] = set()
+        for path in map(os.path.normpath, op_paths):
+            if path in last:
+                waits.add(last[path])
+            waits.update(below.pop(path, ()))
+            for ancestor in _ancestors(path):
+                if ancestor in last:
+                    waits.add(last[ancestor])
+                below.setdefault(ancestor, []).append(i)
+            last[path] = i
+        waits.discard(i)
+        deps.append(waits)
+    return deps
+
+
+def run_ordered(
+    calls: Sequence[Callable[[], Any]],
+    paths: Sequence[Sequence[str]],
+    max_workers: int = 8,
+) -> List[Any]:
+    """Runs `calls` concurrently, except that conflicting calls keep their relative order.
+
+    :return: Each call's return value, in the order the calls were given.
+    """
+    return run_with_dependencies(calls, dependencies(paths), max_workers=max_workers)
+
+
+def submit_with_dependencies(
+    pool: Executor, calls: Sequence[Callable[[], Any]], deps: Sequence[Set[int]]
+) -> List[Future]:
+    """Queues `calls` on `pool`; call i starts only after every call in `deps[i]` has finished.
+
+    Every index in `deps[i]` must be lower than i.
+    """
+    futures: List[Future] = []
+
+    def run(i: int) -> Any:
+        # Dependencies always have a lower index, so they were queued first and
+        # are already running or finished; waiting here cannot starve the pool.
+        for dep in deps[i]:
+            futures[dep].exception()
+        return calls[i]()
+
+    for i in range(len(calls)):
+        futures.append(pool.submit(run, i))
+    return futures
+
+
+def run_with_dependencies(
+    calls: Sequence[Callable[[], Any]], deps: Sequence[Set[int]], max_workers: int = 8
+) -> List[Any]:
+    """Like run_ordered, with the dependencies already worked out."""
+    if max_workers <= 1 or len(calls) <= 1:
+        return [call() for call in calls]
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return [future.result() for future in submit_with_dependencies(pool, calls, deps)]
@@ -0,0 +1,176 @@
+import functools
+import inspect
+import os
+import stat
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Set, Tuple
+
+from agno.utils.log import log_debug
+
+# (st_dev, st_ino, st_mtime_ns, st_size) of the path a result was computed from
+Stamp = Tuple[int, int, int, int]
+Key = Tuple[str, str, Tuple[Tuple[str, Any], ...]]
+
+
+@dataclass(frozen=True)
+class CachedResult:
+    stamp: Stamp
+    is_dir: bool
+    cached_at: float
+    result: str
+
+
+class ResultCache:
+    """LRU cache for the results of read-only file tools.
+
+    A result is reused while the path it was computed from has the same inode,
+    mtime and size. Any write FileTools makes invalidates results for that path,
+    the directories above it and everything below it. Changes inside a directory's
+    subdirectories, or to the contents of its files, do not touch its own mtime,
+    so directory results also expire after `max_age` seconds.
+    """
+
+    def __init__(self, max_entries: int = 256, max_bytes: int = 32 * 1024 * 1024, max_age: float = 60.0):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Key, CachedResult]" = OrderedDict()
+        self._by_path: Dict[str, Set[Key]] = {}
+        self._bytes = 0
+        # Bumped by every invalidation, so a result computed across a write is not stored
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _stamp(path: str) -> Optional[Tuple[Stamp, bool]]:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return (st.st_dev, st.st_ino, st.st_mtime_ns, st.st_size), stat.S_ISDIR(st.st_mode)
+
+    def get_or_compute(self, tool: str, path: str, args: Dict[str, Any], compute: Callable[[], str]) -> str:
+        path = os.path.normpath(os.path.abspath(path))
+        current = self._stamp(path)
+        if current is None:
+            # Missing paths produce error messages, which are not worth caching
+            return compute()
+        stamp, is_dir = current
+        key: Key = (tool, path, tuple(sorted(args.items())))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.stamp == stamp and (
+                not entry.is_dir or time.monotonic() - entry.cached_at < self.max_age
+            ):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                log_debug(f"Result cache hit: {tool} {path} (hits={self.hits}, misses={self.misses})")
+                return entry.result
+            self.misses += 1
+            generation = self._generation
+            log_debug(f"Result cache miss: {tool} {path} (hits={self.hits}, misses={self.misses})")
+
+        result = compute()
+        if not isinstance(result, str) or result.startswith("Error"):
+            return result
+        with self._lock:
+            if generation == self._generation:
+                self._store(key, CachedResult(stamp, is_dir, time.monotonic(), result))
+        return result
+
+    def _store(self, key: Key, entry: CachedResult) -> None:
+        size = len(entry.result)
+        if size > self.max_bytes:
+            return
+        self._discard(key)
+        self._entries[key] = entry
+        self._by_path.setdefault(key[1], set()).add(key)
+        self._bytes += size
+        while self._entries and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+            self._discard(next(iter(self._entries)))
+
+    def _discard(self, key: Key) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        self._bytes -= len(entry.result)
+        keys = self._by_path.get(key[1])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._by_path[key[1]]
+
+    def invalidate(self, path: str) -> int:
+        """Drops results for `path`, every directory above it and everything below it."""
+        path = os.path.normpath(os.path.abspath(path))
+        prefix = path.rstrip(os.sep) + os.sep
+        with self._lock:
+            self._generation += 1
+            stale = {p for p in self._by_path if p == path or p.startswith(prefix)}
+            parent = os.path.dirname(path)
+            while True:
+                if parent in self._by_path:
+                    stale.add(parent)
+                if parent == os.path.dirname(parent):
+                    break
+                parent = os.path.dirname(parent)
+            keys = [key for p in stale for key in self._by_path[p]]
+            for key in keys:
+                self._discard(key)
+        if keys:
+            log_debug(f"Result cache invalidated {len(keys)} entries for {path}")
+        return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+            self._by_path.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "entries": len(self._entries), "bytes": self._bytes}
+
+
+def cached_result(path_arg: str, relative_to_base: bool = True) -> Callable:
+    """Serves a FileTools method from `self._results`, keyed on its arguments and target path.
+
+    `path_arg` names the argument holding the target path; when it is None the
+    toolkit's base_dir is the target. Relative paths are resolved against base_dir
+    when `relative_to_base` is set, otherwise against the working directory,
+    matching how the decorated method itself resolves them.
+    """
+
+    def decorator(method: Callable[..., str]) -> Callable[..., str]:
+        signature = inspect.signature(method)
+
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            cache: Optional[ResultCache] = getattr(self, "_results", None)
+            if cache is None:
+                return method(self, *args, **kwargs)
+            try:
+                bound = signature.bind(self, *args, **kwargs)
+            except TypeError:
+                return method(self, *args, **kwargs)
+            bound.apply_defaults()
+            arguments = {name: value for name, value in bound.arguments.items() if name != "self"}
+            target = arguments.get(path_arg)
+            if target is None:
+                path = self.base_dir
+            else:
+                path = self.base_dir.joinpath(target) if relative_to_base else Path(target)
+            return cache.get_or_compute(
+                method.__name__, str(path), arguments, lambda: method(self, *args, **kwargs)
+            )
+
+        return wrapper
+
+    return decorator
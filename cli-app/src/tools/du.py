@@ -0,0 +1,131 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from .walk import is_real_dir
+
+
+@dataclass(frozen=True)
+class DirUsage:
+    """Sizes of the entries directly inside one directory."""
+
+    mtime_ns: int
+    scanned_at: float
+    own_bytes: int
+    own_files: int
+    # (st_dev, st_ino, st_size) of files with more than one hard link
+    linked: Tuple[Tuple[int, int, int], ...]
+    subdirs: Tuple[str, ...]
+
+
+class DirectorySizer:
+    """du-style directory sizing with a per-directory cache.
+
+    Each directory's own usage is cached against its mtime, which changes whenever
+    entries are added, removed or renamed. A warm query therefore costs one stat per
+    directory, fanned out over a thread pool level by level. Growth of an existing
+    file does not touch the directory mtime, so cached entries also expire after
+    `max_age` seconds. Like du, symlinks are not followed and files with several
+    hard links are counted once.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, max_age: float = 300.0, max_entries: int = 200_000):
+        self.max_workers = max_workers or min(32, (os.cpu_count() or 1) * 4)
+        self.max_age = max_age
+        self.max_entries = max_entries
+        self._cache: "OrderedDict[str, DirUsage]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _scan(self, path: str, mtime_ns: int) -> DirUsage:
+        own_bytes = 0
+        own_files = 0
+        linked: List[Tuple[int, int, int]] = []
+        subdirs: List[str] = []
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    try:
+                        if is_real_dir(entry):
+                            subdirs.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            st = entry.stat(follow_symlinks=False)
+                            if st.st_nlink > 1:
+                                linked.append((st.st_dev, st.st_ino, st.st_size))
+                            else:
+                                own_bytes += st.st_size
+                                own_files += 1
+                    except OSError:
+                        continue
+        except OSError:
+            pass
+        return DirUsage(mtime_ns, time.monotonic(), own_bytes, own_files, tuple(linked), tuple(subdirs))
+
+    def _usage(self, path: str, refresh: bool) -> Tuple[Optional[DirUsage], bool]:
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except OSError:
+            return None, False
+        with self._lock:
+            cached = self._cache.get(path)
+            if cached is not None:
+                self._cache.move_to_end(path)
+        if (
+            cached is not None
+            and not refresh
+            and cached.mtime_ns == mtime_ns
+            and time.monotonic() - cached.scanned_at < self.max_age
+        ):
+            return cached, True
+
+        usage = self._scan(path, mtime_ns)
+        with self._lock:
+            self._cache[path] = usage
+            self._cache.move_to_end(path)
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+        return usage, False
+
+    def measure(self, root: str, refresh: bool = False) -> Dict[str, int]:
+        """Computes the total size of `root`.
+
+        :param root: Directory to measure.
+        :param refresh: Ignore cached per-directory sizes and rescan everything.
+        """
+        total_bytes = 0
+        file_count = 0
+        dir_count = 0
+        cached_dirs = 0
+        duplicate_links = 0
+        seen_inodes = set()
+
+        frontier = [os.fspath(root)]
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            while frontier:
+                next_frontier: List[str] = []
+                for usage, from_cache in pool.map(lambda p: self._usage(p, refresh), frontier):
+                    if usage is None:
+                        continue
+                    cached_dirs += from_cache
+                    total_bytes += usage.own_bytes
+                    file_count += usage.own_files + len(usage.linked)
+                    for dev, ino, size in usage.linked:
+                        if (dev, ino) in seen_inodes:
+                            duplicate_links += 1
+                        else:
+                            seen_inodes.add((dev, ino))
+                            total_bytes += size
+                    dir_count += len(usage.subdirs)
+                    next_frontier.extend(usage.subdirs)
+                frontier = next_frontier
+
+        return {
+            "total_size_bytes": total_bytes,
+            "file_count": file_count,
+            "directory_count": dir_count,
+            "hard_links_deduplicated": duplicate_links,
+            "cached_directories": cached_dirs,
+        }
@@ -0,0 +1,207 @@
+import errno
+import hashlib
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional
+
+from .walk import scan_tree
+
+# ioctl request number for FICLONE (share extents on btrfs/xfs/etc.)
+FICLONE = 0x40049409
+PARALLEL_COPY_THRESHOLD = 256 * 1024 * 1024
+CHUNK_SIZE = 64 * 1024 * 1024
+BUFFER_SIZE = 8 * 1024 * 1024
+# copy_file_range/sendfile may be unsupported for a given pair of filesystems
+_FALLBACK_ERRNOS = {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.EBADF}
+
+
+def _reflink(src_fd: int, dst_fd: int) -> bool:
+    try:
+        import fcntl
+
+        fcntl.ioctl(dst_fd, FICLONE, src_fd)
+        return True
+    except (ImportError, OSError):
+        return False
+
+
+def _copy_range(src_fd: int, dst_fd: int, offset: int, length: int) -> None:
+    """Copies [offset, offset + length) in-kernel, at the same offset in the destination."""
+    end = offset + length
+    while offset < end:
+        copied = os.copy_file_range(src_fd, dst_fd, end - offset, offset, offset)
+        if copied == 0:
+            break
+        offset += copied
+
+
+def _copy_sendfile(src_fd: int, dst_fd: int, size: int) -> None:
+    offset = 0
+    while offset < size:
+        sent = os.sendfile(dst_fd, src_fd, offset, min(size - offset, 1 << 30))
+        if sent == 0:
+            break
+        offset += sent
+
+
+def _copy_buffered(src_fd: int, dst_fd: int, size: int) -> None:
+    offset = 0
+    while offset < size:
+        data = os.pread(src_fd, min(BUFFER_SIZE, size - offset), offset)
+        if not data:
+            break
+        os.pwrite(dst_fd, data, offset)
+        offset += len(data)
+
+
+def fast_copy_file(src: str, dst: str, workers: int = 4, preserve_metadata: bool = True) -> str:
+    """Copies one file with the cheapest mechanism the platform supports.
+
+    Tries, in order: a reflink (no data copied at all), copy_file_range (in-kernel,
+    split into parallel chunks for large files), sendfile, then pread/pwrite with a
+    large buffer. Metadata is copied like shutil.copy2.
+
+    :return: The mechanism that performed the copy.
+    """
+    if os.path.exists(dst) and os.path.samefile(src, dst):
+        raise shutil.SameFileError(f"'{src}' and '{dst}' are the same file")
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        src_fd, dst_fd = fsrc.fileno(), fdst.fileno()
+        size = os.fstat(src_fd).st_size
+        method = "reflink" if size and _reflink(src_fd, dst_fd) else None
+
+        if method is None and size and hasattr(os, "copy_file_range"):
+            try:
+                if size >= PARALLEL_COPY_THRESHOLD and workers > 1:
+                    os.ftruncate(dst_fd, size)
+                    offsets = range(0, size, CHUNK_SIZE)
+                    with ThreadPoolExecutor(max_workers=workers) as pool:
+                        list(pool.map(lambda off: _copy_range(src_fd, dst_fd, off, min(CHUNK_SIZE, size - off)), offsets))
+                    method = "copy_file_range (parallel)"
+                else:
+                    _copy_range(src_fd, dst_fd, 0, size)
+                    method = "copy_file_range"
+            except OSError as e:
+                if e.errno not in _FALLBACK_ERRNOS:
+                    raise
+                os.ftruncate(dst_fd, 0)
+
+        if method is None and size and hasattr(os, "sendfile"):
+            try:
+                _copy_sendfile(src_fd, dst_fd, size)
+                method = "sendfile"
+            except OSError as e:
+                if e.errno not in _FALLBACK_ERRNOS:
+                    raise
+                os.ftruncate(dst_fd, 0)
+
+        if method is None:
+            _copy_buffered(src_fd, dst_fd, size)
+            method = "buffered"
+
+    if preserve_metadata:
+        shutil.copystat(src, dst)
+    return method
+
+
+def file_digest(path: str) -> bytes:
+    digest = hashlib.blake2b(digest_size=32)
+    with open(path, "rb") as f:
+        while chunk := f.read(BUFFER_SIZE):
+            digest.update(chunk)
+    return digest.digest()
+
+
+def same_content(src: str, dst: str, src_stat: os.stat_result, quick_check: bool = False) -> bool:
+    """True when `dst` already holds exactly the bytes of `src`, compared by digest.
+
+    With `quick_check`, an equal size and mtime is taken as equal content without
+    hashing, like rsync's default; a target with other bytes but the same size and
+    mtime is then left alone.
+    """
+    try:
+        dst_stat = os.stat(dst)
+    except OSError:
+        return False
+    if dst_stat.st_size != src_stat.st_size:
+        return False
+    if quick_check and dst_stat.st_mtime_ns == src_stat.st_mtime_ns:
+        return True
+    return file_digest(src) == file_digest(dst)
+
+
+def _inside(path: str, directory: str) -> Optional[str]:
+    """`path` relative to `directory` when it is the directory or lies below it, else None."""
+    real_path, real_dir = os.path.realpath(path), os.path.realpath(directory)
+    if os.path.commonpath([real_path, real_dir]) != real_dir:
+        return None
+    return os.path.relpath(real_path, real_dir)
+
+
+def fast_copy_tree(src: str, dst: str, workers: int = 8, dedup: bool = True, quick_check: bool = False) -> Dict[str, int]:
+    """Copies a directory tree, skipping targets whose content is already identical.
+
+    :param dedup: Skip targets that already hold the same bytes (see same_content).
+    :param quick_check: Trust an equal size and mtime instead of hashing both files.
+    :return: Counters for copied and skipped files, bytes written and directories created.
+    """
+    inside = _inside(dst, src)
+    if inside == os.curdir:
+        raise shutil.SameFileError(f"'{src}' and '{dst}' are the same directory")
+    # A target inside the source (copying "a" to "a/b") is left out of the walk, or the copy would copy itself
+    skip = os.path.normpath(os.path.join(src, inside)) if inside else None
+    os.makedirs(dst, exist_ok=True)
+    stats = {"files_copied": 0, "files_skipped": 0, "bytes_copied": 0, "directories": 0}
+
+    def copy_one(src_path: str, dst_path: str, st: os.stat_result) -> bool:
+        if dedup and same_content(src_path, dst_path, st, quick_check):
+            return False
+        if os.path.islink(dst_path) or os.path.isdir(dst_path):
+            raise IsADirectoryError(f"Cannot overwrite '{dst_path}' with a file")
+        fast_copy_file(src_path, dst_path, workers=1)
+        return True
+
+    jobs = []
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for entry, _ in scan_tree(src, include=lambda entry: os.path.normpath(entry.path) != skip):
+            target = os.path.join(dst, os.path.relpath(entry.path, src))
+            if entry.is_symlink():
+                if not os.path.lexists(target):
+                    os.symlink(os.readlink(entry.path), target)
+            elif entry.is_dir():
+                os.makedirs(target, exist_ok=True)
+                stats["directories"] += 1
+            elif entry.is_file():
+                st = entry.stat()
+                jobs.append((st.st_size, pool.submit(copy_one, entry.path, target, st)))
+        for size, job in jobs:
+            if job.result():
+                stats["files_copied"] += 1
+                stats["bytes_copied"] += size
+            else:
+                stats["files_skipped"] += 1
+    shutil.copystat(src, dst)
+    return stats
+
+
+def fast_move(src: str, dst: str) -> Optional[Dict[str, int]]:
+    """Renames `src` to `dst`, falling back to a fast copy + delete across filesystems.
+
+    :return: Copy counters when a cross-filesystem copy was needed, otherwise None.
+    """
+    if os.path.isdir(src) and not os.path.islink(src) and _inside(dst, src):
+        raise ValueError(f"Cannot move a directory '{src}' into itself '{dst}'")
+    try:
+        os.rename(src, dst)
+        return None
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+    if os.path.isdir(src) and not os.path.islink(src):
+        stats = fast_copy_tree(src, dst, dedup=False)
+        shutil.rmtree(src)
+        return stats
+    fast_copy_file(src, dst)
+    os.unlink(src)
+    return {"files_copied": 1, "files_skipped": 0, "bytes_copied": os.stat(dst).st_size, "directories": 0}
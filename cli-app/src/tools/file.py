@@ -1,11 +1,74 @@
-import json
+import atexit
+import functools
+import inspect
+import itertools
 import os
+import warnings
 from pathlib import Path
-from typing import Any, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from agno.tools import Toolkit
 from agno.utils.log import log_debug, log_error, log_info
 
+from .batch import run_ordered
+from .cache import ResultCache, cached_result
+from .fastcopy import fast_copy_file, fast_copy_tree, fast_move
+from .du import DirectorySizer
+from .grep import grep_tree
+from .index import FileIndex
+from .reader import RangeReader
+from .shaping import byte_budget, compact_json, cut_lines, fitting_prefix, shape
+from .tree import render_tree
+from .walk import decode_cursor, encode_cursor, scan_tree, walk_from
+from .write import WriteEngine
+
+# Operations batch_file_operations accepts, with the arguments that name the paths they touch
+BATCH_PATH_ARGS: Dict[str, Tuple[str, ...]] = {
+    "save_file": ("file_name",),
+    "write_file_chunk": ("file_name",),
+    "read_file": ("file_name",),
+    "create_directory": ("dir_name",),
+    "get_file_info": ("file_name",),
+    "check_path_exists": ("path",),
+    "copy_file": ("src", "dst"),
+    "move_file": ("src", "dst"),
+    "delete_file": ("file_name",),
+    "delete_directory": ("dir_name",),
+}
+
+
+class FileOperationError(Exception):
+    """An expected failure, e.g. a missing source path; its message is the tool's answer as is."""
+
+
+def reports_errors(error: str) -> Callable:
+    """Turns a FileTools method that raises on failure into a tool that answers with an error message.
+
+    Unexpected exceptions are logged and reported as "<error>: <exception>". The
+    wrapper's `outcome(self, ...)` returns (succeeded, result) instead, so callers
+    such as batch_file_operations know whether an operation failed without parsing
+    its message.
+    """
+
+    def decorator(method: Callable[..., str]) -> Callable[..., str]:
+        def outcome(self, *args, **kwargs) -> Tuple[bool, str]:
+            try:
+                return True, method(self, *args, **kwargs)
+            except FileOperationError as e:
+                return False, str(e)
+            except Exception as e:
+                log_error(f"{error}: {e}")
+                return False, f"{error}: {e}"
+
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            return outcome(self, *args, **kwargs)[1]
+
+        wrapper.outcome = outcome
+        return wrapper
+
+    return decorator
+
 
 class FileTools(Toolkit):
     def __init__(
@@ -16,19 +79,49 @@ class FileTools(Toolkit):
         list_files: bool = True,
         search_files: bool = True,
         dir_operations: bool = True,
+        index_dir: Optional[Path] = None,
+        index_refresh_interval: float = 5.0,
+        max_read_size: int = 10 * 1024 * 1024,
+        group_commit: bool = False,
+        result_cache_size: int = 256,
+        max_response_bytes: Optional[int] = 64 * 1024,
+        max_response_tokens: Optional[int] = None,
+        table_output: bool = False,
         **kwargs,
     ):
         self.base_dir: Path = base_dir or Path.cwd()
+        # When set, glob-style searches are answered from a persistent per-base_dir index
+        self.index_dir: Optional[Path] = index_dir
+        self.index_refresh_interval = index_refresh_interval
+        self._indexes: Dict[Path, FileIndex] = {}
+        self._sizer = DirectorySizer()
+        # read_file refuses files larger than this and points to read_file_range instead
+        self.max_read_size = max_read_size
+        self._reader = RangeReader()
+        # With group_commit, saves skip their own fsync and are made durable by flush_writes
+        self._writer = WriteEngine(group_commit=group_commit)
+        atexit.register(self._writer.close)
+        # Repeated reads and listings of unchanged paths are answered from memory; 0 disables
+        self._results: Optional[ResultCache] = ResultCache(max_entries=result_cache_size) if result_cache_size else None
+        # JSON results are compact and cut to this budget; table_output sends lists of dicts as columns + rows
+        self.max_response_bytes = max_response_bytes
+        self.max_response_tokens = max_response_tokens
+        self.table_output = table_output
 
         tools: List[Any] = []
         if save_files:
             tools.append(self.save_file)
+            tools.append(self.write_file_chunk)
+            if group_commit:
+                tools.append(self.flush_writes)
         if read_files:
             tools.append(self.read_file)
+            tools.append(self.read_file_range)
         if list_files:
             tools.append(self.list_files)
         if search_files:
             tools.append(self.search_files)
+            tools.append(self.grep_files)
         if dir_operations:
             tools.extend([
                 self.list_directory,
@@ -47,45 +140,177 @@ class FileTools(Toolkit):
                 self.delete_directory,
                 self.check_path_exists,
             ])
+        # Only operations that are themselves enabled can be batched
+        self._batchable = {tool.__name__ for tool in tools} & BATCH_PATH_ARGS.keys()
+        if self._batchable:
+            tools.append(self.batch_file_operations)
 
         super().__init__(name="file_tools", tools=tools, **kwargs)
 
-    def save_file(self, contents: str, file_name: str, overwrite: bool = True) -> str:
+    def _get_index(self) -> Optional[FileIndex]:
+        if self.index_dir is None:
+            return None
+        root = self.base_dir.resolve()
+        if root not in self._indexes:
+            self._indexes[root] = FileIndex(root, self.index_dir, refresh_interval=self.index_refresh_interval)
+        return self._indexes[root]
+
+    def _indexed_glob(self, pattern: str) -> Optional[List[str]]:
+        """Serves a glob from the file index, or returns None to fall back to Path.glob."""
+        try:
+            index = self._get_index()
+            matches = index.glob(pattern) if index else None
+            return None if matches is None else [str(self.base_dir / rel) for rel in matches]
+        except Exception as e:
+            log_error(f"File index unavailable, falling back to glob: {e}")
+            return None
+
+    def _json(self, payload: Any, hint: str = "") -> str:
+        return shape(
+            payload,
+            max_bytes=self.max_response_bytes,
+            max_tokens=self.max_response_tokens,
+            table=self.table_output,
+            hint=hint,
+        )
+
+    def _text(self, text: str, hint: str = "") -> str:
+        return cut_lines(text, max_bytes=self.max_response_bytes, max_tokens=self.max_response_tokens, hint=hint)
+
+    def _mark_changed(self, *paths: Path) -> None:
+        """Called after every write: the index and cached results may no longer match the disk."""
+        for index in self._indexes.values():
+            index.mark_stale()
+        if self._results is not None:
+            for path in paths:
+                self._results.invalidate(str(path))
+
+    @reports_errors("Error saving to file")
+    def save_file(self, contents: str, file_name: str, overwrite: bool = True, append: bool = False) -> str:
         """Saves the contents to a file called `file_name` and returns the file name if successful.
 
+        The file is replaced atomically, so it never holds partially written contents.
+
         :param contents: The contents to save.
         :param file_name: The name of the file to save to.
         :param overwrite: Overwrite the file if it already exists.
+        :param append: Append the contents to the end of the file instead of replacing it.
         :return: The file name if successful, otherwise returns an error message.
         """
-        try:
-            file_path = self.base_dir.joinpath(file_name)
-            log_debug(f"Saving contents to {file_path}")
-            if not file_path.parent.exists():
-                file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path = self.base_dir.joinpath(file_name)
+        log_debug(f"Saving contents to {file_path}")
+        if not file_path.parent.exists():
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+        if append:
+            self._writer.append(str(file_path), contents)
+        else:
             if file_path.exists() and not overwrite:
-                return f"File {file_name} already exists"
-            file_path.write_text(contents)
-            log_info(f"Saved: {file_path}")
-            return str(file_name)
+                raise FileOperationError(f"File {file_name} already exists")
+            self._writer.write(str(file_path), contents)
+        self._mark_changed(file_path)
+        log_info(f"Saved: {file_path}")
+        return str(file_name)
+
+    @reports_errors("Error writing file chunk")
+    def write_file_chunk(self, file_name: str, chunk: str, final: bool = False) -> str:
+        """Writes a large file piece by piece. Call repeatedly with consecutive chunks and
+        `final=True` on the last one; the file only appears, complete, after the final chunk.
+
+        :param file_name: The name of the file to write.
+        :param chunk: The next piece of the contents.
+        :param final: Whether this is the last chunk.
+        :return: Progress message or error message.
+        """
+        file_path = self.base_dir.joinpath(file_name)
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        written = self._writer.write_chunk(str(file_path), chunk, final=final)
+        if not final:
+            return f"Buffered {written} bytes for '{file_name}', send the next chunk"
+        self._mark_changed(file_path)
+        log_info(f"Saved: {file_path} ({written} bytes)")
+        return f"File '{file_name}' written ({written} bytes)"
+
+    def flush_writes(self) -> str:
+        """Makes all saves since the last flush durable on disk (group-commit mode).
+
+        :return: Number of files flushed or error message.
+        """
+        try:
+            flushed = self._writer.flush()
+            log_info(f"Flushed {flushed} pending writes")
+            return f"Flushed {flushed} files to disk"
         except Exception as e:
-            log_error(f"Error saving to file: {e}")
-            return f"Error saving to file: {e}"
+            log_error(f"Error flushing writes: {e}")
+            return f"Error flushing writes: {e}"
 
+    @reports_errors("Error reading file")
+    @cached_result("file_name")
     def read_file(self, file_name: str) -> str:
         """Reads the contents of the file `file_name` and returns the contents if successful.
 
         :param file_name: The name of the file to read.
         :return: The contents of the file if successful, otherwise returns an error message.
         """
+        log_info(f"Reading file: {file_name}")
+        file_path = self.base_dir.joinpath(file_name)
+        size = file_path.stat().st_size
+        if size > self.max_read_size:
+            raise FileOperationError(
+                f"Error: '{file_name}' is {size} bytes, larger than the read_file limit of "
+                f"{self.max_read_size} bytes. Use read_file_range to page through it."
+            )
+        contents = file_path.read_text(encoding="utf-8")
+        return str(contents)
+
+    def read_file_range(
+        self,
+        file_name: str,
+        start_line: int = 1,
+        num_lines: int = 200,
+        byte_offset: Optional[int] = None,
+        byte_count: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> str:
+        """Reads one page of a (possibly huge) file by line range or byte range.
+
+        Pass the returned `next_cursor` back as `cursor` to get the following page;
+        it is null once the end of the file is reached. A line longer than
+        `byte_count` comes back cut, with `truncated` set and a byte cursor to the rest.
+
+        :param file_name: The name of the file to read.
+        :param start_line: First line to return, 1-based (line mode).
+        :param num_lines: Maximum number of lines to return (line mode).
+        :param byte_offset: Byte offset to start at; switches to byte mode when set.
+        :param byte_count: Maximum number of bytes to return in either mode; by default as many as fit in a response.
+        :param cursor: Continuation cursor from a previous call.
+        :return: JSON with the page content, its position and `next_cursor`, or an error message.
+        """
         try:
-            log_info(f"Reading file: {file_name}")
             file_path = self.base_dir.joinpath(file_name)
-            contents = file_path.read_text(encoding="utf-8")
-            return str(contents)
+            log_info(f"Reading range of file: {file_path}")
+            budget = byte_budget(self.max_response_bytes, self.max_response_tokens)
+            # Leave room for the page metadata (path, positions, cursor) next to the content
+            room = max(budget - 1024, budget // 2, 1) if budget else 65536
+            byte_count = min(byte_count, room) if byte_count else room
+            while True:
+                page = self._reader.read(
+                    str(file_path),
+                    start_line=start_line,
+                    num_lines=num_lines,
+                    byte_offset=byte_offset,
+                    byte_count=byte_count,
+                    cursor=cursor,
+                )
+                page["file"] = str(file_path)
+                size = len(compact_json(page).encode("utf-8"))
+                if not budget or size <= budget or byte_count == 1:
+                    break
+                # JSON escaping made the page bigger than its bytes: read a shorter one, so next_cursor stays exact
+                byte_count = max(1, min(byte_count - 1, byte_count * budget // size))
+            return self._json(page)
         except Exception as e:
-            log_error(f"Error reading file: {e}")
-            return f"Error reading file: {e}"
+            log_error(f"Error reading file range: {e}")
+            return f"Error reading file range: {e}"
 
     def list_files(self) -> str:
         """Returns a list of files in the base directory
@@ -94,7 +319,7 @@ class FileTools(Toolkit):
         """
         try:
             log_info(f"Reading files in : {self.base_dir}")
-            return json.dumps([str(file_path) for file_path in self.base_dir.iterdir()], indent=4)
+            return self._json([str(file_path) for file_path in self.base_dir.iterdir()], hint="use walk_directory to page through them")
         except Exception as e:
             log_error(f"Error reading files: {e}")
             return f"Error reading files: {e}"
@@ -110,9 +335,9 @@ class FileTools(Toolkit):
                 return "Error: Pattern cannot be empty"
 
             log_debug(f"Searching files in {self.base_dir} with pattern {pattern}")
-            matching_files = list(self.base_dir.glob(pattern))
-
-            file_paths = [str(file_path) for file_path in matching_files]
+            file_paths = self._indexed_glob(pattern)
+            if file_paths is None:
+                file_paths = [str(file_path) for file_path in self.base_dir.glob(pattern)]
 
             result = {
                 "pattern": pattern,
@@ -121,13 +346,56 @@ class FileTools(Toolkit):
                 "files": file_paths,
             }
             log_debug(f"Found {len(file_paths)} files matching pattern {pattern}")
-            return json.dumps(result, indent=2)
+            return self._json(result, hint="use a narrower pattern")
 
         except Exception as e:
             error_msg = f"Error searching files with pattern '{pattern}': {e}"
             log_error(error_msg)
             return error_msg
 
+    def grep_files(
+        self,
+        pattern: str,
+        path: Optional[str] = None,
+        include: Optional[str] = None,
+        ignore_case: bool = False,
+        context_lines: int = 0,
+        max_results: int = 200,
+    ) -> str:
+        """Searches file contents for a regular expression, like `grep -rn`.
+
+        Binary files, the .git directory and anything excluded by .gitignore are skipped.
+
+        :param pattern: The regular expression to search for (Python `re` syntax).
+        :param path: The directory to search. If None, uses base_dir.
+        :param include: Only search files whose name matches this glob, e.g. "*.py".
+        :param ignore_case: Match case-insensitively.
+        :param context_lines: Number of lines of context to return around each match.
+        :param max_results: Stop after this many matching lines.
+        :return: JSON with file:line matches, or an error message.
+        """
+        try:
+            if not pattern:
+                return "Error: Pattern cannot be empty"
+            target_path = Path(path) if path else self.base_dir
+            if not target_path.is_dir():
+                return f"Error: '{target_path}' is not a directory"
+
+            log_info(f"Grepping {target_path} for '{pattern}'")
+            result = grep_tree(
+                str(target_path),
+                pattern,
+                ignore_case=ignore_case,
+                include=include,
+                context=context_lines,
+                max_results=max_results,
+            )
+            return self._json(result, hint="use a narrower pattern, path or include")
+        except Exception as e:
+            log_error(f"Error searching file contents: {e}")
+            return f"Error searching file contents: {e}"
+
+    @cached_result("path", relative_to_base=False)
     def list_directory(self, path: Optional[str] = None, show_hidden: bool = False) -> str:
         """Lists all files and directories in the specified path with detailed information.
 
@@ -146,16 +414,13 @@ class FileTools(Toolkit):
             log_info(f"Listing directory: {target_path}")
             
             items = []
-            for item in target_path.iterdir():
-                if not show_hidden and item.name.startswith('.'):
-                    continue
-                
-                stat = item.stat()
+            for entry, _ in scan_tree(target_path, max_depth=1, show_hidden=show_hidden):
+                stat = entry.stat()
                 items.append({
-                    "name": item.name,
-                    "path": str(item),
-                    "type": "directory" if item.is_dir() else "file",
-                    "size": stat.st_size if item.is_file() else None,
+                    "name": entry.name,
+                    "path": entry.path,
+                    "type": "directory" if entry.is_dir() else "file",
+                    "size": stat.st_size if entry.is_file() else None,
                     "modified": stat.st_mtime,
                     "permissions": oct(stat.st_mode)[-3:],
                 })
@@ -166,18 +431,23 @@ class FileTools(Toolkit):
                 "items": sorted(items, key=lambda x: (x["type"], x["name"]))
             }
             
-            return json.dumps(result, indent=2)
+            return self._json(result, hint="use walk_directory to page through all entries")
             
         except Exception as e:
             log_error(f"Error listing directory: {e}")
             return f"Error listing directory: {e}"
 
-    def list_directory_tree(self, path: Optional[str] = None, max_depth: int = 3) -> str:
+    @cached_result("path", relative_to_base=False)
+    def list_directory_tree(self, path: Optional[str] = None, max_depth: int = 3, output_format: str = "json") -> str:
         """Lists directory structure in a tree format up to specified depth.
 
+        For large trees prefer the compact formats: "text" is an indented tree with
+        aggregated directory sizes, "paths" is a front-coded path list.
+
         :param path: The directory path to explore. If None, uses base_dir.
         :param max_depth: Maximum depth to traverse (default: 3).
-        :return: JSON formatted directory tree structure.
+        :param output_format: One of "json" (nested objects), "text" or "paths".
+        :return: The directory tree in the requested format, cut to the response size limit.
         """
         try:
             target_path = Path(path) if path else self.base_dir
@@ -188,38 +458,17 @@ class FileTools(Toolkit):
                 return f"Error: '{target_path}' is not a directory"
 
             log_info(f"Creating directory tree for: {target_path}")
-            
-            def build_tree(current_path: Path, current_depth: int) -> dict:
-                if current_depth > max_depth:
-                    return {"name": current_path.name, "type": "directory", "truncated": True}
-                
-                item_info = {
-                    "name": current_path.name,
-                    "path": str(current_path),
-                    "type": "directory" if current_path.is_dir() else "file"
-                }
-                
-                if current_path.is_dir():
-                    children = []
-                    try:
-                        for child in sorted(current_path.iterdir()):
-                            if not child.name.startswith('.'):  # Skip hidden files
-                                children.append(build_tree(child, current_depth + 1))
-                        item_info["children"] = children
-                    except PermissionError:
-                        item_info["error"] = "Permission denied"
-                else:
-                    item_info["size"] = current_path.stat().st_size
-                
-                return item_info
-            
-            tree = build_tree(target_path, 0)
-            return json.dumps(tree, indent=2)
+
+            tree = render_tree(str(target_path), max_depth=max_depth, output_format=output_format)
+            if isinstance(tree, str):
+                return self._text(tree, hint="use a smaller max_depth or a subdirectory as path")
+            return self._json(tree, hint='use output_format="text" or a smaller max_depth')
             
         except Exception as e:
             log_error(f"Error creating directory tree: {e}")
             return f"Error creating directory tree: {e}"
 
+    @reports_errors("Error creating directory")
     def create_directory(self, dir_name: str, parents: bool = True) -> str:
         """Creates a new directory.
 
@@ -227,14 +476,11 @@ class FileTools(Toolkit):
         :param parents: Whether to create parent directories if they don't exist.
         :return: Success message or error message.
         """
-        try:
-            dir_path = self.base_dir.joinpath(dir_name)
-            log_info(f"Creating directory: {dir_path}")
-            dir_path.mkdir(parents=parents, exist_ok=True)
-            return f"Directory '{dir_name}' created successfully"
-        except Exception as e:
-            log_error(f"Error creating directory: {e}")
-            return f"Error creating directory: {e}"
+        dir_path = self.base_dir.joinpath(dir_name)
+        log_info(f"Creating directory: {dir_path}")
+        dir_path.mkdir(parents=parents, exist_ok=True)
+        self._mark_changed(dir_path)
+        return f"Directory '{dir_name}' created successfully"
 
     def change_directory(self, path: str) -> str:
         """Changes the base directory for file operations.
@@ -264,45 +510,46 @@ class FileTools(Toolkit):
         """
         return str(self.base_dir)
 
+    @reports_errors("Error getting file info")
+    @cached_result("file_name")
     def get_file_info(self, file_name: str) -> str:
         """Gets detailed information about a file or directory.
 
         :param file_name: The name of the file or directory.
         :return: JSON formatted file information.
         """
-        try:
-            file_path = self.base_dir.joinpath(file_name)
-            if not file_path.exists():
-                return f"Error: '{file_name}' does not exist"
-            
-            stat = file_path.stat()
-            info = {
-                "name": file_path.name,
-                "path": str(file_path),
-                "type": "directory" if file_path.is_dir() else "file",
-                "size": stat.st_size,
-                "created": stat.st_ctime,
-                "modified": stat.st_mtime,
-                "accessed": stat.st_atime,
-                "permissions": oct(stat.st_mode)[-3:],
-                "owner": stat.st_uid,
-                "group": stat.st_gid,
-            }
-            
-            if file_path.is_file():
-                info["extension"] = file_path.suffix
-                info["stem"] = file_path.stem
-            
-            return json.dumps(info, indent=2)
-            
-        except Exception as e:
-            log_error(f"Error getting file info: {e}")
-            return f"Error getting file info: {e}"
-
-    def get_directory_size(self, dir_name: Optional[str] = None) -> str:
+        file_path = self.base_dir.joinpath(file_name)
+        if not file_path.exists():
+            raise FileOperationError(f"Error: '{file_name}' does not exist")
+        
+        stat = file_path.stat()
+        info = {
+            "name": file_path.name,
+            "path": str(file_path),
+            "type": "directory" if file_path.is_dir() else "file",
+            "size": stat.st_size,
+            "created": stat.st_ctime,
+            "modified": stat.st_mtime,
+            "accessed": stat.st_atime,
+            "permissions": oct(stat.st_mode)[-3:],
+            "owner": stat.st_uid,
+            "group": stat.st_gid,
+        }
+        
+        if file_path.is_file():
+            info["extension"] = file_path.suffix
+            info["stem"] = file_path.stem
+        
+        return self._json(info)
+
+    def get_directory_size(self, dir_name: Optional[str] = None, refresh: bool = False) -> str:
         """Calculates the total size of a directory and its contents.
 
+        Symlinks are not followed and hard-linked files are counted once. Sizes of
+        unchanged subdirectories are reused from earlier calls.
+
         :param dir_name: The directory name. If None, uses base_dir.
+        :param refresh: Recompute every subdirectory instead of reusing cached sizes.
         :return: Directory size information in JSON format.
         """
         try:
@@ -312,91 +559,98 @@ class FileTools(Toolkit):
             if not target_path.is_dir():
                 return f"Error: '{target_path}' is not a directory"
             
-            total_size = 0
-            file_count = 0
-            dir_count = 0
-            
-            for item in target_path.rglob('*'):
-                if item.is_file():
-                    total_size += item.stat().st_size
-                    file_count += 1
-                elif item.is_dir():
-                    dir_count += 1
-            
+            usage = self._sizer.measure(str(target_path), refresh=refresh)
+            total_size = usage["total_size_bytes"]
+
             result = {
                 "directory": str(target_path),
                 "total_size_bytes": total_size,
                 "total_size_mb": round(total_size / (1024 * 1024), 2),
-                "file_count": file_count,
-                "directory_count": dir_count
+                "file_count": usage["file_count"],
+                "directory_count": usage["directory_count"],
+                "hard_links_deduplicated": usage["hard_links_deduplicated"],
+                "cached_directories": usage["cached_directories"],
             }
             
-            return json.dumps(result, indent=2)
+            return self._json(result)
             
         except Exception as e:
             log_error(f"Error calculating directory size: {e}")
             return f"Error calculating directory size: {e}"
 
-    def walk_directory(self, path: Optional[str] = None, max_files: int = 100) -> str:
-        """Walks through directory structure and returns all files and subdirectories.
+    def walk_directory(
+        self,
+        path: Optional[str] = None,
+        max_items: int = 100,
+        cursor: Optional[str] = None,
+        max_files: Optional[int] = None,
+    ) -> str:
+        """Walks through directory structure and returns files and subdirectories one page at a time.
+
+        Entries are returned depth-first with siblings sorted by name. When more entries
+        remain, pass the returned `next_cursor` back as `cursor` to get the next page.
 
         :param path: The directory path to walk. If None, uses base_dir.
-        :param max_files: Maximum number of files to return (prevents overwhelming output).
-        :return: JSON formatted list of all files and directories.
+        :param max_items: Maximum number of files and directories to return in this page.
+        :param cursor: Continuation cursor from a previous call with the same path.
+        :param max_files: Deprecated alias for max_items.
+        :return: JSON formatted page of files and directories.
         """
+        if max_files is not None:
+            warnings.warn("walk_directory(max_files=...) is deprecated, use max_items", DeprecationWarning, stacklevel=2)
+            max_items = max_files
         try:
             target_path = Path(path) if path else self.base_dir
             if not target_path.exists():
                 return f"Error: Directory '{target_path}' does not exist"
             if not target_path.is_dir():
                 return f"Error: '{target_path}' is not a directory"
-            
-            all_items = []
-            file_count = 0
-            
-            for root, dirs, files in os.walk(target_path):
-                root_path = Path(root)
-                
-                # Add directories
-                for dir_name in dirs:
-                    all_items.append({
-                        "name": dir_name,
-                        "path": str(root_path / dir_name),
-                        "type": "directory",
-                        "parent": str(root_path)
-                    })
-                
-                # Add files
-                for file_name in files:
-                    if file_count >= max_files:
-                        break
-                    file_path = root_path / file_name
-                    all_items.append({
-                        "name": file_name,
-                        "path": str(file_path),
-                        "type": "file",
-                        "parent": str(root_path),
-                        "size": file_path.stat().st_size,
-                        "extension": file_path.suffix
-                    })
-                    file_count += 1
-                
-                if file_count >= max_files:
-                    break
-            
+
+            after = decode_cursor(cursor, str(target_path)) if cursor else None
+            items = (
+                (parts, self._walk_item(entry))
+                for entry, parts in walk_from(str(target_path), after=after)
+            )
+            # Pull one extra entry to learn whether another page exists
+            max_items = max(1, max_items)
+            page = list(itertools.islice(items, max_items + 1))
+            has_more = len(page) > max_items
+            page = page[:max_items]
+            budget = byte_budget(self.max_response_bytes, self.max_response_tokens)
+            if budget:
+                # End the page early rather than let the response budget cut it, so next_cursor stays exact
+                fits = max(fitting_prefix([item for _, item in page], budget - 1024), 1)
+                has_more = has_more or fits < len(page)
+                page = page[:fits]
+
             result = {
                 "directory": str(target_path),
-                "total_items": len(all_items),
-                "truncated": file_count >= max_files,
-                "items": all_items
+                "total_items": len(page),
+                "truncated": has_more,
+                "next_cursor": encode_cursor(str(target_path), page[-1][0]) if has_more else None,
+                "items": [item for _, item in page]
             }
             
-            return json.dumps(result, indent=2)
+            return self._json(result)
             
         except Exception as e:
             log_error(f"Error walking directory: {e}")
             return f"Error walking directory: {e}"
 
+    @staticmethod
+    def _walk_item(entry: os.DirEntry) -> Dict[str, Any]:
+        parent = os.path.dirname(entry.path)
+        if entry.is_dir():
+            return {"name": entry.name, "path": entry.path, "type": "directory", "parent": parent}
+        return {
+            "name": entry.name,
+            "path": entry.path,
+            "type": "file",
+            "parent": parent,
+            "size": entry.stat().st_size,
+            "extension": os.path.splitext(entry.name)[1]
+        }
+
     def find_files_by_extension(self, extension: str, path: Optional[str] = None) -> str:
         """Finds all files with a specific extension.
 
@@ -431,32 +685,44 @@ class FileTools(Toolkit):
             log_error(f"Error finding files by name: {e}")
             return f"Error finding files by name: {e}"
 
+    @reports_errors("Error copying file")
     def copy_file(self, src: str, dst: str) -> str:
-        """Copies a file from source to destination.
+        """Copies a file or directory from source to destination.
 
-        :param src: Source file path.
-        :param dst: Destination file path.
+        Files are copied in-kernel (reflink, copy_file_range or sendfile) where the
+        platform allows it. Directory copies skip files that are already identical
+        at the destination.
+
+        :param src: Source file or directory path.
+        :param dst: Destination path.
         :return: Success message or error message.
         """
-        try:
-            import shutil
-            src_path = self.base_dir.joinpath(src)
-            dst_path = self.base_dir.joinpath(dst)
-            
-            if not src_path.exists():
-                return f"Error: Source file '{src}' does not exist"
-            
-            # Create destination directory if it doesn't exist
-            dst_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            shutil.copy2(src_path, dst_path)
-            log_info(f"Copied {src_path} to {dst_path}")
-            return f"File copied successfully from '{src}' to '{dst}'"
-            
-        except Exception as e:
-            log_error(f"Error copying file: {e}")
-            return f"Error copying file: {e}"
-
+        src_path = self.base_dir.joinpath(src)
+        dst_path = self.base_dir.joinpath(dst)
+        
+        if not src_path.exists():
+            raise FileOperationError(f"Error: Source file '{src}' does not exist")
+        
+        # Create destination directory if it doesn't exist
+        dst_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        if src_path.is_dir():
+            stats = fast_copy_tree(str(src_path), str(dst_path))
+            self._mark_changed(dst_path)
+            log_info(f"Copied {src_path} to {dst_path}: {stats}")
+            return (
+                f"Directory copied successfully from '{src}' to '{dst}' "
+                f"({stats['files_copied']} copied, {stats['files_skipped']} already up to date)"
+            )
+
+        if dst_path.is_dir():
+            dst_path = dst_path / src_path.name
+        method = fast_copy_file(str(src_path), str(dst_path))
+        self._mark_changed(dst_path)
+        log_info(f"Copied {src_path} to {dst_path} via {method}")
+        return f"File copied successfully from '{src}' to '{dst}'"
+
+    @reports_errors("Error moving file")
     def move_file(self, src: str, dst: str) -> str:
         """Moves a file from source to destination.
 
@@ -464,47 +730,43 @@ class FileTools(Toolkit):
         :param dst: Destination file path.
         :return: Success message or error message.
         """
-        try:
-            import shutil
-            src_path = self.base_dir.joinpath(src)
-            dst_path = self.base_dir.joinpath(dst)
-            
-            if not src_path.exists():
-                return f"Error: Source file '{src}' does not exist"
-            
-            # Create destination directory if it doesn't exist
-            dst_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            shutil.move(str(src_path), str(dst_path))
-            log_info(f"Moved {src_path} to {dst_path}")
-            return f"File moved successfully from '{src}' to '{dst}'"
-            
-        except Exception as e:
-            log_error(f"Error moving file: {e}")
-            return f"Error moving file: {e}"
-
+        src_path = self.base_dir.joinpath(src)
+        dst_path = self.base_dir.joinpath(dst)
+        
+        if not src_path.exists():
+            raise FileOperationError(f"Error: Source file '{src}' does not exist")
+        
+        # Create destination directory if it doesn't exist
+        dst_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        if dst_path.is_dir():
+            dst_path = dst_path / src_path.name
+        # A plain rename when possible; only a cross-filesystem move copies data
+        stats = fast_move(str(src_path), str(dst_path))
+        self._mark_changed(src_path, dst_path)
+        log_info(f"Moved {src_path} to {dst_path}" + (f" by copying: {stats}" if stats else ""))
+        return f"File moved successfully from '{src}' to '{dst}'"
+
+    @reports_errors("Error deleting file")
     def delete_file(self, file_name: str) -> str:
         """Deletes a file.
 
         :param file_name: The name of the file to delete.
         :return: Success message or error message.
         """
-        try:
-            file_path = self.base_dir.joinpath(file_name)
-            if not file_path.exists():
-                return f"Error: File '{file_name}' does not exist"
-            
-            if file_path.is_dir():
-                return f"Error: '{file_name}' is a directory, use delete_directory instead"
-            
-            file_path.unlink()
-            log_info(f"Deleted file: {file_path}")
-            return f"File '{file_name}' deleted successfully"
-            
-        except Exception as e:
-            log_error(f"Error deleting file: {e}")
-            return f"Error deleting file: {e}"
-
+        file_path = self.base_dir.joinpath(file_name)
+        if not file_path.exists():
+            raise FileOperationError(f"Error: File '{file_name}' does not exist")
+        
+        if file_path.is_dir():
+            raise FileOperationError(f"Error: '{file_name}' is a directory, use delete_directory instead")
+        
+        file_path.unlink()
+        self._mark_changed(file_path)
+        log_info(f"Deleted file: {file_path}")
+        return f"File '{file_name}' deleted successfully"
+
+    @reports_errors("Error deleting directory")
     def delete_directory(self, dir_name: str, recursive: bool = False) -> str:
         """Deletes a directory.
 
@@ -512,60 +774,106 @@ class FileTools(Toolkit):
         :param recursive: Whether to delete directory and all its contents.
         :return: Success message or error message.
         """
-        try:
-            import shutil
-            dir_path = self.base_dir.joinpath(dir_name)
-            if not dir_path.exists():
-                return f"Error: Directory '{dir_name}' does not exist"
-            
-            if not dir_path.is_dir():
-                return f"Error: '{dir_name}' is not a directory"
-            
-            if recursive:
-                shutil.rmtree(dir_path)
-                log_info(f"Deleted directory recursively: {dir_path}")
-                return f"Directory '{dir_name}' and all contents deleted successfully"
-            else:
-                dir_path.rmdir()  # Only works if directory is empty
-                log_info(f"Deleted empty directory: {dir_path}")
-                return f"Directory '{dir_name}' deleted successfully"
-            
-        except Exception as e:
-            log_error(f"Error deleting directory: {e}")
-            return f"Error deleting directory: {e}"
-
+        import shutil
+        dir_path = self.base_dir.joinpath(dir_name)
+        if not dir_path.exists():
+            raise FileOperationError(f"Error: Directory '{dir_name}' does not exist")
+        
+        if not dir_path.is_dir():
+            raise FileOperationError(f"Error: '{dir_name}' is not a directory")
+        
+        if recursive:
+            shutil.rmtree(dir_path)
+            self._mark_changed(dir_path)
+            log_info(f"Deleted directory recursively: {dir_path}")
+            return f"Directory '{dir_name}' and all contents deleted successfully"
+        else:
+            dir_path.rmdir()  # Only works if directory is empty
+            self._mark_changed(dir_path)
+            log_info(f"Deleted empty directory: {dir_path}")
+            return f"Directory '{dir_name}' deleted successfully"
+
+    @reports_errors("Error checking path")
     def check_path_exists(self, path: str) -> str:
         """Checks if a path exists and returns its type.
 
         :param path: The path to check.
         :return: JSON formatted path information.
         """
+        target_path = self.base_dir.joinpath(path)
+        
+        result = {
+            "path": str(target_path),
+            "exists": target_path.exists(),
+            "type": None,
+            "readable": False,
+            "writable": False
+        }
+        
+        if target_path.exists():
+            if target_path.is_file():
+                result["type"] = "file"
+            elif target_path.is_dir():
+                result["type"] = "directory"
+            elif target_path.is_symlink():
+                result["type"] = "symlink"
+            else:
+                result["type"] = "other"
+            
+            result["readable"] = os.access(target_path, os.R_OK)
+            result["writable"] = os.access(target_path, os.W_OK)
+        
+        return self._json(result)
+
+    def batch_file_operations(self, operations: List[Dict[str, Any]], max_workers: int = 8) -> str:
+        """Runs many file operations in one call and reports a result for each.
+
+        Use this instead of repeated single-file calls for bulk work, e.g. creating
+        or copying many files. Each operation is `{"op": <name>, "args": {...}}`,
+        where <name> is one of save_file, write_file_chunk, read_file, create_directory,
+        get_file_info, check_path_exists, copy_file, move_file, delete_file or
+        delete_directory and args are that tool's arguments. An operation on a path waits for earlier
+        operations on the same path or on a path inside or above it; everything else
+        runs concurrently.
+
+        :param operations: List of operations to run.
+        :param max_workers: Maximum number of operations running at once.
+        :return: JSON with counts and the per-operation results, in input order.
+        """
         try:
-            target_path = self.base_dir.joinpath(path)
-            
-            result = {
-                "path": str(target_path),
-                "exists": target_path.exists(),
-                "type": None,
-                "readable": False,
-                "writable": False
-            }
-            
-            if target_path.exists():
-                if target_path.is_file():
-                    result["type"] = "file"
-                elif target_path.is_dir():
-                    result["type"] = "directory"
-                elif target_path.is_symlink():
-                    result["type"] = "symlink"
-                else:
-                    result["type"] = "other"
-                
-                result["readable"] = os.access(target_path, os.R_OK)
-                result["writable"] = os.access(target_path, os.W_OK)
-            
-            return json.dumps(result, indent=2)
-            
+            calls = []
+            paths = []
+            for op in operations:
+                name = op.get("op") if isinstance(op, dict) else None
+                args = op.get("args", {}) if isinstance(op, dict) else None
+                if name not in self._batchable or not isinstance(args, dict):
+                    calls.append(lambda name=name: (False, f"Error: unsupported operation {name!r}"))
+                    paths.append([])
+                    continue
+
+                def call(method=getattr(type(self), name), args=args):
+                    try:
+                        inspect.signature(method).bind(self, **args)
+                    except TypeError as e:
+                        return False, f"Error: invalid arguments: {e}"
+                    return method.outcome(self, **args)
+
+                calls.append(call)
+                paths.append([str(self.base_dir.joinpath(str(args[key]))) for key in BATCH_PATH_ARGS[name] if key in args])
+
+            # One group commit for the whole batch instead of an fsync per write
+            with self._writer.deferred():
+                outcomes = run_ordered(calls, paths, max_workers=max_workers)
+            results = [
+                {"index": i, "op": op.get("op") if isinstance(op, dict) else None, "ok": ok, "result": result}
+                for i, (op, (ok, result)) in enumerate(zip(operations, outcomes))
+            ]
+            succeeded = sum(1 for item in results if item["ok"])
+            log_info(f"Batch of {len(results)} file operations: {succeeded} succeeded")
+            return self._json(
+                {"total": len(results), "succeeded": succeeded, "failed": len(results) - succeeded, "results": results},
+                hint="split the batch or read large files on their own",
+            )
         except Exception as e:
-            log_error(f"Error checking path: {e}")
-            return f"Error checking path: {e}"
\ No newline at end of file
+            log_error(f"Error running batch file operations: {e}")
+            return f"Error running batch file operations: {e}"
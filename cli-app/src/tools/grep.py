@@ -0,0 +1,277 @@
+import itertools
+import mmap
+import os
+import re
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from fnmatch import fnmatchcase
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from .walk import is_real_dir, scan_tree
+
+BINARY_SNIFF_BYTES = 8192
+MAX_LINE_CHARS = 300
+# Below this many files a process pool costs more to start than it saves
+PARALLEL_MIN_FILES = 64
+FILES_PER_TASK = 32
+
+Rule = Tuple["re.Pattern[str]", bool, bool]  # (regex, negated, directories only)
+
+
+def _translate_gitignore(pattern: str) -> str:
+    """Translates one gitignore glob into a regex matched against a relative path."""
+    anchored = "/" in pattern.rstrip("/")
+    pattern = pattern.strip("/")
+    out = []
+    i = 0
+    while i < len(pattern):
+        ch = pattern[i]
+        if pattern.startswith("**/", i):
+            out.append("(?:.*/)?")
+            i += 3
+            continue
+        if pattern.startswith("/**", i) and i + 3 == len(pattern):
+            out.append("/.*")
+            i += 3
+            continue
+        if pattern.startswith("**", i):
+            out.append(".*")
+            i += 2
+            continue
+        if ch == "*":
+            out.append("[^/]*")
+        elif ch == "?":
+            out.append("[^/]")
+        elif ch == "[":
+            end = pattern.find("]", i + 1)
+            if end == -1:
+                out.append(re.escape(ch))
+            else:
+                body = pattern[i + 1:end]
+                if body.startswith("!"):
+                    body = "^" + body[1:]
+                out.append(f"[{body}]")
+                i = end
+        elif ch == "\\" and i + 1 < len(pattern):
+            i += 1
+            out.append(re.escape(pattern[i]))
+        else:
+            out.append(re.escape(ch))
+        i += 1
+    body = "".join(out)
+    return ("" if anchored else "(?:.*/)?") + body + r"\Z"
+
+
+def parse_gitignore(text: str) -> List[Rule]:
+    rules: List[Rule] = []
+    for line in text.splitlines():
+        line = line.rstrip()
+        if not line or line.startswith("#"):
+            continue
+        negated = line.startswith("!")
+        if negated:
+            line = line[1:]
+        dir_only = line.endswith("/")
+        if line.strip("/"):
+            rules.append((re.compile(_translate_gitignore(line)), negated, dir_only))
+    return rules
+
+
+class GitIgnore:
+    """Evaluates nested .gitignore files under a root; deeper and later rules win."""
+
+    def __init__(self, root: str):
+        self.root = root
+        self._rules: Dict[str, List[Tuple[str, List[Rule]]]] = {}
+
+    def _rules_for(self, directory: str) -> List[Tuple[str, List[Rule]]]:
+        if directory not in self._rules:
+            inherited = [] if directory == self.root else self._rules_for(os.path.dirname(directory))
+            try:
+                with open(os.path.join(directory, ".gitignore"), encoding="utf-8", errors="replace") as f:
+                    own = parse_gitignore(f.read())
+            except OSError:
+                own = []
+            self._rules[directory] = inherited + [(directory, own)] if own else inherited
+        return self._rules[directory]
+
+    def ignored(self, path: str, is_dir: bool) -> bool:
+        result = False
+        for base, rules in self._rules_for(os.path.dirname(path)):
+            rel = path[len(base):].lstrip("/")
+            for regex, negated, dir_only in rules:
+                if (is_dir or not dir_only) and regex.match(rel):
+                    result = not negated
+        return result
+
+
+def is_binary(mm: "mmap.mmap") -> bool:
+    return mm.find(b"\0", 0, min(len(mm), BINARY_SNIFF_BYTES)) != -1
+
+
+def _decode(line: bytes) -> str:
+    return line.rstrip(b"\r\n").decode("utf-8", errors="replace")[:MAX_LINE_CHARS]
+
+
+def grep_file(path: str, pattern: str, flags: int = 0, context: int = 0, max_matches: int = 0) -> List[Dict[str, Any]]:
+    """Scans one file through mmap and returns at most one match per line."""
+    regex = re.compile(pattern.encode("utf-8"), flags)
+    matches: List[Dict[str, Any]] = []
+    try:
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return matches
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if is_binary(mm):
+                    return matches
+                size = len(mm)
+                line_no = 1
+                counted_to = 0
+                pos = 0
+                while pos <= size:
+                    found = regex.search(mm, pos)
+                    if found is None:
+                        break
+                    start = mm.rfind(b"\n", 0, found.start()) + 1
+                    end = mm.find(b"\n", found.start())
+                    end = size if end == -1 else end
+                    if found.end() > end:
+                        # Like grep, only count matches that fit on a single line
+                        if regex.search(mm, start, end) is None:
+                            pos = end + 1
+                            continue
+                    line_no += mm[counted_to:start].count(b"\n")
+                    counted_to = start
+
+                    match: Dict[str, Any] = {"path": path, "line": line_no, "text": _decode(mm[start:end])}
+                    if context:
+                        before_start = start
+                        for _ in range(context):
+                            if before_start == 0:
+                                break
+                            before_start = mm.rfind(b"\n", 0, before_start - 1) + 1
+                        after_end = end
+                        for _ in range(context):
+                            if after_end >= size:
+                                break
+                            nxt = mm.find(b"\n", after_end + 1)
+                            after_end = size if nxt == -1 else nxt
+                        match["before"] = [_decode(x) for x in mm[before_start:start].splitlines()]
+                        match["after"] = [_decode(x) for x in mm[end + 1:after_end].splitlines()] if end < size else []
+                    matches.append(match)
+                    if max_matches and len(matches) >= max_matches:
+                        break
+                    pos = end + 1
+    except (OSError, ValueError):
+        pass
+    return matches
+
+
+def _grep_batch(paths: List[str], pattern: str, flags: int, context: int, max_matches: int) -> List[Dict[str, Any]]:
+    results: List[Dict[str, Any]] = []
+    for path in paths:
+        results.extend(grep_file(path, pattern, flags, context, max_matches))
+        if max_matches and len(results) >= max_matches:
+            break
+    return results
+
+
+def iter_candidate_files(
+    root: str,
+    include: Optional[str] = None,
+    respect_gitignore: bool = True,
+    show_hidden: bool = False,
+) -> Iterator[str]:
+    """Yields regular files under `root`, skipping .git and anything .gitignore excludes."""
+    root = os.path.abspath(root)
+    gitignore = GitIgnore(root) if respect_gitignore else None
+
+    def keep(entry: os.DirEntry) -> bool:
+        if entry.name == ".git":
+            return False
+        return gitignore is None or not gitignore.ignored(entry.path, is_real_dir(entry))
+
+    for entry, _ in scan_tree(root, show_hidden=show_hidden, include=keep):
+        if entry.is_file(follow_symlinks=False) and (include is None or fnmatchcase(entry.name, include)):
+            yield entry.path
+
+
+def grep_tree(
+    root: str,
+    pattern: str,
+    ignore_case: bool = False,
+    include: Optional[str] = None,
+    context: int = 0,
+    max_results: int = 200,
+    respect_gitignore: bool = True,
+    show_hidden: bool = False,
+    max_workers: Optional[int] = None,
+) -> Dict[str, Any]:
+    """Searches every text file under `root` for `pattern`.
+
+    Files are fed to a process pool in small batches with a bounded number of
+    batches in flight, so matches stream back while the tree is still being
+    walked and the search stops as soon as `max_results` matches are collected.
+    """
+    flags = re.MULTILINE | (re.IGNORECASE if ignore_case else 0)
+    re.compile(pattern.encode("utf-8"), flags)  # fail fast on an invalid regex
+
+    files = iter_candidate_files(root, include, respect_gitignore, show_hidden)
+    first = []
+    for path in files:
+        first.append(path)
+        if len(first) >= PARALLEL_MIN_FILES:
+            break
+
+    # One match past the limit tells a truncated result from one with exactly max_results matches
+    limit = max_results + 1 if max_results else 0
+    matches: List[Dict[str, Any]] = []
+    searched = len(first)
+    if len(first) < PARALLEL_MIN_FILES:
+        matches = _grep_batch(first, pattern, flags, context, limit)
+    else:
+        workers = max_workers or os.cpu_count() or 1
+        pending: Set[Future] = set()
+        searched = 0
+
+        def batches() -> Iterator[List[str]]:
+            nonlocal searched
+            batch: List[str] = []
+            for path in itertools.chain(first, files):
+                searched += 1
+                batch.append(path)
+                if len(batch) >= FILES_PER_TASK:
+                    yield batch
+                    batch = []
+            if batch:
+                yield batch
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            source = batches()
+            exhausted = False
+            while not exhausted or pending:
+                while not exhausted and len(pending) < workers * 2:
+                    chunk = next(source, None)
+                    if chunk is None:
+                        exhausted = True
+                        break
+                    pending.add(pool.submit(_grep_batch, chunk, pattern, flags, context, limit))
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    matches.extend(future.result())
+                if limit and len(matches) >= limit:
+                    for future in pending:
+                        future.cancel()
+                    break
+
+    truncated = bool(limit) and len(matches) >= limit
+    matches = sorted(matches, key=lambda m: (m["path"], m["line"]))
+    if truncated:
+        matches = matches[:max_results]
+    return {
+        "pattern": pattern,
+        "directory": root,
+        "files_searched": searched,
+        "matches_found": len(matches),
+        "truncated": truncated,
+        "matches": matches,
+    }
@@ -0,0 +1,72 @@
+from agno.agent import Agent
+from agno.tools import Toolkit
+from agno.utils.log import log_error, log_info
+
+from storage import CompactingSqliteStorage, run_exchange
+
+from .shaping import shape
+
+
+class SessionHistoryTools(Toolkit):
+    """Reads the runs CompactingSqliteStorage moved out of the agent's session.
+
+    The agent only sees a digest of archived runs in its context; these tools
+    return the full question and answer of each, by page or by search.
+    """
+
+    def __init__(self, storage: CompactingSqliteStorage, max_response_bytes: int = 64 * 1024, **kwargs):
+        self.storage = storage
+        self.max_response_bytes = max_response_bytes
+        super().__init__(
+            name="session_history",
+            tools=[self.read_archived_runs, self.search_archived_runs],
+            **kwargs,
+        )
+
+    def read_archived_runs(self, agent: Agent, offset: int = 0, limit: int = 10) -> str:
+        """Reads earlier runs of this session that were archived out of the conversation history, oldest first.
+
+        :param offset: Number of archived runs to skip.
+        :param limit: Maximum number of runs to return.
+        :return: JSON with the runs and `next_offset` (null after the last run), or an error message.
+        """
+        try:
+            offset, limit = max(0, offset), max(1, limit)
+            log_info(f"Reading archived runs {offset}-{offset + limit} of session {agent.session_id}")
+            # One extra run tells whether there is another page
+            runs = self.storage.read_archived_runs(agent.session_id, offset=offset, limit=limit + 1)
+            has_more = len(runs) > limit
+            runs = [run_exchange(run) for run in runs[:limit]]
+            result = {
+                "offset": offset,
+                "next_offset": offset + len(runs) if has_more else None,
+                "runs": runs,
+            }
+            return shape(result, max_bytes=self.max_response_bytes, hint="read fewer runs at a time")
+        except Exception as e:
+            log_error(f"Error reading archived runs: {e}")
+            return f"Error reading archived runs: {e}"
+
+    def search_archived_runs(self, agent: Agent, query: str, max_results: int = 5) -> str:
+        """Finds archived runs of this session whose question or answer contains `query`, newest first.
+
+        :param query: Text to look for, case-insensitive.
+        :param max_results: Maximum number of runs to return.
+        :return: JSON with the matching runs, or an error message.
+        """
+        try:
+            if not query or not query.strip():
+                return "Error: Query cannot be empty"
+            needle = query.strip().lower()
+            log_info(f"Searching archived runs of session {agent.session_id} for '{query}'")
+            matches = []
+            for run in self.storage.iter_archived_runs(agent.session_id, newest_first=True):
+                exchange = run_exchange(run)
+                if needle in f"{exchange['user']}\n{exchange['assistant']}".lower():
+                    matches.append(exchange)
+                    if len(matches) >= max(1, max_results):
+                        break
+            return shape({"query": query, "runs": matches}, max_bytes=self.max_response_bytes, hint="use a narrower query")
+        except Exception as e:
+            log_error(f"Error searching archived runs: {e}")
+            return f"Error searching archived runs: {e}"
@@ -0,0 +1,228 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from fnmatch import fnmatchcase
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from agno.utils.log import log_debug
+
+# Pseudo filesystems that are never worth indexing when base_dir is "/"
+DEFAULT_EXCLUDES = ("/proc", "/sys", "/dev", "/run")
+
+_WILDCARDS = set("*?[")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS dirs (
+    id INTEGER PRIMARY KEY,
+    path TEXT UNIQUE NOT NULL,
+    mtime_ns INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS entries (
+    dir_id INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    ext TEXT NOT NULL,
+    is_dir INTEGER NOT NULL,
+    is_symlink INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (dir_id, name)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS entries_name ON entries(name);
+CREATE INDEX IF NOT EXISTS entries_ext ON entries(ext);
+"""
+# Bumped whenever _SCHEMA changes; older index files are rebuilt from scratch
+_SCHEMA_VERSION = 2
+
+
+def _has_wildcard(segment: str) -> bool:
+    return any(ch in _WILDCARDS for ch in segment)
+
+
+def _match_parts(parts: Sequence[str], segments: Sequence[str]) -> bool:
+    """Matches path parts against glob segments with pathlib's `**` semantics."""
+    if not segments:
+        return not parts
+    head = segments[0]
+    if head == "**":
+        return any(_match_parts(parts[i:], segments[1:]) for i in range(len(parts) + 1))
+    return bool(parts) and fnmatchcase(parts[0], head) and _match_parts(parts[1:], segments[1:])
+
+
+def _to_sqlite_glob(segment: str) -> str:
+    # fnmatch negates character classes with "[!", SQLite GLOB uses "[^"
+    return segment.replace("[!", "[^")
+
+
+class FileIndex:
+    """Persistent path index for one base directory.
+
+    Every directory is stored with its mtime; a refresh only re-lists directories
+    whose mtime changed, so after the first build a refresh costs one stat per
+    directory instead of a full walk of every file.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        index_dir: Path,
+        refresh_interval: float = 5.0,
+        exclude: Iterable[str] = DEFAULT_EXCLUDES,
+    ):
+        self.root: Path = Path(root).resolve()
+        self.refresh_interval = refresh_interval
+        self.exclude = {os.path.normpath(p) for p in exclude}
+        self.last_refresh: float = 0.0
+
+        index_dir = Path(index_dir)
+        index_dir.mkdir(parents=True, exist_ok=True)
+        digest = hashlib.sha1(str(self.root).encode("utf-8")).hexdigest()[:16]
+        self.db_path: Path = index_dir / f"{digest}.sqlite"
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        if self._conn.execute("PRAGMA user_version").fetchone()[0] != _SCHEMA_VERSION:
+            self._conn.executescript("DROP TABLE IF EXISTS entries; DROP TABLE IF EXISTS dirs;")
+            self._conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+        self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def mark_stale(self) -> None:
+        """Forces the next query to refresh, e.g. after the toolkit itself wrote files."""
+        self.last_refresh = 0.0
+
+    def refresh(self, force: bool = False) -> None:
+        """Brings the index up to date with the filesystem."""
+        with self._lock:
+            if not force and time.monotonic() - self.last_refresh < self.refresh_interval:
+                return
+            started = time.perf_counter()
+            rescanned = self._refresh_locked()
+            self.last_refresh = time.monotonic()
+            log_debug(
+                f"Refreshed file index for {self.root}: {rescanned} directories rescanned "
+                f"in {time.perf_counter() - started:.3f}s"
+            )
+
+    def _refresh_locked(self) -> int:
+        conn = self._conn
+        known: Dict[str, Tuple[int, int]] = {
+            path: (dir_id, mtime_ns) for dir_id, path, mtime_ns in conn.execute("SELECT id, path, mtime_ns FROM dirs")
+        }
+        children: Dict[int, List[str]] = {}
+        # Symlinked directories are listed as entries but never descended into
+        for dir_id, name in conn.execute("SELECT dir_id, name FROM entries WHERE is_dir = 1 AND is_symlink = 0"):
+            children.setdefault(dir_id, []).append(name)
+
+        seen = set()
+        rescanned = 0
+        stack = [""]
+        with conn:
+            while stack:
+                rel = stack.pop()
+                abs_path = os.path.join(self.root, rel) if rel else str(self.root)
+                if abs_path in self.exclude:
+                    continue
+                try:
+                    mtime_ns = os.stat(abs_path).st_mtime_ns
+                except OSError:
+                    continue
+                seen.add(rel)
+
+                record = known.get(rel)
+                if record is not None and record[1] == mtime_ns:
+                    subdirs = children.get(record[0], [])
+                else:
+                    subdirs = self._rescan_dir(rel, abs_path, mtime_ns, record)
+                    rescanned += 1
+                stack.extend(os.path.join(rel, name) if rel else name for name in subdirs)
+
+            removed = [(known[path][0],) for path in known.keys() - seen]
+            if removed:
+                conn.executemany("DELETE FROM entries WHERE dir_id = ?", removed)
+                conn.executemany("DELETE FROM dirs WHERE id = ?", removed)
+        return rescanned
+
+    def _rescan_dir(self, rel: str, abs_path: str, mtime_ns: int, record: Optional[Tuple[int, int]]) -> List[str]:
+        conn = self._conn
+        rows = []
+        subdirs = []
+        try:
+            with os.scandir(abs_path) as it:
+                for entry in it:
+                    try:
+                        is_dir = entry.is_dir()
+                        is_symlink = entry.is_symlink()
+                        # Like pathlib's "**", never recurse through symlinked directories
+                        if is_dir and not is_symlink:
+                            subdirs.append(entry.name)
+                    except OSError:
+                        is_dir = is_symlink = False
+                    rows.append((entry.name, os.path.splitext(entry.name)[1], int(is_dir), int(is_symlink)))
+        except OSError:
+            pass
+
+        if record is None:
+            dir_id = conn.execute("INSERT INTO dirs (path, mtime_ns) VALUES (?, ?)", (rel, mtime_ns)).lastrowid
+        else:
+            dir_id = record[0]
+            conn.execute("UPDATE dirs SET mtime_ns = ? WHERE id = ?", (mtime_ns, dir_id))
+            conn.execute("DELETE FROM entries WHERE dir_id = ?", (dir_id,))
+        conn.executemany(
+            "INSERT INTO entries (dir_id, name, ext, is_dir, is_symlink) VALUES (?, ?, ?, ?, ?)",
+            [(dir_id, *row) for row in rows],
+        )
+        return subdirs
+
+    def glob(self, pattern: str) -> Optional[List[str]]:
+        """Answers a pathlib-style glob relative to the root.
+
+        :return: Sorted matching paths relative to the root, or None when the pattern cannot be served from the index.
+        """
+        if not pattern or pattern.startswith("/"):
+            return None
+        segments = [seg for seg in pattern.split("/") if seg not in ("", ".")]
+        if not segments or ".." in segments or segments[-1] == "**":
+            return None
+        if any("**" in seg and seg != "**" for seg in segments):
+            return None
+
+        self.refresh()
+
+        last = segments[-1]
+        query = "SELECT d.path, e.name FROM entries e JOIN dirs d ON d.id = e.dir_id"
+        params: Tuple[str, ...] = ()
+        suffix = last[1:]
+        if not _has_wildcard(last):
+            query += " WHERE e.name = ?"
+            params = (last,)
+        elif last.startswith("*.") and suffix.count(".") == 1 and not _has_wildcard(suffix):
+            # "*.py" style patterns are served by the extension index
+            query += " WHERE e.ext = ?"
+            params = (suffix,)
+        else:
+            query += " WHERE e.name GLOB ?"
+            params = (_to_sqlite_glob(last),)
+
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+
+        matches = []
+        if segments[:-1] == ["**"]:
+            # "**/<name>" matches at any depth, so only the name needs confirming
+            for dir_path, name in rows:
+                if fnmatchcase(name, last):
+                    matches.append(f"{dir_path}/{name}" if dir_path else name)
+        else:
+            for dir_path, name in rows:
+                rel = f"{dir_path}/{name}" if dir_path else name
+                if _match_parts(rel.split("/"), segments):
+                    matches.append(rel)
+        matches.sort()
+        log_debug(f"File index answered '{pattern}' with {len(matches)} matches")
+        return matches
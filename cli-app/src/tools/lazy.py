@@ -0,0 +1,51 @@
+import functools
+import inspect
+import threading
+from typing import Any, Callable, Dict, List, Optional, Type
+
+from agno.tools import Toolkit
+from agno.utils.log import log_debug, log_error
+
+
+class LazyToolkit(Toolkit):
+    """Registers a toolkit's tools without constructing it until one is called.
+
+    For toolkits with expensive constructors, e.g. DockerTools pings the Docker
+    daemon, and fails outright when it is not running. The tool schemas are read
+    from `toolkit_cls`, so the tool names have to be listed here; the real toolkit
+    is built with `kwargs` on the first call.
+    """
+
+    def __init__(self, toolkit_cls: Type[Toolkit], tool_names: List[str], name: Optional[str] = None, **kwargs):
+        self._toolkit_cls = toolkit_cls
+        self._toolkit_kwargs: Dict[str, Any] = kwargs
+        self._toolkit: Optional[Toolkit] = None
+        self._build_lock = threading.Lock()
+        tools = [self._deferred(tool_name) for tool_name in tool_names]
+        super().__init__(name=name or toolkit_cls.__name__, tools=tools)
+
+    @property
+    def toolkit(self) -> Toolkit:
+        with self._build_lock:
+            if self._toolkit is None:
+                log_debug(f"Building {self._toolkit_cls.__name__} on first use")
+                self._toolkit = self._toolkit_cls(**self._toolkit_kwargs)
+        return self._toolkit
+
+    def _deferred(self, tool_name: str) -> Callable[..., Any]:
+        method = getattr(self._toolkit_cls, tool_name)
+
+        @functools.wraps(method)
+        def call(*args, **kwargs):
+            try:
+                toolkit = self.toolkit
+            except Exception as e:
+                # Not cached, so the next call retries (e.g. once the Docker daemon is up)
+                log_error(f"Error building {self._toolkit_cls.__name__}: {e}")
+                return f"Error: {self._toolkit_cls.__name__} is unavailable: {e}"
+            return getattr(toolkit, tool_name)(*args, **kwargs)
+
+        # Advertise the bound signature, i.e. without `self`
+        signature = inspect.signature(method)
+        call.__signature__ = signature.replace(parameters=list(signature.parameters.values())[1:])
+        return call
@@ -0,0 +1,252 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Set, Type
+
+from agno.models.base import Model
+from agno.models.message import Message
+from agno.models.response import ModelResponse, ModelResponseEvent, ToolExecution
+from agno.tools.function import FunctionCall
+from agno.utils.log import log_debug
+
+from .batch import submit_with_dependencies
+
+# Tools that only inspect state. Every other tool is treated as a write.
+READ_ONLY_TOOLS: Set[str] = {
+    # FileTools
+    "read_file", "read_file_range", "list_files", "search_files", "grep_files", "list_directory",
+    "list_directory_tree", "get_current_directory", "get_file_info", "get_directory_size",
+    "walk_directory", "find_files_by_extension", "find_files_by_name", "check_path_exists",
+    # DockerTools
+    "list_containers", "get_container_logs", "inspect_container", "list_images", "inspect_image",
+    "list_volumes", "inspect_volume", "list_networks", "inspect_network",
+}
+
+# Checks on the arguments after a shell command (or subcommand): True when they only read
+ArgvCheck = Callable[[Sequence[str]], bool]
+
+
+def _any_args(args: Sequence[str]) -> bool:
+    return True
+
+
+def _option_names(arg: str) -> List[str]:
+    """The options one argument names: "--sort=x" names "--sort", bundled "-av" names "-a" and "-v"."""
+    if arg.startswith("--"):
+        return [arg.split("=", 1)[0]]
+    return [f"-{letter}" for letter in arg[1:]]
+
+
+def _only(flags: Set[str], positionals: bool = False) -> ArgvCheck:
+    """Arguments made of `flags` alone, plus positional arguments when `positionals` is set."""
+
+    def check(args: Sequence[str]) -> bool:
+        for arg in args:
+            if arg.startswith("-") and arg != "-":
+                if not all(name in flags for name in _option_names(arg)):
+                    return False
+            elif not positionals:
+                return False
+        return True
+
+    return check
+
+
+def _without(flags: Set[str]) -> ArgvCheck:
+    """Any arguments, as long as none of `flags` (long options) is among them."""
+    return lambda args: not any(arg.split("=", 1)[0] in flags for arg in args if arg.startswith("--"))
+
+
+GIT_BRANCH_LIST_FLAGS = {
+    "-a", "--all", "-r", "--remotes", "-v", "--verbose", "-l", "--list", "--show-current", "-i", "--ignore-case",
+    "--merged", "--no-merged", "--contains", "--no-contains", "--points-at", "--sort", "--format",
+    "--color", "--no-color", "--column", "--no-column", "--abbrev", "--no-abbrev",
+}
+
+
+def _git_branch(args: Sequence[str]) -> bool:
+    # Names are patterns only in list mode; otherwise "git branch <name>" creates a branch
+    listing = any(arg in ("-l", "--list") for arg in args)
+    return _only(GIT_BRANCH_LIST_FLAGS, positionals=listing)(args)
+
+
+def _git_remote(args: Sequence[str]) -> bool:
+    rest = [arg for arg in args if arg not in ("-v", "--verbose")]
+    return not rest or rest[0] in ("show", "get-url")
+
+
+# "--output=<file>" makes the diff family write a file
+_git_diff_family = _without({"--output"})
+
+# hostname only reads without a positional argument; "-F <file>" and "-b" set the name
+HOSTNAME_QUERY_FLAGS = {
+    "-a", "--alias", "-A", "--all-fqdns", "-d", "--domain", "-f", "--fqdn", "--long", "-i", "--ip-address",
+    "-I", "--all-ip-addresses", "-s", "--short", "-y", "--yp", "--nis", "-V", "--version", "-h", "--help",
+}
+
+JOURNALCTL_WRITE_FLAGS = {
+    "--vacuum-size", "--vacuum-time", "--vacuum-files", "--rotate", "--flush", "--sync",
+    "--relinquish-var", "--smart-relinquish-var", "--setup-keys", "--update-catalog",
+}
+
+# Shell commands (argv[0]) that only read, with a check on the rest of their arguments
+READ_ONLY_COMMANDS: Dict[str, ArgvCheck] = {
+    **dict.fromkeys(
+        ["cat", "df", "du", "free", "grep", "head", "id", "ls", "lsblk", "nproc", "ps", "pwd",
+         "stat", "tail", "uname", "uptime", "wc", "whoami", "which"],
+        _any_args,
+    ),
+    "hostname": _only(HOSTNAME_QUERY_FLAGS),
+    "journalctl": _without(JOURNALCTL_WRITE_FLAGS),
+}
+
+# Commands that only read with some subcommands (argv[1]), checked like READ_ONLY_COMMANDS
+READ_ONLY_SUBCOMMANDS: Dict[str, Dict[str, ArgvCheck]] = {
+    "docker": dict.fromkeys(["ps", "images", "logs", "inspect", "stats", "version", "info"], _any_args),
+    "git": {
+        "status": _any_args,
+        "log": _git_diff_family,
+        "diff": _git_diff_family,
+        "show": _git_diff_family,
+        "branch": _git_branch,
+        "remote": _git_remote,
+    },
+    "systemctl": dict.fromkeys(["status", "is-active", "is-enabled", "list-units"], _any_args),
+}
+
+
+def is_read_only(tool_name: str, arguments: Optional[Dict[str, Any]]) -> bool:
+    """Whether a tool call can run alongside other calls without changing what they see.
+
+    A shell command counts as a read only when its whole argv matches a known
+    read-only form; anything else is a write.
+    """
+    if tool_name in READ_ONLY_TOOLS:
+        return True
+    if tool_name == "run_shell_command":
+        args = [str(arg) for arg in (arguments or {}).get("args") or []]
+        if not args:
+            return False
+        command = os.path.basename(args[0])
+        if command in READ_ONLY_COMMANDS:
+            return READ_ONLY_COMMANDS[command](args[1:])
+        subcommands = READ_ONLY_SUBCOMMANDS.get(command, {})
+        return len(args) > 1 and args[1] in subcommands and subcommands[args[1]](args[2:])
+    return False
+
+
+def barrier_dependencies(read_only: Sequence[bool]) -> List[Set[int]]:
+    """Reads wait for the last write; a write waits for everything before it.
+
+    Consecutive reads therefore run together, while writes keep their order
+    relative to every other call.
+    """
+    deps: List[Set[int]] = []
+    last_write: Optional[int] = None
+    reads_since: List[int] = []
+    for i, read in enumerate(read_only):
+        if read:
+            deps.append(set() if last_write is None else {last_write})
+            reads_since.append(i)
+        else:
+            deps.append(set(reads_since) | (set() if last_write is None else {last_write}))
+            last_write, reads_since = i, []
+    return deps
+
+
+class ConcurrentToolCalls:
+    """Mixin for agno models that runs the tool calls of one model turn concurrently.
+
+    agno executes the calls a model asks for in one turn one after another. Here
+    independent calls share a thread pool of `tool_workers` threads, and each
+    write (anything `is_read_only` rejects) is a barrier: it starts once all earlier
+    calls finished, and later calls wait for it. Started events are sent up front,
+    results in the order the model asked for them.
+
+    Turns with paused tools (confirmation, user input, external execution) or a
+    tool call limit fall back to agno's serial path.
+    """
+
+    tool_workers: int = 8
+    is_read_only: Callable[[str, Optional[Dict[str, Any]]], bool] = staticmethod(is_read_only)
+
+    def _runs_serially(self, function_calls: List[FunctionCall], function_call_limit: Optional[int]) -> bool:
+        if self.tool_workers <= 1 or len(function_calls) <= 1 or function_call_limit is not None:
+            return True
+        return any(
+            fc.function.requires_confirmation
+            or fc.function.requires_user_input
+            or fc.function.external_execution
+            or fc.function.name == "get_user_input"
+            for fc in function_calls
+        )
+
+    def run_function_calls(
+        self,
+        function_calls: List[FunctionCall],
+        function_call_results: List[Message],
+        additional_messages: Optional[List[Message]] = None,
+        current_function_call_count: int = 0,
+        function_call_limit: Optional[int] = None,
+    ) -> Iterator[Any]:
+        if self._runs_serially(function_calls, function_call_limit):
+            yield from super().run_function_calls(  # type: ignore[misc]
+                function_calls,
+                function_call_results,
+                additional_messages=additional_messages,
+                current_function_call_count=current_function_call_count,
+                function_call_limit=function_call_limit,
+            )
+            return
+
+        if additional_messages is None:
+            additional_messages = []
+        for fc in function_calls:
+            yield ModelResponse(
+                content=fc.get_call_str(),
+                tool_executions=[
+                    ToolExecution(tool_call_id=fc.call_id, tool_name=fc.function.name, tool_args=fc.arguments)
+                ],
+                event=ModelResponseEvent.tool_call_started.value,
+            )
+
+        def call(fc: FunctionCall) -> Callable[[], Any]:
+            def run():
+                results: List[Message] = []
+                # agno's own single-call path, minus the started event already sent above
+                events = list(super(ConcurrentToolCalls, self).run_function_call(fc, results, additional_messages))
+                return events[1:], results
+
+            return run
+
+        read_only = [self.is_read_only(fc.function.name, fc.arguments) for fc in function_calls]
+        log_debug(f"Running {len(function_calls)} tool calls concurrently, {read_only.count(False)} as barriers")
+        with ThreadPoolExecutor(max_workers=self.tool_workers, thread_name_prefix="tool-call") as pool:
+            futures = submit_with_dependencies(pool, [call(fc) for fc in function_calls], barrier_dependencies(read_only))
+            for future in futures:
+                events, results = future.result()
+                yield from events
+                function_call_results.extend(results)
+
+        if additional_messages:
+            function_call_results.extend(additional_messages)
+
+
+_concurrent_classes: Dict[type, type] = {}
+
+
+def concurrent_model_class(model_cls: Type[Model]) -> Type[Model]:
+    """`model_cls` with ConcurrentToolCalls mixed in, one class per provider."""
+    if issubclass(model_cls, ConcurrentToolCalls):
+        return model_cls
+    if model_cls not in _concurrent_classes:
+        _concurrent_classes[model_cls] = type(model_cls.__name__, (ConcurrentToolCalls, model_cls), {})
+    return _concurrent_classes[model_cls]
+
+
+def with_concurrent_tool_calls(model: Model, max_workers: int = 8) -> Model:
+    """A copy of `model` that runs the tool calls of a turn concurrently."""
+    model_cls = concurrent_model_class(type(model))
+    concurrent = model_cls.__new__(model_cls)
+    concurrent.__dict__.update(vars(model))
+    concurrent.tool_workers = max_workers
+    return concurrent
@@ -0,0 +1,193 @@
+import mmap
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+
+@dataclass
+class LineIndex:
+    """Sparse line-offset index: the byte offset of every `stride`-th line."""
+
+    inode: Tuple[int, int]
+    size: int
+    mtime_ns: int
+    stride: int
+    checkpoints: List[int] = field(default_factory=lambda: [0])
+    scanned_to: int = 0
+    lines_scanned: int = 0
+
+    def extend(self, mm: "mmap.mmap", size: int, until_line: int) -> None:
+        """Scans forward until `until_line` lines are known or the file ends."""
+        pos = self.scanned_to
+        line = self.lines_scanned
+        while line < until_line and pos < size:
+            newline = mm.find(b"\n", pos, size)
+            pos = size if newline == -1 else newline + 1
+            line += 1
+            if line % self.stride == 0:
+                self.checkpoints.append(pos)
+        self.scanned_to = pos
+        self.lines_scanned = line
+
+    def seek(self, mm: "mmap.mmap", size: int, line: int) -> int:
+        """Returns the byte offset where 0-based `line` starts."""
+        self.extend(mm, size, line + 1)
+        if line >= self.lines_scanned:
+            return size
+        checkpoint = line // self.stride
+        pos = self.checkpoints[checkpoint]
+        for _ in range(line - checkpoint * self.stride):
+            pos = mm.find(b"\n", pos, size) + 1
+        return pos
+
+
+def _trim_partial_utf8(data: bytes) -> bytes:
+    """Drops a multi-byte UTF-8 sequence cut off at the end of `data`."""
+    for back in range(1, min(4, len(data)) + 1):
+        byte = data[-back]
+        if byte & 0xC0 != 0x80:
+            expected = 2 if byte >= 0xC0 else 1
+            expected = 3 if byte >= 0xE0 else expected
+            expected = 4 if byte >= 0xF0 else expected
+            return data[:-back] if expected > back else data
+    return data
+
+
+class RangeReader:
+    """Bounded-memory reads of large files through mmap.
+
+    Byte ranges are sliced straight out of the mapping. Line ranges use a
+    per-file LineIndex that is built lazily up to the furthest line requested,
+    so seeking to line N costs at most `stride` newline scans once indexed.
+    Indexes are reused while the file is unchanged and extended when a file
+    only grows (the common case for logs).
+    """
+
+    def __init__(self, stride: int = 1024, max_indexes: int = 32):
+        self.stride = stride
+        self.max_indexes = max_indexes
+        self._indexes: "OrderedDict[str, LineIndex]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _line_index(self, path: str, st: os.stat_result) -> LineIndex:
+        inode = (st.st_dev, st.st_ino)
+        with self._lock:
+            index = self._indexes.get(path)
+            unchanged_size = index is not None and st.st_size == index.size
+            if (
+                index is None
+                or index.inode != inode
+                or st.st_size < index.size
+                or (unchanged_size and st.st_mtime_ns != index.mtime_ns)
+            ):
+                index = LineIndex(inode, st.st_size, st.st_mtime_ns, self.stride)
+            elif st.st_size > index.size and index.scanned_to == index.size and index.scanned_to > 0:
+                # The unterminated last line may have grown: rescan from its checkpoint
+                index.lines_scanned = max(0, index.lines_scanned - 1) // self.stride * self.stride
+                del index.checkpoints[index.lines_scanned // self.stride + 1:]
+                index.scanned_to = index.checkpoints[-1]
+            index.size = st.st_size
+            index.mtime_ns = st.st_mtime_ns
+            self._indexes[path] = index
+            self._indexes.move_to_end(path)
+            while len(self._indexes) > self.max_indexes:
+                self._indexes.popitem(last=False)
+            return index
+
+    def read_bytes(self, path: str, offset: int = 0, length: int = 65536) -> Dict[str, Any]:
+        """Reads `length` bytes starting at `offset`, never splitting a UTF-8 character."""
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            offset = max(0, min(offset, size))
+            end = min(size, offset + max(1, length))
+            if size == 0:
+                data = b""
+            else:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    data = mm[offset:end]
+        if end < size:
+            data = _trim_partial_utf8(data) or data
+            end = offset + len(data)
+        return {
+            "mode": "bytes",
+            "file_size": size,
+            "start_byte": offset,
+            "end_byte": end,
+            "content": data.decode("utf-8", errors="replace"),
+            "next_cursor": f"bytes:{end}" if end < size else None,
+        }
+
+    def read_lines(self, path: str, start_line: int = 1, num_lines: int = 200, max_bytes: int = 65536) -> Dict[str, Any]:
+        """Reads `num_lines` lines starting at 1-based `start_line`, capped at `max_bytes`.
+
+        A first line longer than `max_bytes` is cut: the page is marked `truncated`
+        and `next_cursor` is a byte cursor to the rest of that line.
+        """
+        start_line = max(1, start_line)
+        with open(path, "rb") as f:
+            st = os.fstat(f.fileno())
+            size = st.st_size
+            index = self._line_index(path, st)
+            lines: List[bytes] = []
+            truncated = False
+            if size:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    with self._lock:
+                        pos = index.seek(mm, size, start_line - 1)
+                    used = 0
+                    while pos < size and len(lines) < max(1, num_lines):
+                        newline = mm.find(b"\n", pos, size)
+                        end = size if newline == -1 else newline + 1
+                        if lines and used + end - pos > max_bytes:
+                            break
+                        if end - pos > max_bytes:
+                            # A single line longer than the page: return its head, continue in byte mode
+                            data = mm[pos:pos + max(1, max_bytes)]
+                            data = _trim_partial_utf8(data) or data
+                            lines.append(data)
+                            pos += len(data)
+                            truncated = True
+                            break
+                        lines.append(mm[pos:end])
+                        used += end - pos
+                        pos = end
+            else:
+                pos = 0
+        end_line = start_line + len(lines) - 1
+        if truncated:
+            next_cursor = f"bytes:{pos}"
+        else:
+            next_cursor = f"lines:{end_line + 1}" if lines and pos < size else None
+        return {
+            "mode": "lines",
+            "file_size": size,
+            "start_line": start_line,
+            "end_line": end_line if lines else None,
+            "content": b"".join(lines).decode("utf-8", errors="replace"),
+            # The last line was cut at max_bytes; next_cursor points at the rest of it
+            "truncated": truncated,
+            "next_cursor": next_cursor,
+        }
+
+    def read(
+        self,
+        path: str,
+        start_line: int = 1,
+        num_lines: int = 200,
+        byte_offset: Optional[int] = None,
+        byte_count: int = 65536,
+        cursor: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Reads one page of `path`; a `cursor` from a previous page takes precedence."""
+        if cursor:
+            mode, _, position = cursor.partition(":")
+            if mode == "bytes":
+                return self.read_bytes(path, int(position), byte_count)
+            if mode == "lines":
+                return self.read_lines(path, int(position), num_lines, byte_count)
+            raise ValueError(f"Invalid cursor '{cursor}'")
+        if byte_offset is not None:
+            return self.read_bytes(path, byte_offset, byte_count)
+        return self.read_lines(path, start_line, num_lines, byte_count)
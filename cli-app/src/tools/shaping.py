@@ -0,0 +1,198 @@
+import json
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+# Rough size of a token in JSON output, used to turn a token budget into a byte budget
+BYTES_PER_TOKEN = 4
+# Lists of dicts shorter than this stay as objects; the column header does not pay off
+MIN_TABLE_ROWS = 8
+
+
+def compact_json(payload: Any) -> str:
+    return json.dumps(payload, separators=(",", ":"), ensure_ascii=False, default=str)
+
+
+def estimate_tokens(text: str) -> int:
+    return (len(text.encode("utf-8")) + BYTES_PER_TOKEN - 1) // BYTES_PER_TOKEN
+
+
+def byte_budget(max_bytes: Optional[int], max_tokens: Optional[int]) -> Optional[int]:
+    """The tighter of a byte and a token budget, in bytes; None when neither is set."""
+    budgets = [b for b in (max_bytes, max_tokens * BYTES_PER_TOKEN if max_tokens else None) if b]
+    return min(budgets) if budgets else None
+
+
+def fitting_prefix(items: List[Any], budget: int) -> int:
+    """How many leading items fit in `budget` bytes as the elements of a compact JSON array."""
+    used = 0
+    for count, item in enumerate(items):
+        used += len(compact_json(item).encode("utf-8")) + (1 if count else 0)
+        if used > budget:
+            return count
+    return len(items)
+
+
+def cut_lines(text: str, max_bytes: Optional[int] = 64 * 1024, max_tokens: Optional[int] = None, hint: str = "") -> str:
+    """Cuts text with one entry per line to whole lines within a size budget.
+
+    When lines are left out, a last line says how many: "… N more entries truncated".
+    """
+    budget = byte_budget(max_bytes, max_tokens)
+    if budget is None or len(text.encode("utf-8")) <= budget:
+        return text
+    lines = text.split("\n")
+
+    def note(omitted: int) -> str:
+        return f"… {omitted} more entries truncated" + (f"; {hint}" if hint else "")
+
+    # Reserve room for the note with as many digits as the count can have
+    room = budget - len(note(len(lines)).encode("utf-8")) - 1
+    used = keep = 0
+    for line in lines:
+        used += len(line.encode("utf-8")) + (1 if keep else 0)
+        if used > room:
+            break
+        keep += 1
+    return "\n".join(lines[:keep] + [note(len(lines) - keep)])
+
+
+def to_table(items: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Columnar form of a list of dicts: the keys once, then one row of values per item."""
+    columns: Dict[str, None] = {}
+    for item in items:
+        columns.update(dict.fromkeys(item))
+    names = list(columns)
+    return {"columns": names, "rows": [[item.get(name) for name in names] for item in items]}
+
+
+def _tabulate(payload: Any) -> Any:
+    if isinstance(payload, list):
+        if len(payload) >= MIN_TABLE_ROWS and all(isinstance(item, dict) for item in payload):
+            return to_table(payload)
+        return payload
+    if isinstance(payload, dict):
+        return {key: _tabulate(value) for key, value in payload.items()}
+    return payload
+
+
+def _lists(payload: Any, path: Tuple[str, ...] = (), depth: int = 2) -> Iterator[Tuple[Tuple[str, ...], list]]:
+    """Lists that can be shortened: dict values up to `depth` levels down, and table rows."""
+    if not isinstance(payload, dict) or depth == 0:
+        return
+    is_table = "columns" in payload and "rows" in payload
+    for key, value in payload.items():
+        if isinstance(value, list) and not (is_table and key == "columns"):
+            yield path + (key,), value
+        elif isinstance(value, dict):
+            yield from _lists(value, path + (key,), depth - 1)
+
+
+def _strings(payload: Any, path: Tuple[str, ...] = (), depth: int = 2) -> Iterator[Tuple[Tuple[str, ...], str]]:
+    """Strings that can be shortened: dict values up to `depth` levels down."""
+    if not isinstance(payload, dict) or depth == 0:
+        return
+    for key, value in payload.items():
+        if isinstance(value, str):
+            yield path + (key,), value
+        elif isinstance(value, dict):
+            yield from _strings(value, path + (key,), depth - 1)
+
+
+def _replace(payload: Dict[str, Any], path: Tuple[str, ...], value: Any) -> Dict[str, Any]:
+    head, rest = path[0], path[1:]
+    return {**payload, head: _replace(payload[head], rest, value) if rest else value}
+
+
+def shape(
+    payload: Any,
+    max_bytes: Optional[int] = 64 * 1024,
+    max_tokens: Optional[int] = None,
+    table: bool = False,
+    hint: str = "",
+) -> str:
+    """Serializes a tool result as compact JSON within a size budget.
+
+    With `table`, lists of dicts become {"columns": [...], "rows": [[...], ...]}.
+    When the result is over budget, lists are cut to fit, longest first, and the result says how many
+    items were left out of each. If that is not enough, the longest strings are shortened and the
+    result says how many characters were left out of each. A bare list is wrapped in {"items": [...]}
+    when it has to be cut. The note and counts are only added when something was actually left out.
+
+    :param max_bytes: Budget in bytes of UTF-8; None for no limit.
+    :param max_tokens: Budget in (estimated) tokens; the smaller budget wins.
+    :param table: Use the columnar encoding for lists of dicts.
+    :param hint: Appended to the truncation note, e.g. how to page through the rest.
+    """
+    if table:
+        payload = _tabulate(payload)
+    budget = byte_budget(max_bytes, max_tokens)
+    if budget is None:
+        return compact_json(payload)
+    # Biggest first; it is shortened first, and usually alone decides whether anything must go
+    candidates = sorted(_lists(payload), key=lambda candidate: len(candidate[1]), reverse=True)
+    if not candidates or fitting_prefix(candidates[0][1], budget) == len(candidates[0][1]):
+        text = compact_json(payload)
+        if len(text.encode("utf-8")) <= budget:
+            return text
+
+    if isinstance(payload, list):
+        payload = {"items": payload}
+        candidates = [(("items",), payload["items"])]
+    elif not isinstance(payload, dict):
+        return compact_json(payload)
+    omitted: Dict[str, int] = {}
+    omitted_chars: Dict[str, int] = {}
+    note = "Output cut to fit the response size limit" + (f"; {hint}" if hint else "")
+
+    def envelope(current: Dict[str, Any]) -> Dict[str, Any]:
+        extra: Dict[str, Any] = {}
+        if any(omitted.values()):
+            extra["omitted_items"] = {name: count for name, count in omitted.items() if count}
+        if any(omitted_chars.values()):
+            extra["omitted_chars"] = {name: count for name, count in omitted_chars.items() if count}
+        if extra:
+            extra["note"] = note
+        return {**current, **extra}
+
+    def size(current: Dict[str, Any]) -> int:
+        return len(compact_json(envelope(current)).encode("utf-8"))
+
+    def cut_lists(current: Dict[str, Any], lists: List[Tuple[Tuple[str, ...], list]], last_resort: bool) -> Dict[str, Any]:
+        for path, items in lists:
+            if size(current) <= budget:
+                break
+            name = ".".join(path)
+            # Reserve room for the count with as many digits as it can have
+            cut_before = omitted.get(name, 0)
+            omitted[name] = cut_before + len(items)
+            if not last_resort and size(_replace(current, path, [])) > budget:
+                # Emptying this list alone would not be enough: leave it until strings are shortened
+                omitted[name] = cut_before
+                continue
+            keep = fitting_prefix(items, budget - size(_replace(current, path, [])))
+            while keep and size(_replace(current, path, items[:keep])) > budget:
+                keep -= 1
+            current = _replace(current, path, items[:keep])
+            omitted[name] = cut_before + len(items) - keep
+        return current
+
+    payload = cut_lists(payload, candidates, last_resort=False)
+    # Nothing (more) to cut from lists, e.g. a page of file content: shorten the longest strings
+    for path, text in sorted(_strings(payload), key=lambda candidate: len(candidate[1]), reverse=True):
+        if size(payload) <= budget:
+            break
+        name = ".".join(path)
+        omitted_chars[name] = len(text)
+        low, high = 0, len(text)
+        while low < high:
+            mid = (low + high + 1) // 2
+            if size(_replace(payload, path, text[:mid])) <= budget:
+                low = mid
+            else:
+                high = mid - 1
+        payload = _replace(payload, path, text[:low])
+        omitted_chars[name] = len(text) - low
+    if size(payload) > budget:
+        # Even empty strings do not fit next to the lists that were left alone
+        lists = sorted(_lists(payload), key=lambda candidate: len(candidate[1]), reverse=True)
+        payload = cut_lists(payload, lists, last_resort=True)
+    return compact_json(envelope(payload))
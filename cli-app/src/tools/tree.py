@@ -0,0 +1,174 @@
+import os
+from array import array
+from typing import Any, Dict, List, Tuple
+
+from .walk import scan_tree
+
+IS_DIR = 1
+IS_SYMLINK = 2
+IS_TRUNCATED = 4
+
+
+def format_size(size: int) -> str:
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024 or unit == "GB":
+            return f"{size} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} TB"
+
+
+class FlatTree:
+    """A directory tree stored as parallel arrays in pre-order.
+
+    Node 0 is the root. Every other node records its parent's index, so the tree
+    can be rendered, or directory sizes aggregated, with a single linear pass and
+    without building a nested dict per entry.
+    """
+
+    def __init__(self, root: str):
+        self.root = root
+        self.names: List[str] = [os.path.basename(root.rstrip("/")) or root]
+        self.parents = array("i", [-1])
+        self.depths = array("i", [0])
+        self.flags = bytearray([IS_DIR])
+        self.sizes = array("q", [0])
+        self.errors: Dict[int, str] = {}
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    @classmethod
+    def build(cls, root: str, max_depth: int = 3, show_hidden: bool = False) -> "FlatTree":
+        """Walks `root` to `max_depth`; entries one level deeper are kept as truncated stubs."""
+        tree = cls(root)
+        dir_stack = [0]  # dir_stack[d] is the index of the most recent directory at depth d
+        listing = {"path": root, "index": 0}
+
+        def mark_error(dir_path: str, error: OSError) -> None:
+            # scan_tree lists a directory right after yielding it, so it is the last one seen
+            if dir_path == listing["path"]:
+                tree.errors[listing["index"]] = (
+                    "Permission denied" if isinstance(error, PermissionError) else str(error)
+                )
+
+        for entry, depth in scan_tree(
+            root, max_depth=max_depth + 1, show_hidden=show_hidden, sort=True, onerror=mark_error
+        ):
+            index = len(tree.names)
+            flags = IS_DIR if entry.is_dir() else 0
+            size = 0
+            if depth > max_depth:
+                flags |= IS_TRUNCATED
+            else:
+                if entry.is_symlink():
+                    flags |= IS_SYMLINK
+                elif flags & IS_DIR:
+                    del dir_stack[depth:]
+                    dir_stack.append(index)
+                    listing["path"], listing["index"] = entry.path, index
+                if not flags & IS_DIR:
+                    size = entry.stat().st_size
+            tree.names.append(entry.name)
+            tree.parents.append(dir_stack[depth - 1])
+            tree.depths.append(depth)
+            tree.flags.append(flags)
+            tree.sizes.append(size)
+        return tree
+
+    def aggregate_sizes(self) -> Tuple[array, bytearray]:
+        """Total size of every node, with directories summing everything listed below them.
+
+        Also returns a per-node flag that is set when the subtree reaches past
+        max_depth, i.e. when its total is only a lower bound.
+        """
+        totals = array("q", self.sizes)
+        partial = bytearray(len(self.names))
+        for index in range(len(self.names) - 1, 0, -1):
+            parent = self.parents[index]
+            totals[parent] += totals[index]
+            if partial[index] or self.flags[index] & IS_TRUNCATED:
+                partial[parent] = 1
+        return totals, partial
+
+    def to_nested(self) -> Dict[str, Any]:
+        """The nested JSON structure list_directory_tree has always returned."""
+        paths: Dict[int, str] = {0: self.root}
+        nodes: Dict[int, Dict[str, Any]] = {0: {"name": self.names[0], "path": self.root, "type": "directory"}}
+        if 0 in self.errors:
+            nodes[0]["error"] = self.errors[0]
+        else:
+            nodes[0]["children"] = []
+        for index in range(1, len(self.names)):
+            name, flags, parent = self.names[index], self.flags[index], self.parents[index]
+            kind = "directory" if flags & IS_DIR else "file"
+            if flags & IS_TRUNCATED:
+                node: Dict[str, Any] = {"name": name, "type": kind, "truncated": True}
+            else:
+                path = os.path.join(paths[parent], name)
+                node = {"name": name, "path": path, "type": kind}
+                if flags & IS_SYMLINK:
+                    node["symlink"] = True
+                elif flags & IS_DIR:
+                    if index in self.errors:
+                        node["error"] = self.errors[index]
+                    else:
+                        node["children"] = []
+                    paths[index] = path
+                    nodes[index] = node
+                if not flags & IS_DIR:
+                    node["size"] = self.sizes[index]
+            nodes[parent]["children"].append(node)
+        return nodes[0]
+
+    def _annotation(self, index: int, totals: array, partial: bytearray) -> str:
+        flags = self.flags[index]
+        if flags & IS_TRUNCATED:
+            return " ..."
+        if index in self.errors:
+            return f" [{self.errors[index]}]"
+        if flags & IS_SYMLINK:
+            return " -> (symlink)"
+        return f" ({format_size(totals[index])}{'+' if partial[index] else ''})"
+
+    def to_text(self) -> str:
+        """Indented tree, two spaces per level; directories end in '/' and carry aggregated sizes.
+
+        A size ending in '+' excludes entries deeper than max_depth.
+        """
+        totals, partial = self.aggregate_sizes()
+        lines = []
+        for index, name in enumerate(self.names):
+            suffix = "/" if self.flags[index] & IS_DIR else ""
+            lines.append(f"{'  ' * self.depths[index]}{name}{suffix}{self._annotation(index, totals, partial)}")
+        return "\n".join(lines)
+
+    def to_paths(self) -> str:
+        """Front-coded path list: each line is `<chars shared with previous path> <rest of path>`."""
+        totals, partial = self.aggregate_sizes()
+        lines = [
+            f"# root: {self.root}",
+            "# format: <chars shared with previous path> <rest of path> (size, '+' = deeper entries not counted)",
+        ]
+        rel_paths: Dict[int, str] = {0: ""}
+        previous = ""
+        for index in range(1, len(self.names)):
+            parent = self.parents[index]
+            rel = f"{rel_paths[parent]}{self.names[index]}"
+            if self.flags[index] & IS_DIR:
+                rel += "/"
+                rel_paths[index] = rel
+            shared = len(os.path.commonprefix([previous, rel]))
+            lines.append(f"{shared} {rel[shared:]}{self._annotation(index, totals, partial)}")
+            previous = rel
+        return "\n".join(lines)
+
+
+def render_tree(root: str, max_depth: int = 3, output_format: str = "json") -> Any:
+    tree = FlatTree.build(root, max_depth)
+    if output_format == "text":
+        return tree.to_text()
+    if output_format == "paths":
+        return tree.to_paths()
+    if output_format == "json":
+        return tree.to_nested()
+    raise ValueError(f"Unknown output_format '{output_format}', expected 'json', 'text' or 'paths'")
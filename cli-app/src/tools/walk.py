@@ -0,0 +1,136 @@
+import base64
+import json
+import os
+from bisect import bisect_right
+from typing import Callable, Iterator, List, Optional, Sequence, Tuple, Union
+
+PathLike = Union[str, "os.PathLike[str]"]
+ErrorHandler = Callable[[str, OSError], None]
+EntryFilter = Callable[[os.DirEntry], bool]
+
+
+def _list_dir(
+    path: str,
+    show_hidden: bool,
+    sort: bool,
+    onerror: Optional[ErrorHandler],
+    include: Optional[EntryFilter] = None,
+) -> List[os.DirEntry]:
+    try:
+        with os.scandir(path) as it:
+            entries = [
+                e for e in it
+                if (show_hidden or not e.name.startswith(".")) and (include is None or include(e))
+            ]
+    except OSError as e:
+        if onerror is not None:
+            onerror(path, e)
+        return []
+    if sort:
+        entries.sort(key=lambda e: e.name)
+    return entries
+
+
+def is_real_dir(entry: os.DirEntry) -> bool:
+    """True for directories that are not symlinks, using only the cached entry type."""
+    try:
+        return entry.is_dir(follow_symlinks=False)
+    except OSError:
+        return False
+
+
+def scan_tree(
+    root: PathLike,
+    max_depth: Optional[int] = None,
+    show_hidden: bool = True,
+    sort: bool = False,
+    onerror: Optional[ErrorHandler] = None,
+    include: Optional[EntryFilter] = None,
+) -> Iterator[Tuple[os.DirEntry, int]]:
+    """Walks `root` with os.scandir and yields `(entry, depth)` pairs in pre-order.
+
+    Direct children of `root` have depth 1. The yielded DirEntry objects carry the
+    entry type from the directory listing and cache their stat result, so callers
+    should use `entry.is_dir()` / `entry.stat()` rather than re-statting the path.
+    Symlinked directories are yielded but never descended into. Stop early by simply
+    not consuming the rest of the generator.
+
+    :param root: Directory to walk.
+    :param max_depth: Deepest level to yield; None walks the whole tree.
+    :param show_hidden: Whether to yield (and descend into) dot-entries.
+    :param sort: Yield siblings sorted by name instead of directory order.
+    :param onerror: Called with (path, error) when a directory cannot be listed.
+    :param include: Predicate on each entry; rejected entries are neither yielded nor descended into.
+    """
+    if max_depth is not None and max_depth < 1:
+        return
+    stack = [(iter(_list_dir(os.fspath(root), show_hidden, sort, onerror, include)), 1)]
+    while stack:
+        entries, depth = stack[-1]
+        entry = next(entries, None)
+        if entry is None:
+            stack.pop()
+            continue
+        yield entry, depth
+        if (max_depth is None or depth < max_depth) and is_real_dir(entry):
+            stack.append((iter(_list_dir(entry.path, show_hidden, sort, onerror, include)), depth + 1))
+
+
+def walk_from(
+    root: PathLike,
+    after: Optional[Sequence[str]] = None,
+    show_hidden: bool = True,
+) -> Iterator[Tuple[os.DirEntry, Tuple[str, ...]]]:
+    """Resumable pre-order walk over `root` with siblings sorted by name.
+
+    Yields `(entry, parts)` where `parts` are the path components of the entry
+    relative to `root`. Passing the `parts` of the last consumed entry as `after`
+    continues with the entry that would have come next; only the directories on
+    that entry's path are listed again, not the part of the tree already walked.
+    """
+    root = os.fspath(root)
+    stack: List[Tuple[Tuple[str, ...], Iterator[os.DirEntry]]] = []
+
+    def listing(parts: Tuple[str, ...], start_after: Optional[str] = None) -> Iterator[os.DirEntry]:
+        entries = _list_dir(os.path.join(root, *parts), show_hidden, True, None)
+        if start_after is not None:
+            entries = entries[bisect_right([e.name for e in entries], start_after):]
+        return iter(entries)
+
+    if after:
+        after = tuple(after)
+        for level in range(len(after)):
+            stack.append((after[:level], listing(after[:level], after[level])))
+        last = os.path.join(root, *after)
+        if os.path.isdir(last) and not os.path.islink(last):
+            stack.append((after, listing(after)))
+    else:
+        stack.append(((), listing(())))
+
+    while stack:
+        parent, entries = stack[-1]
+        entry = next(entries, None)
+        if entry is None:
+            stack.pop()
+            continue
+        parts = parent + (entry.name,)
+        yield entry, parts
+        if is_real_dir(entry):
+            stack.append((parts, listing(parts)))
+
+
+def encode_cursor(root: PathLike, parts: Sequence[str]) -> str:
+    """Opaque continuation token for `walk_from`."""
+    payload = json.dumps({"root": os.fspath(root), "after": list(parts)}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str, root: PathLike) -> Tuple[str, ...]:
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        cursor_root, after = payload["root"], tuple(str(part) for part in payload["after"])
+    except (ValueError, TypeError, KeyError) as e:
+        raise ValueError("Invalid cursor") from e
+    if cursor_root != os.fspath(root):
+        raise ValueError(f"Cursor belongs to '{cursor_root}', not '{os.fspath(root)}'")
+    return after
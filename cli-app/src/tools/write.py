@@ -0,0 +1,190 @@
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+from typing import BinaryIO, Dict, Iterator, Set, Tuple, Union
+
+STREAM_BUFFER_SIZE = 1024 * 1024
+
+
+def _current_umask() -> int:
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+
+def fsync_dir(path: str) -> None:
+    """Makes a rename or new directory entry in `path` durable."""
+    try:
+        fd = os.open(path, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+    except OSError:
+        return  # e.g. Windows, where directories cannot be opened
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+class WriteEngine:
+    """Crash-safe file writes.
+
+    Every replace goes to a temp file in the target directory and is renamed into
+    place, so readers and crashes only ever see the old or the new content. A
+    symlinked path is resolved first: the file it points to is replaced, with its
+    permission bits, and the link itself is left alone.
+
+    With `group_commit`, the fsyncs are deferred: files become visible at once but
+    are made durable together by flush(), which runs automatically once
+    `max_pending` files are waiting. A crash before a flush can lose those recent
+    writes, never older ones.
+    """
+
+    def __init__(self, group_commit: bool = False, max_pending: int = 256):
+        self.group_commit = group_commit
+        self.max_pending = max_pending
+        self._mode = 0o666 & ~_current_umask()
+        self._lock = threading.Lock()
+        self._pending: Set[str] = set()
+        self._deferred = 0
+        self._streams: Dict[str, Tuple[str, BinaryIO]] = {}
+
+    @property
+    def deferring(self) -> bool:
+        return self.group_commit or self._deferred > 0
+
+    def _temp_for(self, path: str) -> Tuple[str, BinaryIO]:
+        directory, name = os.path.split(path)
+        fd, temp_path = tempfile.mkstemp(dir=directory or ".", prefix=f".{name}.", suffix=".tmp")
+        try:
+            mode = os.stat(path).st_mode & 0o7777
+        except OSError:
+            mode = self._mode
+        os.chmod(temp_path, mode)
+        return temp_path, os.fdopen(fd, "wb", buffering=STREAM_BUFFER_SIZE)
+
+    def _commit(self, temp_path: str, f: BinaryIO, path: str) -> None:
+        f.flush()
+        if not self.deferring:
+            os.fsync(f.fileno())
+        f.close()
+        os.replace(temp_path, path)
+        self._settle(path)
+
+    def _settle(self, path: str) -> None:
+        if not self.deferring:
+            fsync_dir(os.path.dirname(path) or ".")
+            return
+        with self._lock:
+            self._pending.add(path)
+            full = len(self._pending) >= self.max_pending
+        if full:
+            self.flush()
+
+    def write(self, path: str, data: Union[str, bytes], encoding: str = "utf-8") -> int:
+        """Atomically replaces `path` with `data` and returns the number of bytes written."""
+        if isinstance(data, str):
+            data = data.encode(encoding)
+        # Renaming over a symlink would replace the link itself
+        path = os.path.realpath(path)
+        temp_path, f = self._temp_for(path)
+        try:
+            f.write(data)
+            self._commit(temp_path, f, path)
+        except BaseException:
+            f.close()
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+            raise
+        return len(data)
+
+    def append(self, path: str, data: Union[str, bytes], encoding: str = "utf-8") -> int:
+        """Appends `data` to `path` with a single O_APPEND write."""
+        if isinstance(data, str):
+            data = data.encode(encoding)
+        created = not os.path.exists(path)
+        fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o666)
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+            if not self.deferring:
+                os.fsync(fd)
+        finally:
+            os.close(fd)
+        if created or self.deferring:
+            self._settle(path)
+        return len(data)
+
+    def write_chunk(self, path: str, chunk: Union[str, bytes], final: bool = False, encoding: str = "utf-8") -> int:
+        """Streams `chunk` into a pending temp file for `path`; `final` renames it into place.
+
+        :return: Total bytes written to the pending file so far.
+        """
+        if isinstance(chunk, str):
+            chunk = chunk.encode(encoding)
+        path = os.path.realpath(path)
+        with self._lock:
+            stream = self._streams.get(path)
+            if stream is None:
+                stream = self._streams[path] = self._temp_for(path)
+        temp_path, f = stream
+        try:
+            f.write(chunk)
+            written = f.tell()
+            if final:
+                with self._lock:
+                    del self._streams[path]
+                self._commit(temp_path, f, path)
+        except BaseException:
+            self.abort_stream(path)
+            raise
+        return written
+
+    def abort_stream(self, path: str) -> bool:
+        with self._lock:
+            stream = self._streams.pop(os.path.realpath(path), None)
+        if stream is None:
+            return False
+        temp_path, f = stream
+        f.close()
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+        return True
+
+    def flush(self) -> int:
+        """fsyncs every deferred write and its directory; returns the number of files."""
+        with self._lock:
+            pending, self._pending = self._pending, set()
+        for path in pending:
+            try:
+                fd = os.open(path, os.O_RDONLY)
+            except OSError:
+                continue  # deleted or moved since it was written
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+        for directory in {os.path.dirname(path) or "." for path in pending}:
+            fsync_dir(directory)
+        return len(pending)
+
+    @contextmanager
+    def deferred(self) -> Iterator["WriteEngine"]:
+        """Group-commits every write made inside the block with a single flush at the end."""
+        with self._lock:
+            self._deferred += 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._deferred -= 1
+                last = self._deferred == 0
+            if last and not self.group_commit:
+                self.flush()
+
+    def close(self) -> None:
+        for path in list(self._streams):
+            self.abort_stream(path)
+        self.flush()
@@ -1,10 +1,8 @@
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Prompt
-from rich.markdown import Markdown
 from src.models import get_available_models, create_model
-from src.session import get_user_id, save_user_id, create_session_id, get_storage
-from src.dbtest import get_last_session_id_by_user
+from src.session import get_user_id, save_user_id, create_session_id
 
 console = Console()
 
@@ -33,6 +31,9 @@ def select_model():
             console.print("Please try another model.", style="yellow")
 
 def show_welcome(current_dir, model_name):
+    # rich.markdown pulls in markdown-it and pygments; not needed before the first prompt
+    from rich.markdown import Markdown
+
     welcome_text = f"""
 # 🤖 AI Agent CLI
 
@@ -58,36 +59,135 @@ def show_message(message, title="💬 Your Message"):
         padding=(1, 2)
     ))
 
-def show_response(response_content, metrics=None):
-    if response_content.strip():
-        # Main response
-        console.print(Panel(
-            Markdown(response_content),
-            title="🤖 Agent Response",
-            border_style="blue",
-            padding=(1, 2)
-        ))
-        
-        # Metrics section
-        if metrics:
-            import json
-            if isinstance(metrics, str):
-                try:
-                    metrics = json.loads(metrics)
-                except:
-                    pass
-            
-            if isinstance(metrics, dict):
-                metrics_text = "\n".join([f"**{k}:** {v}" for k, v in metrics.items()])
-            else:
-                metrics_text = str(metrics)
-            
-            console.print(Panel(
-                Markdown(f"**Metadata:**\n{metrics_text}"),
-                title="📊 Metrics",
-                border_style="dim",
-                padding=(0, 1)
-            ))
+def _ms(value):
+    return "-" if value is None else f"{value:,.0f} ms"
+
+def show_run_metrics(record, tools=()):
+    """One-panel summary of a run recorded by telemetry.RunTelemetry"""
+    parts = [f"**Time to first token:** {_ms(record['ttft_ms'])}", f"**Total:** {_ms(record['total_ms'])}"]
+    if record.get("tokens_per_sec"):
+        parts.append(f"**Tokens/sec:** {record['tokens_per_sec']:.1f}")
+    if record.get("output_tokens"):
+        parts.append(f"**Tokens:** {record.get('input_tokens') or 0} in / {record['output_tokens']} out")
+    lines = [" · ".join(parts)]
+    lines += [f"- `{tool['tool_name']}` {_ms(tool['duration_ms'])}" + (" ❌" if tool["error"] else "") for tool in tools]
+    from rich.markdown import Markdown
+
+    console.print(Panel(Markdown("\n".join(lines)), title="📊 Metrics", border_style="dim", padding=(0, 1)))
+
+def show_stats(stats):
+    """Percentile tables from telemetry.MetricsStore.session_stats"""
+    from rich.table import Table
+
+    scope = f"session {stats['session_id']}" if stats["session_id"] else "all sessions"
+    if not stats["runs"]:
+        console.print(f"No runs recorded for {scope} yet.", style="yellow")
+        return
+
+    def table(title, first_column, rows):
+        t = Table(title=title, title_style="bold", border_style="dim")
+        t.add_column(first_column)
+        for heading in ("n", "p50", "p90", "p99"):
+            t.add_column(heading, justify="right")
+        for label, row in rows.items():
+            values = ["-" if row[p] is None else f"{row[p]:,.1f}" for p in (50, 90, 99)]
+            t.add_row(label, str(row["count"]), *values)
+        return t
+
+    console.print(table(f"📊 {stats['runs']} runs, {scope}", "Metric", stats["run_stats"]))
+    if stats["tool_stats"]:
+        console.print(table("🔧 Tool call duration (ms)", "Toolkit", stats["tool_stats"]))
+
+FENCES = ("```", "~~~")
+
+class _LiveTail:
+    """The unfinished trailing block, parsed only when Live redraws it, cropped to the screen."""
+
+    def __init__(self, stream):
+        self.stream = stream
+
+    def __rich_console__(self, console, options):
+        from rich.markdown import Markdown
+        from rich.segment import Segment
+
+        text = self.stream.tail_text()
+        if not text.strip():
+            return
+        lines = console.render_lines(Markdown(text), options, pad=False)
+        for line in lines[-max(console.size.height - 2, 1):]:
+            yield from line
+            yield Segment.line()
+
+class StreamingMarkdown:
+    """Renders a streamed markdown reply incrementally.
+
+    Chunks are collected in a list and joined once. A block is finished when a
+    blank line outside a code fence is followed by an unindented line; it is then
+    printed once, permanently. Only the trailing, still-growing block sits in a
+    rich Live region, so the cost per redraw stays flat however long the reply gets.
+    """
+
+    def __init__(self, console, refresh_per_second=12):
+        from rich.live import Live
+
+        self.console = console
+        self.chunks = []
+        self._block = []  # complete lines of the trailing block
+        self._partial = []  # pieces of the line still being streamed
+        self._in_fence = False
+        self._blank_before = False
+        self._live = Live(_LiveTail(self), console=console, refresh_per_second=refresh_per_second, transient=True)
+
+    def __enter__(self):
+        self._live.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._live.stop()
+        rest = self.tail_text()
+        self._block, self._partial = [], []
+        if rest.strip():
+            self._print_block(rest)
+
+    @property
+    def text(self):
+        return "".join(self.chunks)
+
+    def tail_text(self):
+        return "".join(self._block) + "".join(self._partial)
+
+    def feed(self, chunk):
+        self.chunks.append(chunk)
+        pieces = chunk.split("\n")
+        for index, piece in enumerate(pieces):
+            if piece and not self._partial:
+                self._line_started(piece)
+            if index < len(pieces) - 1:
+                self._line_finished("".join(self._partial) + piece + "\n")
+                self._partial = []
+            elif piece:
+                self._partial.append(piece)
+        if len(self.chunks) == 1:
+            # Show the first token right away instead of at the next scheduled redraw
+            self._live.refresh()
+
+    def _line_started(self, first_piece):
+        if self._blank_before and not first_piece[0].isspace():
+            block, self._block = self._block, []
+            self._blank_before = False
+            self._print_block("".join(block))
+
+    def _line_finished(self, line):
+        self._block.append(line)
+        stripped = line.strip()
+        if stripped.startswith(FENCES):
+            self._in_fence = not self._in_fence
+        self._blank_before = not self._in_fence and not stripped
+
+    def _print_block(self, block):
+        from rich.markdown import Markdown
+
+        self._live.console.print(Markdown(block))
 
 def get_or_create_user():
     """Get existing user or create new one"""
@@ -126,6 +226,8 @@ def select_session_mode():
         console.print(f"✅ New session created: {session_id}...", style="green")
         return session_id, True
     else:
+        from src.dbtest import get_last_session_id_by_user
+
         # For now, create new session (previous session retrieval would need more implementation)
         session_id = get_last_session_id_by_user(get_user_id())
         console.print(f"📝 Starting previous session: {session_id}...", style="yellow")
@@ -0,0 +1,50 @@
+import json
+
+from tools.file import FileTools
+
+
+def _batch(tools, operations):
+    return json.loads(tools.batch_file_operations(operations))
+
+
+def test_success_is_reported_explicitly(tmp_path):
+    (tmp_path / "log.txt").write_text("Error: this line is content, not a failure")
+    (tmp_path / "keep.txt").write_text("original")
+    tools = FileTools(base_dir=tmp_path)
+    result = _batch(tools, [
+        {"op": "read_file", "args": {"file_name": "log.txt"}},
+        {"op": "save_file", "args": {"contents": "new", "file_name": "keep.txt", "overwrite": False}},
+        {"op": "copy_file", "args": {"src": "missing.txt", "dst": "copy.txt"}},
+        {"op": "delete_file", "args": {"file_name": "log.txt", "force": True}},
+        {"op": "rename_file", "args": {}},
+        {"op": "create_directory", "args": {"dir_name": "out"}},
+    ])
+    assert [item["ok"] for item in result["results"]] == [True, False, False, False, False, True]
+    assert (result["succeeded"], result["failed"]) == (2, 4)
+    assert result["results"][0]["result"].startswith("Error: this line")
+    assert result["results"][1]["result"] == "File keep.txt already exists"
+    assert result["results"][2]["result"] == "Error: Source file 'missing.txt' does not exist"
+    assert result["results"][3]["result"].startswith("Error: invalid arguments")
+    assert (tmp_path / "keep.txt").read_text() == "original"
+    assert (tmp_path / "log.txt").exists()
+
+
+def test_unexpected_exception_is_a_failure(tmp_path):
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "f.txt").write_text("x")
+    tools = FileTools(base_dir=tmp_path)
+    result = _batch(tools, [{"op": "delete_directory", "args": {"dir_name": "sub"}}])
+    item = result["results"][0]
+    assert item["ok"] is False
+    assert item["result"].startswith("Error deleting directory:")
+    # Called directly, the tool still answers with the message
+    assert tools.delete_directory("sub").startswith("Error deleting directory:")
+    assert tools.delete_directory("sub", recursive=True) == "Directory 'sub' and all contents deleted successfully"
+
+
+def test_batch_reads_go_through_the_result_cache(tmp_path):
+    (tmp_path / "a.txt").write_text("one")
+    tools = FileTools(base_dir=tmp_path)
+    ops = [{"op": "read_file", "args": {"file_name": "a.txt"}}]
+    assert _batch(tools, ops)["results"][0]["result"] == "one"
+    assert _batch(tools, [{"op": "save_file", "args": {"contents": "two", "file_name": "a.txt"}}] + ops)["results"][1]["result"] == "two"
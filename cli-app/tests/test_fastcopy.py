@@ -0,0 +1,93 @@
+import os
+
+from tools import fastcopy
+from tools.fastcopy import fast_copy_file, fast_copy_tree
+
+
+def _tree(root):
+    (root / "sub").mkdir(parents=True)
+    (root / "a.txt").write_bytes(b"alpha")
+    (root / "sub" / "b.txt").write_bytes(b"bravo")
+    os.symlink("a.txt", root / "link")
+    return root
+
+
+def test_copy_tree_then_recopy_skips_identical_files(tmp_path):
+    src = _tree(tmp_path / "src")
+    dst = tmp_path / "dst"
+    first = fast_copy_tree(str(src), str(dst))
+    assert (first["files_copied"], first["files_skipped"], first["directories"]) == (2, 0, 1)
+    assert (dst / "sub" / "b.txt").read_bytes() == b"bravo"
+    assert os.readlink(dst / "link") == "a.txt"
+
+    again = fast_copy_tree(str(src), str(dst))
+    assert (again["files_copied"], again["files_skipped"], again["bytes_copied"]) == (0, 2, 0)
+
+
+def test_stale_target_with_same_size_and_mtime_is_recopied(tmp_path):
+    src = _tree(tmp_path / "src")
+    dst = tmp_path / "dst"
+    fast_copy_tree(str(src), str(dst))
+    # Same length, same mtime, different bytes: only a digest comparison notices
+    stale = dst / "a.txt"
+    stale.write_bytes(b"ALPHA")
+    st = os.stat(src / "a.txt")
+    os.utime(stale, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+    stats = fast_copy_tree(str(src), str(dst))
+    assert stats["files_copied"] == 1
+    assert stale.read_bytes() == b"alpha"
+
+
+def test_quick_check_trusts_size_and_mtime(tmp_path):
+    src = _tree(tmp_path / "src")
+    dst = tmp_path / "dst"
+    fast_copy_tree(str(src), str(dst))
+    stale = dst / "a.txt"
+    stale.write_bytes(b"ALPHA")
+    st = os.stat(src / "a.txt")
+    os.utime(stale, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+    stats = fast_copy_tree(str(src), str(dst), quick_check=True)
+    assert stats["files_copied"] == 0
+    assert stale.read_bytes() == b"ALPHA"
+
+
+def test_copy_file_keeps_content_and_mtime(tmp_path, monkeypatch):
+    # Small thresholds so the parallel chunked path runs on a small file
+    monkeypatch.setattr(fastcopy, "PARALLEL_COPY_THRESHOLD", 64 * 1024)
+    monkeypatch.setattr(fastcopy, "CHUNK_SIZE", 16 * 1024)
+    src = tmp_path / "big.bin"
+    payload = os.urandom(100 * 1024 + 123)
+    src.write_bytes(payload)
+    for workers in (1, 4):
+        dst = tmp_path / f"copy{workers}.bin"
+        fast_copy_file(str(src), str(dst), workers=workers)
+        assert dst.read_bytes() == payload
+        assert os.stat(dst).st_mtime_ns == os.stat(src).st_mtime_ns
+
+
+def test_copy_into_own_subdirectory_leaves_the_target_out(tmp_path):
+    src = _tree(tmp_path / "a")
+    stats = fast_copy_tree(str(src), str(src / "b"))
+    assert (stats["files_copied"], stats["directories"]) == (2, 1)
+    assert sorted(os.listdir(src / "b")) == ["a.txt", "link", "sub"]
+    assert not (src / "b" / "b").exists()
+    # Copying again only refreshes the same files; nothing nests
+    assert fast_copy_tree(str(src), str(src / "b"))["files_skipped"] == 2
+    assert not (src / "b" / "b").exists()
+
+
+def test_copy_and_move_into_subdirectory_through_file_tools(tmp_path):
+    from tools.file import FileTools
+
+    src = _tree(tmp_path / "a")
+    tools = FileTools(base_dir=tmp_path)
+    assert tools.copy_file("a", "a/b/c").startswith("Directory copied successfully")
+    assert (src / "b" / "c" / "sub" / "b.txt").read_bytes() == b"bravo"
+    # "a/b" existed before the copy started, so it is copied once; the target itself is not
+    assert os.listdir(src / "b" / "c" / "b") == []
+
+    assert tools.move_file("a", "a/d").startswith("Error moving file: Cannot move a directory")
+    assert (src / "a.txt").exists() and not (src / "d").exists()
+    assert tools.copy_file("a", "a").startswith("Error copying file:")
@@ -0,0 +1,58 @@
+import pytest
+
+from tools import grep
+from tools.grep import grep_file, grep_tree
+
+
+@pytest.fixture
+def tree(tmp_path):
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "a.py").write_text("import os\nTODO one\nx = 1\nTODO two\n")
+    (tmp_path / "src" / "b.py").write_text("TODO three\n")
+    (tmp_path / "build").mkdir()
+    (tmp_path / "build" / "gen.py").write_text("TODO generated\n")
+    (tmp_path / ".gitignore").write_text("build/\n")
+    (tmp_path / "blob.bin").write_bytes(b"\x00TODO\x00")
+    return tmp_path
+
+
+def test_exactly_max_results_is_not_truncated(tree):
+    result = grep_tree(str(tree), "TODO", max_results=3)
+    assert result["matches_found"] == 3
+    assert result["truncated"] is False
+
+
+def test_more_than_max_results_is_truncated(tree):
+    result = grep_tree(str(tree), "TODO", max_results=2)
+    assert result["matches_found"] == 2
+    assert result["truncated"] is True
+
+
+def test_gitignore_and_binary_files_are_skipped(tree):
+    paths = {m["path"] for m in grep_tree(str(tree), "TODO")["matches"]}
+    assert paths == {str(tree / "src" / "a.py"), str(tree / "src" / "b.py")}
+    with_ignored = grep_tree(str(tree), "TODO", respect_gitignore=False)["matches"]
+    assert str(tree / "build" / "gen.py") in {m["path"] for m in with_ignored}
+
+
+def test_context_lines(tree):
+    (match,) = grep_file(str(tree / "src" / "a.py"), "x = 1", context=1)
+    assert match["line"] == 3
+    assert match["before"] == ["TODO one"]
+    assert match["after"] == ["TODO two"]
+
+
+def test_process_pool_truncation(tmp_path, monkeypatch):
+    monkeypatch.setattr(grep, "PARALLEL_MIN_FILES", 4)
+    monkeypatch.setattr(grep, "FILES_PER_TASK", 2)
+    for i in range(10):
+        (tmp_path / f"f{i}.txt").write_text("hit\n")
+    exact = grep_tree(str(tmp_path), "hit", max_results=10, max_workers=2)
+    assert (exact["matches_found"], exact["truncated"]) == (10, False)
+    cut = grep_tree(str(tmp_path), "hit", max_results=9, max_workers=2)
+    assert (cut["matches_found"], cut["truncated"]) == (9, True)
+
+
+def test_invalid_regex_fails_fast(tree):
+    with pytest.raises(Exception):
+        grep_tree(str(tree), "(unclosed")
@@ -0,0 +1,61 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from tools.index import FileIndex
+
+
+def _pathlib_glob(root: Path, pattern: str):
+    return sorted(p.relative_to(root).as_posix() for p in root.glob(pattern))
+
+
+@pytest.fixture
+def tree(tmp_path):
+    root = tmp_path / "root"
+    (root / "a" / "b").mkdir(parents=True)
+    (root / "a" / "b" / "note.txt").write_text("x")
+    (root / "top.txt").write_text("x")
+    (root / "a" / "script.py").write_text("x")
+    return root
+
+
+def test_glob_matches_pathlib(tree, tmp_path):
+    index = FileIndex(tree, tmp_path / "index")
+    for pattern in ("**/*.txt", "*.txt", "a/*", "**/b/*", "**/script.py", "a/**/note.txt"):
+        assert index.glob(pattern) == _pathlib_glob(tree, pattern), pattern
+    index.close()
+
+
+def test_symlink_loop_is_not_followed_on_refresh(tree, tmp_path):
+    # a/b/loop -> a: the first scan skips it, and later refreshes must too
+    os.symlink(tree / "a", tree / "a" / "b" / "loop")
+    index = FileIndex(tree, tmp_path / "index")
+    expected = _pathlib_glob(tree, "**/*.txt")
+    for _ in range(4):
+        index.refresh(force=True)
+        assert index.glob("**/*.txt") == expected
+        dirs = index._conn.execute("SELECT COUNT(*) FROM dirs").fetchone()[0]
+        assert dirs == 3
+    index.close()
+
+
+def test_refresh_picks_up_changes(tree, tmp_path):
+    index = FileIndex(tree, tmp_path / "index", refresh_interval=0)
+    assert index.glob("**/*.md") == []
+    (tree / "a" / "b" / "new.md").write_text("x")
+    (tree / "top.txt").unlink()
+    assert index.glob("**/*.md") == ["a/b/new.md"]
+    assert index.glob("*.txt") == []
+    index.close()
+
+
+def test_old_schema_is_rebuilt(tree, tmp_path):
+    index = FileIndex(tree, tmp_path / "index")
+    index.glob("**/*.txt")
+    index._conn.execute("PRAGMA user_version = 1")
+    index._conn.commit()
+    index.close()
+    index = FileIndex(tree, tmp_path / "index")
+    assert index.glob("**/*.txt") == _pathlib_glob(tree, "**/*.txt")
+    index.close()
@@ -0,0 +1,73 @@
+import pytest
+
+from tools.parallel import barrier_dependencies, is_read_only
+
+
+def _shell(*args):
+    return is_read_only("run_shell_command", {"args": list(args)})
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["git", "branch", "feature"],
+        ["git", "branch", "-D", "feature"],
+        ["git", "branch", "-m", "old", "new"],
+        ["git", "branch", "-a", "feature"],
+        ["git", "remote", "add", "origin", "https://example.com/repo.git"],
+        ["git", "remote", "remove", "origin"],
+        ["git", "remote", "set-url", "origin", "https://example.com/other.git"],
+        ["git", "diff", "--output=patch.diff"],
+        ["git", "log", "-p", "--output", "log.txt"],
+        ["journalctl", "--vacuum-size=100M"],
+        ["journalctl", "--vacuum-time", "2d"],
+        ["journalctl", "--rotate"],
+        ["journalctl", "--flush"],
+        ["hostname", "newname"],
+        ["hostname", "-b", "newname"],
+        ["hostname", "-F", "/etc/hostname"],
+        ["git"],
+        ["git", "-C", "/tmp", "status"],
+        ["docker", "rm", "web"],
+        ["rm", "-rf", "build"],
+    ],
+)
+def test_state_changing_commands_are_writes(argv):
+    assert not _shell(*argv)
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["git", "branch"],
+        ["git", "branch", "-a", "-v"],
+        ["git", "branch", "-vv"],
+        ["git", "branch", "--list", "feature/*"],
+        ["git", "branch", "--sort=-committerdate"],
+        ["git", "remote"],
+        ["git", "remote", "-v"],
+        ["git", "remote", "show", "origin"],
+        ["git", "diff", "--stat", "HEAD~1"],
+        ["/usr/bin/git", "status", "--short"],
+        ["journalctl", "-u", "nginx", "--since", "today"],
+        ["hostname"],
+        ["hostname", "-f"],
+        ["ls", "-la", "/etc"],
+        ["docker", "logs", "--tail", "50", "web"],
+        ["systemctl", "status", "nginx"],
+    ],
+)
+def test_read_only_forms_run_concurrently(argv):
+    assert _shell(*argv)
+
+
+def test_tools_and_empty_calls():
+    assert is_read_only("read_file", {"file_name": "a"})
+    assert not is_read_only("save_file", {"file_name": "a", "contents": ""})
+    assert not is_read_only("run_shell_command", {"args": []})
+    assert not is_read_only("run_shell_command", None)
+
+
+def test_writes_are_barriers():
+    # read, read, write, read: the write waits for both reads, the last read for the write
+    assert barrier_dependencies([True, True, False, True]) == [set(), set(), {0, 1}, {2}]
@@ -0,0 +1,71 @@
+from tools.reader import RangeReader
+
+
+def _pages(reader, path, **kwargs):
+    """Follows next_cursor from the first page to the end of the file."""
+    page = reader.read(path, **kwargs)
+    pages = [page]
+    while page["next_cursor"]:
+        page = reader.read(path, cursor=page["next_cursor"], byte_count=kwargs.get("byte_count", 65536))
+        pages.append(page)
+    return pages
+
+
+def test_lines_and_cursor(tmp_path):
+    path = tmp_path / "log.txt"
+    path.write_text("".join(f"line {i}\n" for i in range(1, 101)))
+    reader = RangeReader(stride=8)
+    page = reader.read(str(path), start_line=10, num_lines=5)
+    assert page["content"] == "".join(f"line {i}\n" for i in range(10, 15))
+    assert (page["start_line"], page["end_line"], page["next_cursor"]) == (10, 14, "lines:15")
+    assert "".join(p["content"] for p in _pages(reader, str(path), num_lines=7)) == path.read_text()
+
+
+def test_line_longer_than_page_continues_in_byte_mode(tmp_path):
+    path = tmp_path / "long.txt"
+    long_line = "x" * 100 + "\n"
+    path.write_text(long_line + "second\n")
+    reader = RangeReader()
+    page = reader.read(str(path), start_line=1, byte_count=10)
+    assert page["content"] == "x" * 10
+    assert page["truncated"] is True
+    assert page["next_cursor"] == "bytes:10"
+    assert "".join(p["content"] for p in _pages(reader, str(path), byte_count=10)) == path.read_text()
+
+
+def test_long_line_cut_never_splits_a_character(tmp_path):
+    path = tmp_path / "utf8.txt"
+    path.write_text("é" * 50 + "\n", encoding="utf-8")
+    reader = RangeReader()
+    page = reader.read(str(path), byte_count=9)
+    assert page["content"] == "é" * 4
+    assert page["next_cursor"] == "bytes:8"
+    pages = _pages(reader, str(path), byte_count=9)
+    assert "".join(p["content"] for p in pages) == path.read_text(encoding="utf-8")
+
+
+def test_page_stops_before_line_that_does_not_fit(tmp_path):
+    path = tmp_path / "mixed.txt"
+    path.write_text("short\n" + "y" * 50 + "\n")
+    page = RangeReader().read(str(path), byte_count=20)
+    assert page["content"] == "short\n"
+    assert page["truncated"] is False
+    assert page["next_cursor"] == "lines:2"
+
+
+def test_index_follows_growing_file(tmp_path):
+    path = tmp_path / "grow.txt"
+    path.write_text("a\nb")
+    reader = RangeReader(stride=1)
+    assert reader.read(str(path), start_line=2)["content"] == "b"
+    with open(path, "a") as f:
+        f.write("c\nd\n")
+    assert reader.read(str(path), start_line=2)["content"] == "bc\nd\n"
+    assert reader.read(str(path), start_line=3)["content"] == "d\n"
+
+
+def test_empty_file(tmp_path):
+    path = tmp_path / "empty.txt"
+    path.write_text("")
+    page = RangeReader().read(str(path))
+    assert page["content"] == "" and page["next_cursor"] is None and page["end_line"] is None
@@ -0,0 +1,88 @@
+import json
+
+from tools.file import FileTools
+from tools.shaping import cut_lines, shape
+
+
+def test_fitting_payload_has_no_note():
+    payload = {"items": list(range(10)), "name": "x"}
+    assert json.loads(shape(payload, max_bytes=1024)) == payload
+
+
+def test_lists_are_cut_and_counted():
+    payload = {"items": [f"item-{i}" for i in range(200)], "total": 200}
+    result = json.loads(shape(payload, max_bytes=500, hint="page with a cursor"))
+    assert len(shape(payload, max_bytes=500).encode("utf-8")) <= 500
+    assert result["items"] == payload["items"][:len(result["items"])]
+    assert result["omitted_items"] == {"items": 200 - len(result["items"])}
+    assert result["note"].endswith("page with a cursor")
+    assert "omitted_chars" not in result
+
+
+def test_list_that_fits_is_not_reported():
+    # The short list fits; only the string is over budget
+    payload = {"tags": ["a", "b"], "content": "x" * 5000}
+    result = json.loads(shape(payload, max_bytes=400))
+    assert result["tags"] == ["a", "b"]
+    assert "omitted_items" not in result
+    assert result["omitted_chars"] == {"content": 5000 - len(result["content"])}
+
+
+def test_over_budget_string_is_shortened():
+    payload = {"content": "é\"" * 3000, "mode": "bytes"}
+    text = shape(payload, max_bytes=1000)
+    assert len(text.encode("utf-8")) <= 1000
+    result = json.loads(text)
+    assert payload["content"].startswith(result["content"])
+    assert result["omitted_chars"]["content"] == len(payload["content"]) - len(result["content"])
+
+
+def test_read_file_range_defaults_to_the_response_budget(tmp_path):
+    (tmp_path / "big.txt").write_text("".join(f"line {i}\n" for i in range(5000)))
+    tools = FileTools(base_dir=tmp_path, max_response_bytes=4096)
+    page = json.loads(tools.read_file_range("big.txt", num_lines=5000))
+    assert "note" not in page
+    assert page["next_cursor"] == f"lines:{page['end_line'] + 1}"
+    assert 2048 < len(page["content"]) <= 4096
+
+
+def test_read_file_range_escaped_content_keeps_an_exact_cursor(tmp_path):
+    # Every quote doubles in JSON, so a budget-sized page of bytes does not fit as-is
+    content = '"' * 20000
+    (tmp_path / "quotes.txt").write_text(content)
+    tools = FileTools(base_dir=tmp_path, max_response_bytes=4096)
+    text = tools.read_file_range("quotes.txt", byte_offset=0, byte_count=100000)
+    page = json.loads(text)
+    assert len(text.encode("utf-8")) <= 4096
+    assert "omitted_chars" not in page
+    pieces = [page["content"]]
+    while page["next_cursor"]:
+        page = json.loads(tools.read_file_range("quotes.txt", cursor=page["next_cursor"]))
+        pieces.append(page["content"])
+    assert "".join(pieces) == content
+
+
+def test_cut_lines_keeps_whole_lines_and_counts_the_rest():
+    text = "\n".join(f"entry-{i}" for i in range(100))
+    assert cut_lines(text, max_bytes=10000) == text
+    cut = cut_lines(text, max_bytes=120, hint="narrow it down")
+    assert len(cut.encode("utf-8")) <= 120
+    lines = cut.split("\n")
+    kept = lines[:-1]
+    assert kept == [f"entry-{i}" for i in range(len(kept))]
+    assert lines[-1] == f"… {100 - len(kept)} more entries truncated; narrow it down"
+
+
+def test_list_directory_tree_text_formats_respect_the_budget(tmp_path):
+    for d in range(20):
+        (tmp_path / f"dir{d:02}").mkdir()
+        for f in range(20):
+            (tmp_path / f"dir{d:02}" / f"file{f:02}.txt").write_text("x")
+    tools = FileTools(base_dir=tmp_path, max_response_bytes=2048)
+    for output_format in ("text", "paths"):
+        full = FileTools(base_dir=tmp_path, max_response_bytes=None).list_directory_tree(output_format=output_format)
+        cut = tools.list_directory_tree(output_format=output_format)
+        assert len(cut.encode("utf-8")) <= 2048 < len(full.encode("utf-8"))
+        *kept, note = cut.split("\n")
+        assert full.split("\n")[:len(kept)] == kept
+        assert note.startswith(f"… {len(full.splitlines()) - len(kept)} more entries truncated")
@@ -0,0 +1,81 @@
+import json
+from types import SimpleNamespace
+
+from agno.storage.session.agent import AgentSession
+
+from storage import CompactingSqliteStorage
+from tools.history import SessionHistoryTools
+
+
+def _run(i):
+    return {
+        "run_id": f"run-{i}",
+        "content": f"answer {i}",
+        "messages": [{"role": "user", "content": f"question {i}"}, {"role": "assistant", "content": f"answer {i}"}],
+    }
+
+
+def _save(storage, runs, session_id="s1"):
+    storage.upsert(
+        AgentSession(
+            session_id=session_id,
+            user_id="user",
+            agent_id="agent",
+            memory={"runs": runs},
+            session_data={},
+            extra_data={},
+            agent_data={},
+        )
+    )
+
+
+def _storage(tmp_path, **kwargs):
+    storage = CompactingSqliteStorage(table_name="sessions", db_file=str(tmp_path / "db.sqlite"), **kwargs)
+    storage.create()
+    return storage
+
+
+def test_old_runs_move_to_the_archive_once(tmp_path):
+    storage = _storage(tmp_path, keep_runs=3, summary_runs=4)
+    runs = []
+    for i in range(10):
+        # Like the agent, every save sends the full in-memory run list
+        runs.append(_run(i))
+        _save(storage, list(runs))
+
+    assert [run["run_id"] for run in storage.read("s1").memory["runs"]] == ["run-7", "run-8", "run-9"]
+    assert [run["run_id"] for run in storage.read_archived_runs("s1")] == [f"run-{i}" for i in range(7)]
+    assert [run["run_id"] for run in storage.read_archived_runs("s1", offset=5, limit=5)] == ["run-5", "run-6"]
+    assert [run["run_id"] for run in storage.iter_archived_runs("s1", newest_first=True)][:2] == ["run-6", "run-5"]
+
+    summary = storage.get_history_summary("s1")
+    assert summary.startswith("7 earlier runs of this session are archived; the latest 4 are summarized")
+    assert summary.splitlines()[-1] == "- user: question 6 | assistant: answer 6"
+
+
+def test_delete_session_drops_its_archive(tmp_path):
+    storage = _storage(tmp_path, keep_runs=1)
+    _save(storage, [_run(i) for i in range(3)])
+    _save(storage, [_run(i) for i in range(2)], session_id="s2")
+    storage.delete_session("s1")
+    assert storage.read_archived_runs("s1") == []
+    assert storage.get_history_summary("s1") is None
+    assert len(storage.read_archived_runs("s2")) == 1
+
+
+def test_history_tools_page_and_search(tmp_path):
+    storage = _storage(tmp_path, keep_runs=2)
+    _save(storage, [_run(i) for i in range(12)])
+    tools = SessionHistoryTools(storage)
+    agent = SimpleNamespace(session_id="s1")
+
+    page = json.loads(tools.read_archived_runs(agent, offset=0, limit=4))
+    assert [run["user"] for run in page["runs"]] == [f"question {i}" for i in range(4)]
+    assert page["next_offset"] == 4
+    last = json.loads(tools.read_archived_runs(agent, offset=8, limit=4))
+    assert [run["run_id"] for run in last["runs"]] == ["run-8", "run-9"]
+    assert last["next_offset"] is None
+
+    found = json.loads(tools.search_archived_runs(agent, "ANSWER 1", max_results=5))
+    assert [run["run_id"] for run in found["runs"]] == ["run-1"]
+    assert tools.search_archived_runs(agent, " ") == "Error: Query cannot be empty"
@@ -0,0 +1,33 @@
+import json
+
+import pytest
+
+from tools.file import FileTools
+
+
+def _tree(tmp_path):
+    for d in range(3):
+        (tmp_path / f"dir{d}").mkdir()
+        for f in range(3):
+            (tmp_path / f"dir{d}" / f"file{f}.txt").write_text("x")
+    return FileTools(base_dir=tmp_path)
+
+
+def test_walk_directory_pages_through_every_entry(tmp_path):
+    tools = _tree(tmp_path)
+    seen, cursor = [], None
+    while True:
+        page = json.loads(tools.walk_directory(max_items=5, cursor=cursor))
+        seen += [item["path"] for item in page["items"]]
+        cursor = page["next_cursor"]
+        if not cursor:
+            break
+    assert len(seen) == len(set(seen)) == 12
+
+
+def test_walk_directory_accepts_deprecated_max_files(tmp_path):
+    tools = _tree(tmp_path)
+    with pytest.warns(DeprecationWarning, match="max_items"):
+        page = json.loads(tools.walk_directory(max_files=4))
+    assert page == json.loads(tools.walk_directory(max_items=4))
+    assert page["total_items"] == 4 and page["truncated"]
@@ -0,0 +1,63 @@
+import os
+import stat
+
+from tools.write import WriteEngine
+
+
+def _mode(path):
+    return stat.S_IMODE(os.stat(path).st_mode)
+
+
+def test_write_through_symlink_replaces_the_target(tmp_path):
+    (tmp_path / "real").mkdir()
+    target = tmp_path / "real" / "config.txt"
+    target.write_text("old")
+    os.chmod(target, 0o640)
+    link = tmp_path / "config.txt"
+    os.symlink(os.path.join("real", "config.txt"), link)
+
+    engine = WriteEngine()
+    assert engine.write(str(link), "new") == 3
+    assert os.path.islink(link)
+    assert os.readlink(link) == os.path.join("real", "config.txt")
+    assert target.read_text() == "new"
+    assert _mode(target) == 0o640
+    # The temp file was created next to the target, and nothing is left behind
+    assert sorted(os.listdir(tmp_path / "real")) == ["config.txt"]
+
+
+def test_write_chunk_through_symlink(tmp_path):
+    target = tmp_path / "data.bin"
+    target.write_bytes(b"")
+    os.chmod(target, 0o600)
+    link = tmp_path / "link.bin"
+    os.symlink(target, link)
+
+    engine = WriteEngine()
+    engine.write_chunk(str(link), b"abc")
+    assert target.read_bytes() == b""
+    assert engine.write_chunk(str(link), b"def", final=True) == 6
+    assert os.path.islink(link)
+    assert target.read_bytes() == b"abcdef"
+    assert _mode(target) == 0o600
+
+
+def test_new_file_gets_umask_mode_and_existing_mode_is_kept(tmp_path):
+    engine = WriteEngine()
+    path = tmp_path / "new.txt"
+    engine.write(str(path), "x")
+    umask = os.umask(0)
+    os.umask(umask)
+    assert _mode(path) == 0o666 & ~umask
+    os.chmod(path, 0o604)
+    engine.write(str(path), "y")
+    assert _mode(path) == 0o604
+
+
+def test_aborted_stream_leaves_no_temp_file(tmp_path):
+    link = tmp_path / "link.txt"
+    os.symlink(tmp_path / "target.txt", link)
+    engine = WriteEngine()
+    engine.write_chunk(str(link), "partial")
+    assert engine.abort_stream(str(link))
+    assert os.listdir(tmp_path) == ["link.txt"]